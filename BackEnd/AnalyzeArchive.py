@@ -0,0 +1,228 @@
+import os, json, gzip, zlib
+import setting, FileWriter
+from datetime import datetime, timedelta
+
+# [일별 분석 결과 보관소]
+# Today_Analyze 는 최신 하루치만 유지하므로 날짜별 분석 결과를 컬럼 단위(필드 -> 값 배열)로 gzip 압축하여 따로 보관
+# 파일명은 분석 파일과 같은 YYYY-M-D 규칙 (예: 2026-3-10.json.gz)
+# 파일 구조 : gzip 멤버를 이어붙인 형태 (gzip -d 로 풀면 JSON 이 차례로 나옴)
+#   첫 멤버 = 목차 {"date", "count", "offsets": {필드: [목차 뒤 위치, 길이]}, "absent": {필드: [그 필드가 없던 행 번호]}}
+#   이후 멤버 = 컬럼마다 하나씩 값 배열 JSON -> 필요한 컬럼만 찾아가서 풀 수 있음
+#   이전 형식(한 멤버에 {"date", "count", "columns"} 전체)도 그대로 읽음
+# 보관 기간(ANALYZE_HISTORY_RETENTION_DAYS)이 지난 파일은 새로 보관할 때 정리
+
+ARCHIVE_SUFFIX = '.json.gz'
+INDEX_READ_SIZE = 4096
+TRAJECTORY_FIELDS = ['rank', 'totalScore', 'trendScore', 'marcapScore', 'stockBuyLevel']
+
+def normalize_date(date_text):
+  """'2026-03-10', '2026-3-10', '2026.3.10' 를 보관 파일명 규칙 '2026-3-10' 으로 변환"""
+  parts = str(date_text).strip().replace('.', '-').split('-')
+  if len(parts) != 3 or not all(part.isdigit() for part in parts):
+    raise ValueError(f"날짜 형식이 올바르지 않습니다: {date_text} (예: 2026-3-10)")
+  date = datetime(int(parts[0]), int(parts[1]), int(parts[2]))
+  return f"{date.year}-{date.month}-{date.day}"
+
+def _date_key(date_text):
+  return tuple(map(int, date_text.split('-')))
+
+def _archive_path(analyze_date):
+  return setting.JSON_ANALYZE_HISTORY_PATH + '/' + analyze_date + ARCHIVE_SUFFIX
+
+def ListArchivedDates():
+  """보관된 날짜 목록 (오래된 날짜부터)"""
+  if not os.path.exists(setting.JSON_ANALYZE_HISTORY_PATH):
+    return []
+  dates = [f[:-len(ARCHIVE_SUFFIX)] for f in os.listdir(setting.JSON_ANALYZE_HISTORY_PATH) if f.endswith(ARCHIVE_SUFFIX)]
+  return sorted(dates, key=_date_key)
+
+def _compress_json(value):
+  return gzip.compress(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), compresslevel=9)
+
+def ArchiveAnalyze(analyze_date, data):
+  """하루치 분석 결과(행 목록)를 컬럼별로 압축 보관하고 보관 기간이 지난 파일 정리"""
+  try:
+    analyze_date = normalize_date(analyze_date)
+
+    # 첫 행의 필드 순서를 기준으로, 이후 행에만 있는 필드는 뒤에 추가
+    field_names = {}
+    for row in data:
+      for field in row:
+        field_names.setdefault(field, None)
+
+    offsets = {}
+    absent = {}
+    members = []
+    position = 0
+    for field in field_names:
+      missing_rows = [i for i, row in enumerate(data) if field not in row]
+      if missing_rows:
+        absent[field] = missing_rows
+      member = _compress_json([row.get(field) for row in data])
+      offsets[field] = [position, len(member)]
+      members.append(member)
+      position += len(member)
+
+    index = _compress_json({"date": analyze_date, "count": len(data), "offsets": offsets, "absent": absent})
+    FileWriter.atomic_write(_archive_path(analyze_date), index + b''.join(members), binary=True)
+
+    PruneArchive()
+    return True
+  except Exception as e:
+    print(f"ArchiveAnalyze 오류: {e}")
+    return False
+
+def PruneArchive(today=None):
+  """보관 기간이 지난 날짜 파일 삭제 (0 이면 무기한 보관)"""
+  retention_days = setting.ANALYZE_HISTORY_RETENTION_DAYS
+  if not retention_days or retention_days <= 0:
+    return
+
+  if today is None:
+    today = datetime.today()
+  oldest = (today - timedelta(days=retention_days)).date()
+
+  for analyze_date in ListArchivedDates():
+    if datetime(*_date_key(analyze_date)).date() < oldest:
+      os.remove(_archive_path(analyze_date))
+
+def _read_index(f):
+  """첫 gzip 멤버(목차)만 풀어서 (목차, 목차 멤버 크기)"""
+  decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+  body = b''
+  read_size = 0
+  while not decompressor.eof:
+    chunk = f.read(INDEX_READ_SIZE)
+    if not chunk:
+      raise ValueError(f"보관 파일이 손상되었습니다: {f.name}")
+    read_size += len(chunk)
+    body += decompressor.decompress(chunk)
+  return json.loads(body), read_size - len(decompressor.unused_data)
+
+def ReadArchivedColumns(analyze_date, fields=None):
+  """보관 파일을 컬럼 형식으로 읽음 (fields 를 지정하면 해당 컬럼만 풀어서 읽음), 없으면 None
+  absent 는 필드별로 원래 행에 그 필드가 없던 행 번호 (이전 형식은 구분 정보가 없어 빈 dict)"""
+  archive_path = _archive_path(normalize_date(analyze_date))
+  if not os.path.exists(archive_path):
+    return None
+
+  with open(archive_path, 'rb') as f:
+    index, index_size = _read_index(f)
+
+    # 이전 형식 : 목차 멤버에 전체 컬럼이 들어 있음
+    if "columns" in index:
+      columns = index["columns"]
+      if fields is not None:
+        columns = {field: columns[field] for field in fields if field in columns}
+      return {"date": index["date"], "count": index["count"], "columns": columns, "absent": {}}
+
+    offsets = index["offsets"]
+    wanted = list(offsets) if fields is None else [field for field in fields if field in offsets]
+    columns = {}
+    for field in wanted:
+      position, length = offsets[field]
+      f.seek(index_size + position)
+      columns[field] = json.loads(gzip.decompress(f.read(length)))
+
+  absent = {field: index["absent"][field] for field in wanted if field in index["absent"]}
+  return {"date": index["date"], "count": index["count"], "columns": columns, "absent": absent}
+
+def ReadArchivedAnalyze(analyze_date):
+  """보관된 하루치 분석 결과를 원래 행 목록 형식으로 반환 (값이 None 인 필드도 그대로), 없으면 None"""
+  archived = ReadArchivedColumns(analyze_date)
+  if archived is None:
+    return None
+
+  rows = [{} for _ in range(archived["count"])]
+  for field, values in archived["columns"].items():
+    missing_rows = set(archived["absent"].get(field, ()))
+    for i, value in enumerate(values):
+      if i not in missing_rows:
+        rows[i][field] = value
+  return rows
+
+def DiffArchivedAnalyze(date_from, date_to, top_n=0):
+  """두 날짜의 분석 결과 비교 (신규 진입, 이탈, 순위 변동, 매수 등급 변동)
+  top_n 을 지정하면 각 날짜의 상위 top_n 위 안에서 비교"""
+  fields = ['code', 'name', 'rank', 'stockBuyLevel', 'totalScore']
+  before = ReadArchivedColumns(date_from, fields)
+  after = ReadArchivedColumns(date_to, fields)
+  if before is None or after is None:
+    missing = date_from if before is None else date_to
+    raise ValueError(f"보관된 분석 결과가 없습니다: {missing}")
+
+  def to_rows(archived):
+    columns = archived["columns"]
+    rows = {}
+    for i in range(archived["count"]):
+      rank = columns["rank"][i]
+      if top_n and rank is not None and rank > top_n:
+        continue
+      rows[columns["code"][i]] = {field: columns[field][i] for field in fields if field in columns}
+    return rows
+
+  before_rows = to_rows(before)
+  after_rows = to_rows(after)
+
+  new_entrants = [row for code, row in after_rows.items() if code not in before_rows]
+  dropped = [row for code, row in before_rows.items() if code not in after_rows]
+
+  rank_moves = []
+  level_changes = []
+  for code, row in after_rows.items():
+    previous = before_rows.get(code)
+    if previous is None:
+      continue
+    if previous.get('rank') != row.get('rank'):
+      rank_moves.append({
+        'code': code,
+        'name': row.get('name'),
+        'fromRank': previous.get('rank'),
+        'toRank': row.get('rank'),
+        'change': (previous.get('rank') or 0) - (row.get('rank') or 0)
+      })
+    if previous.get('stockBuyLevel') != row.get('stockBuyLevel'):
+      level_changes.append({
+        'code': code,
+        'name': row.get('name'),
+        'fromLevel': previous.get('stockBuyLevel'),
+        'toLevel': row.get('stockBuyLevel')
+      })
+
+  # 순위가 많이 오른 종목부터
+  rank_moves.sort(key=lambda x: x['change'], reverse=True)
+
+  return {
+    'dateFrom': before["date"],
+    'dateTo': after["date"],
+    'newEntrants': new_entrants,
+    'dropped': dropped,
+    'rankMoves': rank_moves,
+    'levelChanges': level_changes
+  }
+
+def GetScoreTrajectory(code, start_date=None, end_date=None):
+  """종목의 날짜별 순위/점수 추이 - 하루치씩 읽고 해당 종목 값만 남기므로 보관 일수와 무관하게 메모리 일정"""
+  start_key = _date_key(normalize_date(start_date)) if start_date else None
+  end_key = _date_key(normalize_date(end_date)) if end_date else None
+
+  trajectory = []
+  for analyze_date in ListArchivedDates():
+    date_key = _date_key(analyze_date)
+    if (start_key and date_key < start_key) or (end_key and date_key > end_key):
+      continue
+
+    archived = ReadArchivedColumns(analyze_date, ['code', 'name'] + TRAJECTORY_FIELDS)
+    columns = archived["columns"]
+    try:
+      i = columns["code"].index(code)
+    except ValueError:
+      continue
+
+    point = {'date': analyze_date, 'name': columns["name"][i]}
+    for field in TRAJECTORY_FIELDS:
+      if field in columns:
+        point[field] = columns[field][i]
+    trajectory.append(point)
+
+  return trajectory
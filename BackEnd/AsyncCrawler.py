@@ -0,0 +1,184 @@
+import asyncio
+from datetime import datetime
+from urllib.parse import urlsplit
+import requests
+import setting, HttpClient, WebCrawling
+
+try:
+    import httpx
+except ImportError:  # httpx 가 없으면 HttpClient(requests) 세션을 스레드에서 실행
+    httpx = None
+
+# [비동기 크롤러]
+# 외부 데이터(FnGuide 주식 일정, 제로인 경제 캘린더, 공휴일 API)를 asyncio 로 수집해 이벤트 루프를 막지 않음
+#   - HTTP      : 호스트별 httpx.AsyncClient 재사용 (연결 풀 HTTP_POOL_MAXSIZE, 타임아웃은 HttpClient 와 같은 호스트별 값)
+#   - 요청/파싱 : WebCrawling 의 *_request / parse_* / *_error 함수를 그대로 사용 (동기 크롤러와 결과 형식 동일)
+#   - 동시 요청 : 출처별 ASYNC_CRAWL_CONCURRENCY (세마포어), 호스트별 요청 속도는 HttpClient 토큰 버킷을 함께 사용
+#   - 마감/취소 : run_for_request - 전체 마감 시간이 지나거나 클라이언트 연결이 끊기면 진행 중인 수집을 모두 취소
+#   - 중복 수집 : single_flight - 같은 작업을 동시에 요청하면 한 번만 수집하고, 기다리는 요청이 모두 사라지면 취소
+# httpx 오류는 기존 오류 처리와 같도록 requests.RequestException 으로 바꿔서 전달
+# HTTP 녹화/재생 모드(HTTP_FIXTURE_MODE)에서는 httpx 대신 HttpClient 세션을 사용 (HttpFixture 어댑터를 거치도록)
+
+class ClientDisconnected(Exception):
+    """수집 중 클라이언트 연결이 끊김"""
+
+_clients = {}      # host -> (loop, httpx.AsyncClient)
+_semaphores = {}   # (loop, source) -> asyncio.Semaphore
+_in_flight = {}    # key -> {"task", "waiters"}
+
+def _semaphore(source):
+    loop = asyncio.get_running_loop()
+    key = (id(loop), source)
+    semaphore = _semaphores.get(key)
+    if semaphore is None:
+        semaphore = _semaphores[key] = asyncio.Semaphore(setting.ASYNC_CRAWL_CONCURRENCY.get(source, 4))
+    return semaphore
+
+def _client(url):
+    """호스트별 AsyncClient (이벤트 루프가 바뀌면 새로 생성)"""
+    loop = asyncio.get_running_loop()
+    host = urlsplit(url).netloc.lower()
+    entry = _clients.get(host)
+    if entry is None or entry[0] is not loop:
+        connect_timeout, read_timeout = HttpClient.get_timeout(url)
+        transport = httpx.AsyncHTTPTransport(
+            retries=setting.HTTP_RETRY_TOTAL,  # 연결 실패만 재시도
+            limits=httpx.Limits(max_connections=setting.HTTP_POOL_MAXSIZE, max_keepalive_connections=setting.HTTP_POOL_MAXSIZE)
+        )
+        client = httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(read_timeout, connect=connect_timeout), follow_redirects=True)
+        entry = _clients[host] = (loop, client)
+    return entry[1]
+
+def _blocking_get(url, params, headers):
+    response = HttpClient.get_session(url).get(url, params=params, headers=headers, timeout=HttpClient.get_timeout(url))
+    response.raise_for_status()
+    return response
+
+async def fetch(source, url, params=None, headers=None):
+    """출처별 동시 요청 수와 호스트 요청 속도를 지키며 GET (HTTP 오류 상태면 requests.RequestException)"""
+    async with _semaphore(source):
+        limiter = HttpClient.get_rate_limiter(url)
+        if limiter is not None:
+            await asyncio.sleep(limiter.reserve())
+
+        if httpx is None or setting.HTTP_FIXTURE_MODE:
+            return await asyncio.to_thread(_blocking_get, url, params, headers)
+
+        try:
+            response = await _client(url).get(url, params=params, headers=headers)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            raise requests.RequestException(str(e)) from e
+
+async def close_all():
+    """모든 AsyncClient 연결 정리 (서버 종료 시)"""
+    clients = [client for _, client in _clients.values()]
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+async def _wait_disconnect(request):
+    while not await request.is_disconnected():
+        await asyncio.sleep(setting.ASYNC_CRAWL_DISCONNECT_CHECK_SECONDS)
+
+async def run_for_request(request, awaitable, deadline):
+    """
+    deadline 초 안에 awaitable 실행
+    클라이언트 연결이 먼저 끊기면 취소 후 ClientDisconnected, 시간이 지나면 취소 후 asyncio.TimeoutError
+    """
+    task = asyncio.ensure_future(awaitable)
+    watcher = asyncio.ensure_future(_wait_disconnect(request))
+    try:
+        done, _ = await asyncio.wait({task, watcher}, timeout=deadline, return_when=asyncio.FIRST_COMPLETED)
+        if task in done:
+            return task.result()
+        if watcher in done:
+            raise ClientDisconnected()
+        raise asyncio.TimeoutError(f"{deadline}초 안에 수집을 마치지 못했습니다.")
+    finally:
+        for pending in (task, watcher):
+            if not pending.done():
+                pending.cancel()
+
+async def single_flight(key, factory):
+    """같은 key 작업이 진행 중이면 그 결과를 함께 기다림 (기다리는 요청이 모두 취소되면 작업도 취소)"""
+    loop = asyncio.get_running_loop()
+    entry = _in_flight.get(key)
+    if entry is None or entry["task"].get_loop() is not loop:
+        task = asyncio.ensure_future(factory())
+        entry = _in_flight[key] = {"task": task, "waiters": 0}
+        task.add_done_callback(lambda done, key=key: _in_flight.pop(key) if key in _in_flight and _in_flight[key]["task"] is done else None)
+
+    entry["waiters"] += 1
+    try:
+        return await asyncio.shield(entry["task"])
+    finally:
+        entry["waiters"] -= 1
+        if entry["waiters"] == 0 and not entry["task"].done():
+            entry["task"].cancel()
+
+# ===== FnGuide 주식 일정 =====
+
+async def crawl_fnguide_calendar_month(year, month):
+    try:
+        request_info = WebCrawling.fnguide_month_request(year, month)
+        response = await fetch('fnguide', request_info["url"], request_info["params"], request_info["headers"])
+        return WebCrawling.parse_fnguide_month(year, month, request_info["url"], response)
+    except Exception as e:
+        return WebCrawling.fnguide_month_error(year, month, e)
+
+async def get_fnguide_stock_calendar(year=None, months=None):
+    """WebCrawling.getFnGuideStockCalendar 의 비동기 버전 (월별 요청을 동시에)"""
+    if year is None:
+        year = datetime.now().year
+    if months is None:
+        months = list(range(1, 13))
+
+    month_results = await asyncio.gather(*(crawl_fnguide_calendar_month(year, month) for month in months))
+    return WebCrawling.summarizeFnGuideCalendar(year, months, list(month_results))
+
+# ===== 제로인 경제 캘린더 =====
+
+async def crawl_zeroin_economic_calendar(start_date, end_date, countries=None, importance_levels=None, columnar=False):
+    """WebCrawling.crawl_zeroin_economic_calendar 의 비동기 버전"""
+    invalid = WebCrawling.validate_zeroin_dates(start_date, end_date)
+    if invalid is not None:
+        return invalid
+
+    try:
+        request_info = WebCrawling.zeroin_request(start_date, end_date, countries, importance_levels)
+        response = await fetch('zeroin', request_info["url"], request_info["params"], request_info["headers"])
+        return WebCrawling.parse_zeroin_response(start_date, end_date, request_info["countries"], request_info["importance_levels"], request_info["url"], response.json(), columnar)
+    except Exception as e:
+        return WebCrawling.zeroin_error(e)
+
+# ===== 한국 공휴일 =====
+
+async def crawl_monthly_holidays(year, month):
+    try:
+        request_info = WebCrawling.holiday_month_request(year, month)
+        response = await fetch('holiday', request_info["url"], request_info["params"], request_info["headers"])
+        return WebCrawling.parse_holiday_month(year, month, request_info["url"], response)
+    except Exception as e:
+        return WebCrawling.holiday_month_error(year, month, e)
+
+async def get_korean_holidays(year=None):
+    """WebCrawling.getKoreanHolidays 의 비동기 버전 (12개월 요청을 동시에)"""
+    if year is None:
+        year = datetime.now().year
+
+    months = list(range(1, 13))
+    month_results = await asyncio.gather(*(crawl_monthly_holidays(year, month) for month in months))
+
+    all_holidays = []
+    successful_months = []
+    failed_months = []
+    for month, month_result in zip(months, month_results):
+        if month_result.get('success', False):
+            all_holidays.extend(month_result.get('holidays', []))
+            successful_months.append(month)
+        else:
+            failed_months.append(month)
+
+    return WebCrawling.summarizeKoreanHolidays(year, all_holidays, successful_months, failed_months)
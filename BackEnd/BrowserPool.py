@@ -0,0 +1,162 @@
+import threading, time, atexit
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+import setting
+
+# [헤드리스 브라우저 풀]
+# Selenium 크롤링(실시간 검색어 동적 크롤링)마다 Chrome 을 새로 띄우고 닫지 않도록 띄워둔 브라우저를 재사용
+#   - 동시에 떠 있는 브라우저는 최대 BROWSER_POOL_SIZE 개, 모두 사용 중이면 BROWSER_ACQUIRE_TIMEOUT_SECONDS 까지 대기
+#   - 꺼낼 때 상태 확인(스크립트 실행)에 실패하면 닫고 새로 띄움
+#   - BROWSER_MAX_USES 회 사용했거나 BROWSER_MAX_AGE_SECONDS 가 지난 브라우저는 닫고 교체 (메모리 누수 방지)
+#   - 사용 중 예외가 난 브라우저는 상태를 알 수 없으므로 돌려놓지 않고 닫음
+#   - warm_up 으로 미리 띄워둘 수 있음 (BROWSER_POOL_WARM_ON_START 이면 서버 시작 시 백그라운드에서)
+# 사용 : with BrowserPool.browser() as driver: driver.get(url) ...
+
+class _Browser:
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created = time.monotonic()
+
+_cond = threading.Condition()
+_idle = []
+_total = 0      # 떠 있는 브라우저 수 (대기 + 사용 중 + 띄우는 중)
+_closed = False
+
+def create_driver():
+    """
+    Chrome 웹드라이버 설정 및 초기화 (실패하면 None)
+    """
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # 브라우저 창을 띄우지 않음
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+
+    try:
+        driver = webdriver.Chrome(options=chrome_options)
+        return driver
+    except Exception as e:
+        print(f"웹드라이버 설정 중 오류 발생: {e}")
+        return None
+
+def _quit(browser):
+    try:
+        browser.driver.quit()
+    except Exception as e:
+        print(f"브라우저 종료 중 오류: {e}")
+
+def _retire(browser):
+    """브라우저를 닫고 자리 반납"""
+    global _total
+    _quit(browser)
+    with _cond:
+        _total -= 1
+        _cond.notify()
+
+def _expired(browser):
+    return browser.uses >= setting.BROWSER_MAX_USES or time.monotonic() - browser.created >= setting.BROWSER_MAX_AGE_SECONDS
+
+def _healthy(browser):
+    try:
+        return browser.driver.execute_script('return 1') == 1
+    except Exception:
+        return False
+
+def _checkout(deadline):
+    """대기 중인 브라우저를 꺼내거나 새로 띄울 자리를 예약 (자리만 예약했으면 None)"""
+    global _total
+    with _cond:
+        while True:
+            if _closed:
+                raise RuntimeError("브라우저 풀이 종료되었습니다.")
+            if _idle:
+                return _idle.pop()
+            if _total < setting.BROWSER_POOL_SIZE:
+                _total += 1
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"사용 가능한 브라우저가 없습니다 ({setting.BROWSER_ACQUIRE_TIMEOUT_SECONDS}초 대기)")
+            _cond.wait(remaining)
+
+def _launch():
+    """예약한 자리에 브라우저를 띄움 (실패하면 자리 반납 후 예외)"""
+    global _total
+    driver = create_driver()
+    if driver is None:
+        with _cond:
+            _total -= 1
+            _cond.notify()
+        raise RuntimeError("웹드라이버 초기화 실패")
+    return _Browser(driver)
+
+def acquire():
+    """사용할 브라우저 하나 (사용 후 release 로 돌려놓아야 함)"""
+    deadline = time.monotonic() + setting.BROWSER_ACQUIRE_TIMEOUT_SECONDS
+    while True:
+        browser = _checkout(deadline)
+        if browser is None:
+            browser = _launch()
+        elif _expired(browser) or not _healthy(browser):
+            _retire(browser)
+            continue
+        browser.uses += 1
+        return browser
+
+def release(browser, reusable=True):
+    """브라우저 반납 (재사용할 수 없으면 닫음)"""
+    if not reusable or _expired(browser):
+        _retire(browser)
+        return
+    with _cond:
+        if not _closed:
+            _idle.append(browser)
+            _cond.notify()
+            return
+    _retire(browser)
+
+@contextmanager
+def browser():
+    """with 블록 동안 브라우저 하나를 빌려줌 (예외가 나면 그 브라우저는 닫음)"""
+    pooled = acquire()
+    reusable = False
+    try:
+        yield pooled.driver
+        reusable = True
+    finally:
+        release(pooled, reusable)
+
+def warm_up(count=None):
+    """브라우저를 count 개(기본 BROWSER_POOL_SIZE)까지 미리 띄워둠"""
+    global _total
+    count = setting.BROWSER_POOL_SIZE if count is None else min(count, setting.BROWSER_POOL_SIZE)
+    while True:
+        with _cond:
+            if _closed or _total >= count:
+                return
+            _total += 1
+        try:
+            launched = _launch()
+        except RuntimeError as e:
+            print(f"브라우저 미리 띄우기 실패: {e}")
+            return
+        release(launched)
+
+def start_warm_up():
+    threading.Thread(target=warm_up, name='browser-pool-warm-up', daemon=True).start()
+
+def close_all():
+    """대기 중인 브라우저를 모두 닫음 (서버 종료 시, 사용 중인 브라우저는 반납될 때 닫힘)"""
+    global _closed
+    with _cond:
+        _closed = True
+        idle = list(_idle)
+        _idle.clear()
+    for pooled in idle:
+        _retire(pooled)
+
+atexit.register(close_all)
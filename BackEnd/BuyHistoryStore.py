@@ -0,0 +1,165 @@
+import os, json, threading
+import setting, FileWriter
+
+# [매수 이력 저장소]
+# history.txt(기존 형식 그대로) 스냅샷 + 변경 작업 저널(history.txt.journal, JSON Lines)
+#   저널 첫 줄 : {"baseVersion": 스냅샷 버전}
+#   이후 각 줄 : {"version": 버전, "ops": [작업, ...]}
+# 작업은 종목 단위 upsert/delete 만 허용 (같은 작업을 다시 적용해도 결과가 같음)
+#   {"op": "upsert", "section": "virtualInvestItemObject", "code": "240810", "value": {...}}
+#   {"op": "delete", "section": "virtualInvestItemObject", "code": "240810"}
+# 저장 요청은 baseVersion 이 현재 버전과 같을 때만 반영 (다른 탭에서 먼저 저장했으면 충돌)
+# 문서 전체 저장도 {"version", "replace": 문서} 한 줄로 저널에 추가한 뒤 스냅샷을 다시 씀
+# 저널이 BUY_HISTORY_COMPACT_OPS 줄 이상 쌓이면 스냅샷을 다시 쓰고 저널을 비움 (몰리는 요청은 한 번으로 합침)
+# 스냅샷 교체 직후 중단되어 이전 저널이 남아도 순서대로 다시 적용하면 결과가 같으므로 안전
+# 쓰기는 모두 history.txt 파일 잠금 안에서 하고, 다른 워커 프로세스가 바꾼 경우 파일 상태를 보고 다시 읽음
+
+PATCH_OPS = ('upsert', 'delete')
+
+class HistoryVersionConflict(Exception):
+  """baseVersion 이 현재 버전과 다를 때"""
+  def __init__(self, current_version):
+    super().__init__(f"다른 곳에서 먼저 저장되었습니다 (현재 버전: {current_version})")
+    self.current_version = current_version
+
+_lock = threading.RLock()
+_document = None
+_version = 0
+_journal_lines = 0
+_disk_signature = None
+
+def _journal_path():
+  return setting.JSON_HISTORY_PATH + '.journal'
+
+def apply_ops(document, ops):
+  for op in ops:
+    section = document.setdefault(op["section"], {})
+    if op["op"] == 'upsert':
+      section[op["code"]] = op["value"]
+    else:
+      section.pop(op["code"], None)
+
+def validate_ops(ops):
+  """작업 목록 형식 확인 (잘못되면 ValueError)"""
+  if not isinstance(ops, list) or not ops:
+    raise ValueError("ops 는 비어있지 않은 목록이어야 합니다.")
+  for op in ops:
+    if not isinstance(op, dict) or op.get("op") not in PATCH_OPS:
+      raise ValueError(f"지원하지 않는 작업입니다: {op} (upsert, delete 만 가능)")
+    if not isinstance(op.get("section"), str) or not op["section"] or not isinstance(op.get("code"), str) or not op["code"]:
+      raise ValueError(f"section, code 는 필수입니다: {op}")
+    if op["op"] == 'upsert' and not isinstance(op.get("value"), dict):
+      raise ValueError(f"upsert 작업에는 value(객체)가 필요합니다: {op}")
+
+def _read_signature():
+  """스냅샷/저널 파일 상태 - 다른 프로세스가 썼는지 확인용"""
+  signature = []
+  for path in (setting.JSON_HISTORY_PATH, _journal_path()):
+    try:
+      stat = os.stat(path)
+      signature.append((stat.st_mtime_ns, stat.st_size))
+    except FileNotFoundError:
+      signature.append(None)
+  return tuple(signature)
+
+def _load_from_disk():
+  """스냅샷 + 저널을 읽어 메모리 문서 구성"""
+  global _document, _version, _journal_lines, _disk_signature
+
+  document = {}
+  if os.path.exists(setting.JSON_HISTORY_PATH):
+    try:
+      with open(setting.JSON_HISTORY_PATH, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    except Exception as e:
+      print(f"매수 이력 스냅샷 읽기 오류: {e}")
+
+  version = 0
+  journal_lines = 0
+  if os.path.exists(_journal_path()):
+    with open(_journal_path(), "r", encoding="utf-8") as f:
+      for line in f:
+        try:
+          record = json.loads(line)
+        except json.JSONDecodeError:
+          break  # 기록 도중 끊긴 마지막 줄
+        if "baseVersion" in record:
+          version = record["baseVersion"]
+          continue
+        if "replace" in record:
+          document = record["replace"]
+        else:
+          apply_ops(document, record["ops"])
+        version = record["version"]
+        journal_lines += 1
+
+  _document = document
+  _version = version
+  _journal_lines = journal_lines
+  _disk_signature = _read_signature()
+
+def _sync():
+  """처음이거나 다른 프로세스가 파일을 바꿨으면 다시 읽음 (파일 잠금 안에서 호출)"""
+  if _document is None or _read_signature() != _disk_signature:
+    _load_from_disk()
+
+def _compact():
+  """스냅샷을 다시 쓰고 저널을 현재 버전 헤더만 남기고 비움"""
+  global _journal_lines, _disk_signature
+  with _lock:
+    _sync()
+    if _journal_lines == 0:
+      return
+    FileWriter.atomic_write(setting.JSON_HISTORY_PATH, json.dumps(_document, ensure_ascii=False, indent=2))
+    FileWriter.atomic_write(_journal_path(), json.dumps({"baseVersion": _version}) + '\n')
+    _journal_lines = 0
+    _disk_signature = _read_signature()
+
+def _append_record(record):
+  """저널에 한 줄 추가 (파일 잠금 안에서 호출)"""
+  global _version, _journal_lines, _disk_signature
+  if not os.path.exists(_journal_path()):
+    FileWriter.atomic_write(_journal_path(), json.dumps({"baseVersion": _version}) + '\n')
+  FileWriter.append_write(_journal_path(), json.dumps(record, ensure_ascii=False) + '\n')
+  _version = record["version"]
+  _journal_lines += 1
+  _disk_signature = _read_signature()
+
+def _check_version(base_version):
+  if base_version is not None and base_version != _version:
+    raise HistoryVersionConflict(_version)
+
+def ReadHistory():
+  """(문서, 버전)"""
+  with FileWriter.file_lock(setting.JSON_HISTORY_PATH), _lock:
+    _sync()
+    return json.loads(json.dumps(_document)), _version
+
+def ReplaceHistory(data, base_version=None):
+  """문서 전체 교체 (기존 /save_buy_history/), base_version 을 주면 충돌 확인 후 반영, 새 버전 반환"""
+  global _document
+  with FileWriter.file_lock(setting.JSON_HISTORY_PATH), _lock:
+    _sync()
+    _check_version(base_version)
+    document = json.loads(json.dumps(data))
+    _append_record({"version": _version + 1, "replace": document})
+    _document = document
+    version = _version
+
+  FileWriter.write_coalesced(setting.JSON_HISTORY_PATH, _compact)
+  return version
+
+def PatchHistory(ops, base_version):
+  """종목 단위 작업을 저널에 한 줄로 추가하고 반영, 새 버전 반환"""
+  validate_ops(ops)
+  with FileWriter.file_lock(setting.JSON_HISTORY_PATH), _lock:
+    _sync()
+    _check_version(base_version)
+    _append_record({"version": _version + 1, "ops": ops})
+    apply_ops(_document, ops)
+    version = _version
+    needs_compaction = _journal_lines >= setting.BUY_HISTORY_COMPACT_OPS
+
+  if needs_compaction:
+    FileWriter.write_coalesced(setting.JSON_HISTORY_PATH, _compact)
+  return version
@@ -0,0 +1,339 @@
+import io, time, statistics, random, json
+from datetime import datetime, timedelta
+from contextlib import redirect_stdout
+import setting, HttpFixture, HtmlBackend, WebCrawling, EconomicCalendarCache, HolidayCalendar
+
+# [크롤러 파싱 벤치마크]
+# HttpFixture 로 녹화해 둔 응답(네트워크 없이)으로 출처별 파싱/정리 시간을 측정 - 파서 최적화 전후 비교용
+#   1) record_fixtures(year) : 실제 사이트에서 Signal.bz 페이지, 제로인 연간 일정, FnGuide/공휴일 12개월 응답을 녹화
+#   2) benchmark_parsing(year) : 녹화한 응답을 메모리에 올려두고 파싱 함수만 repeat 번 실행해 최소/중앙값(ms) 출력
+#      Signal.bz 페이지는 설치된 HTML 파서(HtmlBackend)마다 따로 측정
+#   3) test_backend_consistency() : 스크립트/스타일이 섞인 페이지와 녹화한 Signal.bz 페이지로 파서별 결과가 같은지 확인
+# 녹화한 연도와 같은 year 로 실행해야 같은 요청(fixture)을 찾음, 녹화가 없는 출처는 건너뜀 (기본 year = setting.HTTP_FIXTURE_BENCHMARK_YEAR)
+# 저장소의 Data/Http_Fixtures 에는 HTTP_FIXTURE_BENCHMARK_YEAR(지난 연도) 표본 응답이 들어 있어 네트워크 없이 바로 실행 가능
+#   표본은 실제 녹화가 아니라 write_sample_fixtures(year) 로 만든 데이터 - 실제 응답과 같은 구조, 운영 페이지와 비슷한 크기
+#   제로인은 경제 캘린더 캐시와 같은 구간(EconomicCalendarCache.SegmentRanges)으로 녹화 - 재생 모드의 /get_economic_calendar/ 도 같은 fixture 사용
+#   Signal.bz 페이지는 스크립트/스타일 포함, 공휴일은 apis.data.go.kr 특일 정보 API 주소 기준 (API 키는 저장하지 않음)
+# 크롤러가 출력하는 진행 메시지는 측정 중에는 숨김
+
+def _quiet(function, *args):
+    with redirect_stdout(io.StringIO()):
+        return function(*args)
+
+def _measure(function, repeat):
+    """function 을 repeat 번 실행한 (최소 ms, 중앙값 ms, 마지막 결과)"""
+    timings = []
+    result = None
+    with redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = function()
+            timings.append((time.perf_counter() - started) * 1000)
+    return min(timings), statistics.median(timings), result
+
+def record_fixtures(year=None, folder=None):
+    """벤치마크에 쓰는 응답을 실제 사이트에서 녹화"""
+    if year is None:
+        year = setting.HTTP_FIXTURE_BENCHMARK_YEAR
+
+    with HttpFixture.fixture_mode('record', folder):
+        print(f"=== {year}년 응답 녹화 ({setting.HTTP_FIXTURE_FOLDER_PATH}) ===")
+        signal = _quiet(WebCrawling.crawl_with_beautifulsoup_only)
+        print(f"Signal.bz   : {'성공' if signal.get('success') else signal.get('error')}")
+        # 경제 캘린더 캐시가 요청하는 구간 그대로 녹화해야 재생 모드의 /get_economic_calendar/ 에서도 찾음
+        for start_date, end_date in EconomicCalendarCache.SegmentRanges(year):
+            zeroin = _quiet(WebCrawling.crawl_zeroin_economic_calendar, start_date, end_date)
+            print(f"제로인      : {start_date} ~ {end_date} {zeroin.get('total_count', 0)}개 이벤트" if zeroin.get('success') else f"제로인      : {start_date} ~ {end_date} {zeroin.get('error')}")
+        fnguide = _quiet(WebCrawling.getFnGuideStockCalendar, year)
+        print(f"FnGuide     : {fnguide.get('total_count', 0)}개 이벤트, 실패 {len(fnguide.get('failed_months', []))}개월")
+        holidays = _quiet(WebCrawling.getKoreanHolidays, year)
+        print(f"공휴일      : {holidays.get('total_count', 0)}일, 실패 {len(holidays.get('failed_months', []))}개월")
+
+class _SampleResponse:
+    """HttpFixture.save 에 넘기는 응답 (표본 fixture 생성용)"""
+    def __init__(self, text, content_type):
+        self.content = text.encode('utf-8')
+        self.status_code = 200
+        self.reason = 'OK'
+        self.headers = {'Content-Type': content_type}
+        self.encoding = 'utf-8'
+
+def _save_sample(request_info, text, content_type):
+    HttpFixture.save('GET', HttpFixture.prepared_url(request_info["url"], request_info.get("params")), _SampleResponse(text, content_type))
+
+SAMPLE_TERMS = ["금리 동결", "환율 급등", "반도체 수출", "코스피 반등", "배당 기준일", "원유 재고", "국채 금리", "소비자물가지수", "고용 지표", "전기차 판매",
+                "실적 발표", "공모주 청약", "부동산 대책", "유가 하락", "달러 인덱스", "기준금리 인하", "무역수지 흑자", "신규 상장", "자사주 매입", "분기 배당"]
+
+def _sample_signal_page(rng, year):
+    """Signal.bz 와 같은 구조의 페이지 (Nuxt 서버 렌더링 - 인라인 스타일/스크립트, 뉴스 목록, 검색어 2열)"""
+    def rank_items(start):
+        return ''.join(
+            f'<a href="/search/{i}" class="rank-layer"><span class="rank-num">{i}</span><span class="rank-text">{term}</span></a>'
+            for i, term in enumerate(SAMPLE_TERMS[start:start + 10], start + 1))
+
+    style = ''.join(f'.c{i}[data-v-{i:04x}]{{margin:{i % 17}px;padding:{i % 11}px;color:#{rng.randrange(0x1000000):06x}}}' for i in range(900))
+    news = ''.join(
+        f'<div class="news-card" data-v-{i:04x}><a href="/news/{i}" class="news-link"><h3 class="news-title">{SAMPLE_TERMS[i % 20]} 관련 기사 {i}</h3>'
+        f'<p class="news-desc">{SAMPLE_TERMS[(i * 7) % 20]} 소식과 시장 반응을 정리한 기사 요약 {i}</p></a><span class="news-press">언론사 {i % 30}</span></div>'
+        for i in range(320))
+    payload = ','.join(f'{{"keyword":"{SAMPLE_TERMS[i % 20]}","score":{rng.randint(1, 99999)},"state":"{rng.choice(["n", "s", "+", "-"])}"}}' for i in range(900))
+    return (
+        f'<!doctype html><html lang="ko"><head><meta charset="utf-8"><title>signal.bz - 실시간 검색어 순위</title><style>{style}</style>'
+        '<script>window.dataLayer=window.dataLayer||[];function gtag(){dataLayer.push(arguments)};gtag("js",new Date());</script>'
+        '</head><body><div id="__nuxt"><div class="layout">'
+        f'<header class="top-header"><h1 class="logo">signal.bz</h1><span class="date">{year}-12-30 10:00</span></header>'
+        f'<main class="realtime-wrap"><div class="rank-column">{rank_items(0)}<script>var tracker = "rank-column";</script></div>'
+        f'<div class="rank-column"><style>.rank-layer:hover{{color:#f00}}</style>{rank_items(10)}</div>'
+        f'<section class="news-list">{news}</section></main>'
+        '<footer class="footer"><p>© signal.bz</p></footer></div></div>'
+        f'<script>window.__NUXT__={{"state":{{"history":[{payload}]}}}};</script></body></html>'
+    )
+
+def _sample_zeroin_columns(rng, start_date, end_date):
+    """제로인 응답과 같은 열 배열 구조 (국가 5개, 중요도 전체 기준 하루 10~20개 내외)"""
+    indicators = {
+        "us": ("미국", ["소비자물가지수(CPI)", "비농업 고용자수", "FOMC 금리 결정", "소매판매", "ISM 제조업지수", "신규 실업수당 청구건수", "원유 재고", "PPI"]),
+        "kr": ("대한민국", ["수출입 동향", "한국은행 기준금리 결정", "소비자물가지수", "산업생산", "경상수지"]),
+        "cn": ("중국", ["제조업 PMI", "GDP 성장률", "무역수지", "소매판매", "CPI"]),
+        "eu": ("유럽연합", ["ECB 금리 결정", "소비자물가지수 예비치", "ZEW 경기기대지수", "실업률"]),
+        "gb": ("영국", ["BOE 금리 결정", "소매판매", "실업률", "GDP"]),
+    }
+    importance = [("상", "high"), ("중", "mid"), ("하", "low")]
+    columns = {key: [] for key in ['date', 'date_temp', 'day', 'time', 'kevent', 'importance', 'importance_class', 'actual', 'forecast', 'previous', 'nat_hname', 'natcd', 'index']}
+    day = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    while day <= end:
+        for _ in range(rng.randint(8, 22) if day.weekday() < 5 else rng.randint(0, 2)):
+            natcd = rng.choice(list(indicators))
+            nation, names = indicators[natcd]
+            level, level_class = rng.choice(importance)
+            previous = round(rng.uniform(-1, 5), 1)
+            columns['date'].append(day.strftime('%m/%d'))
+            columns['date_temp'].append(day.strftime('%Y-%m-%d'))
+            columns['day'].append('월화수목금토일'[day.weekday()])
+            columns['time'].append(f"{rng.randint(0, 23):02d}:{rng.choice(['00', '30', '45'])}")
+            columns['kevent'].append(rng.choice(names))
+            columns['importance'].append(level)
+            columns['importance_class'].append(level_class)
+            columns['actual'].append(f"{round(previous + rng.uniform(-0.3, 0.3), 1)}%")
+            columns['forecast'].append(f"{round(previous + rng.uniform(-0.2, 0.2), 1)}%")
+            columns['previous'].append(f"{previous}%")
+            columns['nat_hname'].append(nation)
+            columns['natcd'].append(natcd)
+            columns['index'].append(len(columns['index']) + 1)
+        day += timedelta(days=1)
+    return columns
+
+def _sample_fnguide_rows(rng, year, month, serial):
+    """FnGuide 월별 응답의 comp 항목 (한 달 250~350건)"""
+    kinds = [("배당", "현금배당"), ("유상증자", "주주배정"), ("무상증자", "보통주"), ("주식분할", "액면분할"), ("신규상장", "공모"), ("주주총회", "정기")]
+    rows = []
+    for _ in range(rng.randint(250, 350)):
+        serial += 1
+        code = f"{rng.randrange(1, 400000):06d}"
+        event_name, kind = rng.choice(kinds)
+        event_day = f"{year}{month:02d}{rng.randint(1, 28):02d}"
+        rows.append({"KEY": f"{event_day}{serial:06d}", "일련번호": str(serial), "기준일자": event_day, "기업명": f"표본기업{code}", "활동코드": "A" + code,
+                     "이벤트명": event_name, "이벤트코드": str(kinds.index((event_name, kind)) + 1), "일자": event_day, "종목명": code,
+                     "주식구분": "보통주", "종류": kind, "변동주식수": str(rng.randint(1, 500) * 1000), "발행가": str(rng.randint(5, 200) * 500),
+                     "변동후자본금": str(rng.randint(1, 900) * 1000000), "총발행주식수": str(rng.randint(1, 900) * 100000), "신주상장일": "", "권리락일": "",
+                     "납입일": "", "배정기준일": event_day, "배정비율": f"{rng.randint(1, 50) / 100:.2f}", "할인비율": "", "비고": ""})
+    return rows, serial
+
+def write_sample_fixtures(year=None, folder=None):
+    """
+    네트워크 없이 쓸 수 있는 표본 fixture 생성 (실제 녹화가 아니라 실제 응답과 같은 구조/비슷한 크기로 만든 데이터, 같은 year 면 같은 내용)
+    Signal.bz 약 190KB, 제로인 연간 약 4천 건 480KB(경제 캘린더 캐시 요청 구간별), FnGuide 월별 약 300건 160KB, 공휴일은 실제 응답처럼 월 1KB 미만 (HolidayCalendar 로컬 계산 공휴일)
+    """
+    if year is None:
+        year = setting.HTTP_FIXTURE_BENCHMARK_YEAR
+    rng = random.Random(year)
+
+    with HttpFixture.fixture_mode(None, folder):
+        _save_sample({"url": "https://signal.bz/"}, _sample_signal_page(rng, year), 'text/html; charset=utf-8')
+
+        for start_date, end_date in EconomicCalendarCache.SegmentRanges(year):
+            _save_sample(WebCrawling.zeroin_request(start_date, end_date), json.dumps(_sample_zeroin_columns(rng, start_date, end_date), ensure_ascii=False), 'application/json; charset=utf-8')
+
+        serial = 0
+        for month in range(1, 13):
+            rows, serial = _sample_fnguide_rows(rng, year, month, serial)
+            _save_sample(WebCrawling.fnguide_month_request(year, month), '﻿' + json.dumps({"comp": rows}, ensure_ascii=False), 'application/json')
+
+        for month in range(1, 13):
+            holidays = HolidayCalendar.CalculateHolidays(year, [month])
+            items = ''.join(
+                f'<item><dateKind>01</dateKind><dateName>{holiday["date_name"]}</dateName><isHoliday>Y</isHoliday><locdate>{holiday["date_code"]}</locdate><seq>1</seq></item>'
+                for holiday in holidays)
+            body = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><response><header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>'
+                    f'<body><items>{items}</items><numOfRows>100</numOfRows><pageNo>1</pageNo><totalCount>{len(holidays)}</totalCount></body></response>')
+            _save_sample(WebCrawling.holiday_month_request(year, month), body, 'application/xml;charset=UTF-8')
+    print(f"{year}년 표본 fixture 생성 완료 ({folder or setting.HTTP_FIXTURE_FOLDER_PATH})")
+
+def _monthly_fixtures(request_builder, year):
+    """[(월, 요청 정보, 저장된 응답), ...] (녹화되지 않은 월은 제외)"""
+    fixtures = []
+    for month in range(1, 13):
+        request_info = request_builder(year, month)
+        response = HttpFixture.load_get(request_info["url"], request_info["params"])
+        if response is not None:
+            fixtures.append((month, request_info, response))
+    return fixtures
+
+def _benchmark_signal(repeat):
+    response = HttpFixture.load_get("https://signal.bz/")
+    if response is None:
+        return []
+    content = response.content
+    rows = []
+    for backend in HtmlBackend.available_backends():
+        best, median, result = _measure(lambda: WebCrawling.parse_signal_page(content, backend), repeat)
+        rows.append((f"Signal.bz 파싱 + 검색어 추출 ({backend})", len(content), best, median, result.get("total_count", 0)))
+    return rows
+
+def _zeroin_fixtures(year):
+    """[(시작일, 종료일, 요청 정보, 저장된 응답), ...] - 경제 캘린더 캐시가 요청하는 구간별 (녹화되지 않은 구간은 제외)"""
+    fixtures = []
+    for start_date, end_date in EconomicCalendarCache.SegmentRanges(year):
+        request_info = WebCrawling.zeroin_request(start_date, end_date)
+        response = HttpFixture.load_get(request_info["url"], request_info["params"])
+        if response is not None:
+            fixtures.append((start_date, end_date, request_info, response))
+    return fixtures
+
+def _benchmark_zeroin(year, repeat):
+    fixtures = _zeroin_fixtures(year)
+    if not fixtures:
+        return []
+
+    size = sum(len(response.content) for _, _, _, response in fixtures)
+    rows = []
+    best, median, data_list = _measure(lambda: [response.json() for _, _, _, response in fixtures], repeat)
+    rows.append((f"제로인 JSON 디코딩 ({len(fixtures)}구간)", size, best, median, sum(len(data.get('date', [])) for data in data_list)))
+    for columnar, label in ((False, "제로인 정리 (이벤트 dict)"), (True, "제로인 정리 (열 구조)")):
+        best, median, results = _measure(lambda: [
+            WebCrawling.parse_zeroin_response(start_date, end_date, request_info["countries"], request_info["importance_levels"], request_info["url"], data, columnar)
+            for (start_date, end_date, request_info, _), data in zip(fixtures, data_list)
+        ], repeat)
+        rows.append((label, size, best, median, sum(result.get("total_count", 0) for result in results)))
+    return rows
+
+def _benchmark_fnguide(year, repeat):
+    fixtures = _monthly_fixtures(WebCrawling.fnguide_month_request, year)
+    if not fixtures:
+        return []
+    size = sum(len(response.content) for _, _, response in fixtures)
+    best, median, results = _measure(lambda: [WebCrawling.parse_fnguide_month(year, month, request_info["url"], response) for month, request_info, response in fixtures], repeat)
+    return [(f"FnGuide JSON 파싱 + 정리 ({len(fixtures)}개월)", size, best, median, sum(result["total_count"] for result in results))]
+
+def _benchmark_holidays(year, repeat):
+    fixtures = _monthly_fixtures(WebCrawling.holiday_month_request, year)
+    if not fixtures:
+        return []
+    size = sum(len(response.content) for _, _, response in fixtures)
+    best, median, results = _measure(lambda: [WebCrawling.parse_holiday_month(year, month, request_info["url"], response) for month, request_info, response in fixtures], repeat)
+    return [(f"공휴일 XML 파싱 + 정리 ({len(fixtures)}개월)", size, best, median, sum(result.get("total_count", 0) for result in results))]
+
+def benchmark_parsing(year=None, repeat=20, folder=None):
+    """
+    녹화한 응답으로 출처별 파싱 시간 측정
+
+    Returns:
+        list: [(항목, 응답 크기(bytes), 최소 ms, 중앙값 ms, 결과 수), ...]
+    """
+    if year is None:
+        year = setting.HTTP_FIXTURE_BENCHMARK_YEAR
+
+    with HttpFixture.fixture_mode('replay', folder):
+        rows = _benchmark_signal(repeat) + _benchmark_zeroin(year, repeat) + _benchmark_fnguide(year, repeat) + _benchmark_holidays(year, repeat)
+
+    print(f"=== 파싱 벤치마크 ({year}년, {repeat}회 반복) ===")
+    if not rows:
+        print(f"녹화된 응답이 없습니다. record_fixtures({year}) 를 먼저 실행하세요.")
+    for label, size, best, median, count in rows:
+        print(f"{label:<36} {size / 1024:>9.1f} KB  최소 {best:>8.2f} ms  중앙값 {median:>8.2f} ms  결과 {count}개")
+    return rows
+
+# 스크립트/스타일이 선택 대상 요소 안팎에 섞인 페이지 (파서마다 텍스트 추출 결과가 같아야 함)
+# 스크립트/스타일이 선택 대상 요소 안팎에 섞인 페이지 (파서마다 텍스트 추출 결과가 같아야 함)
+# 두 번째 rank-column 은 하위 요소가 중첩되어 있어 descendants 가 문서 순서(깊이 우선)가 아니면 결과 순서가 달라짐
+BACKEND_CHECK_PAGE = """<html><head><style>.rank-item{color:red}</style><script>var head = "rank-item";</script></head><body>
+<div class="rank-column"><span class="rank-item">1 금리 동결</span><script>window.track("rank-column");</script>
+<span class="rank-item">2 환율<style>.x{}</style> 급등</span></div>
+<div class="rank-column"><a href="/3"><span>3</span><span>반도체 수출</span></a><p><a href="/4"><span>4</span>코스피 반등</a></p>
+<a href="/5"><span>5</span><span>배당 기준일<script>track(5)</script></span></a></div>
+<ul class="keyword-list"><li class="keyword">반도체 <!-- 주석 --> 수출<script>document.write("광고")</script></li></ul>
+<p class="date">2026-10-19 10:00<style>.date{}</style></p></body></html>"""
+
+def test_backend_consistency():
+    """HTML 파서마다 선택자 조회/텍스트/하위 요소 순서와 Signal.bz 파싱 결과가 BeautifulSoup(html.parser) 과 같은지 확인
+    (selectolax, lxml 은 설치되어 있지 않으면 건너뜀 - 'auto' 설정은 selectolax 가 있으면 selectolax 를 쓰므로 설치한 환경에서 꼭 실행)"""
+    selectors = ['.rank-column', '.rank-item', '[class*="keyword"]', 'li[class*="key"]', '.date']
+
+    def outputs(backend):
+        document = HtmlBackend.parse(BACKEND_CHECK_PAGE, backend)
+        texts = {selector: [document.text(element) for element in document.select(selector)] for selector in selectors}
+        texts['descendants'] = [
+            [document.text(child) for child in document.descendants(element, ['div', 'span', 'p', 'a', 'li'])]
+            for element in document.select('.rank-column')
+        ]
+        pages = [BACKEND_CHECK_PAGE.encode('utf-8')]
+        with HttpFixture.fixture_mode('replay'):
+            response = HttpFixture.load_get("https://signal.bz/")
+        if response is not None:
+            pages.append(response.content)
+        parsed = [_quiet(WebCrawling.parse_signal_page, page, backend) for page in pages]
+        return texts, [(result["search_terms"], result["date_info"]) for result in parsed]
+
+    expected = outputs('html.parser')
+    isSuccess = True
+    for backend in HtmlBackend.BACKENDS:
+        if backend == 'html.parser':
+            continue
+        if backend not in HtmlBackend.available_backends():
+            print(f"⏭️ {backend}: 설치되어 있지 않아 건너뜀")
+            continue
+        texts, parsed = outputs(backend)
+        mismatched = [key for key in expected[0] if texts[key] != expected[0][key]]
+        if parsed != expected[1]:
+            mismatched.append('parse_signal_page')
+        if mismatched:
+            isSuccess = False
+            print(f"❌ {backend}: 결과 불일치 {mismatched}")
+        else:
+            print(f"✅ {backend}: html.parser 와 결과 일치")
+    return isSuccess
+
+def run_api_tests(mode):
+    """WebCrawling 의 API 테스트를 녹화('record') 또는 재생('replay') 모드로 실행 (제로인 테스트는 오늘 날짜 기준이라 녹화한 날만 재생 가능)"""
+    with HttpFixture.fixture_mode(mode):
+        WebCrawling.test_zeroin_api()
+        WebCrawling.test_fnguide_api()
+        WebCrawling.test_crawling_performance()
+        WebCrawling.test_korean_holidays_api()
+
+if __name__ == "__main__":
+    print("=== 크롤러 녹화/벤치마크 메뉴 ===")
+    print("1. 벤치마크용 응답 녹화 (실제 사이트 접속)")
+    print("2. 파싱 벤치마크 (녹화한 응답 사용)")
+    print("3. API 테스트 녹화")
+    print("4. API 테스트 재생 (오프라인)")
+    print("5. HTML 파서별 결과 비교")
+    print("6. 표본 fixture 생성 (오프라인)")
+
+    choice = input("\n선택하세요 (1-6): ").strip()
+
+    if choice == "1":
+        record_fixtures()
+    elif choice == "2":
+        benchmark_parsing()
+    elif choice == "3":
+        run_api_tests('record')
+    elif choice == "4":
+        run_api_tests('replay')
+    elif choice == "5":
+        test_backend_consistency()
+    elif choice == "6":
+        write_sample_fixtures()
+    else:
+        print("잘못된 선택입니다.")
@@ -0,0 +1,202 @@
+import threading, time, asyncio
+from datetime import datetime
+import setting, WebCrawling, AsyncCrawler
+
+# [경제 캘린더 캐시]
+# 제로인 경제 캘린더를 연도별로 전체 국가/전체 중요도(상위 집합) 한 벌만 받아 메모리에 보관하고
+# 국가/중요도 필터는 미리 만든 색인으로 로컬에서 잘라서 응답 (필터를 바꿔도 외부 요청 없음)
+#   past : 지난달까지 - 한 번 받으면 다시 받지 않음
+#   live : 이번 달부터 연말까지 - ECONOMIC_CALENDAR_REFRESH_SECONDS 가 지나면 이 구간만 다시 받음
+#   지난 연도는 past 만, 다음 연도 이후는 live 만 있음
+#   달이 바뀌어 past/live 경계가 달라지면 그 연도 전체를 다시 받음
+#   live 갱신이 실패하면 이전 데이터를 그대로 쓰고 warnings 에 표시
+#   비동기 버전(GetEconomicCalendarAsync)은 AsyncCrawler 로 구간을 동시에 조회
+# 캐시는 제로인 응답과 같은 열 구조(필드별 배열)로 보관
+#   columnar=True 요청은 선택된 행 번호로 열만 잘라서 응답 (economic_columns)
+#   기존 요청은 선택된 행만 이벤트 dict 로 변환 (economic_data)
+
+_lock = threading.Lock()
+_years = {}        # year -> 연도별 캐시 (아래 _build_entry 참고)
+_year_locks = {}
+
+def _year_lock(year):
+  with _lock:
+    return _year_locks.setdefault(year, threading.Lock())
+
+def _empty_columns():
+  return {field: [] for field in WebCrawling.ZEROIN_EVENT_FIELDS}
+
+def _live_start_month(year):
+  """live 구간 시작 월 (1 이면 past 없음, 13 이면 live 없음)"""
+  now = datetime.now()
+  if year < now.year:
+    return 13
+  if year > now.year:
+    return 1
+  return now.month
+
+def _segment_dates(year, start_month, end_month):
+  """start_month 1일 ~ end_month 말일 (YYYY-MM-DD)"""
+  end_day = 31 if end_month == 12 else (datetime(year, end_month + 1, 1) - datetime(year, end_month, 1)).days
+  return f"{year}-{start_month:02d}-01", f"{year}-{end_month:02d}-{end_day:02d}"
+
+def _fetch(year, start_month, end_month):
+  """전체 국가/전체 중요도로 구간 조회"""
+  start_date, end_date = _segment_dates(year, start_month, end_month)
+  return WebCrawling.crawl_zeroin_economic_calendar(start_date, end_date, columnar=True)
+
+async def _fetch_async(year, start_month, end_month):
+  start_date, end_date = _segment_dates(year, start_month, end_month)
+  return await AsyncCrawler.crawl_zeroin_economic_calendar(start_date, end_date, columnar=True)
+
+def _build_entry(live_start, past, live, live_fetched_at, fetched_result):
+  """구간 데이터(열 구조)를 합치고 국가/중요도 색인 생성"""
+  columns = {field: past[field] + live[field] for field in WebCrawling.ZEROIN_EVENT_FIELDS}
+  by_country = {}
+  by_importance = {}
+  for i, country_code in enumerate(columns['country_code']):
+    by_country.setdefault(str(country_code).lower(), []).append(i)
+  for i, level in enumerate(columns['importance_level']):
+    by_importance.setdefault(level, []).append(i)
+
+  return {
+    "live_start": live_start,
+    "past": past,
+    "live": live,
+    "live_fetched_at": live_fetched_at,
+    "columns": columns,
+    "count": len(columns['event_name']),
+    "by_country": by_country,
+    "by_importance": by_importance,
+    "api_url": fetched_result.get("api_url")
+  }
+
+def _plan(year):
+  """(live 시작 월, 기존 캐시 또는 None, 받아야 할 구간 [(시작 월, 끝 월), ...])"""
+  live_start = _live_start_month(year)
+  with _lock:
+    entry = _years.get(year)
+
+  if entry is not None and entry["live_start"] == live_start:
+    if live_start == 13 or time.time() - entry["live_fetched_at"] < setting.ECONOMIC_CALENDAR_REFRESH_SECONDS:
+      return live_start, entry, []
+    return live_start, entry, [(live_start, 12)]
+
+  return live_start, None, _full_segments(live_start)
+
+def _full_segments(live_start):
+  """캐시가 없을 때 받는 구간 [(시작 월, 끝 월), ...] - past, live 순"""
+  segments = []
+  if live_start > 1:
+    segments.append((1, live_start - 1))
+  if live_start <= 12:
+    segments.append((live_start, 12))
+  return segments
+
+def SegmentRanges(year):
+  """캐시가 없을 때 이 연도를 채우려고 제로인에 요청하는 날짜 구간 [(시작일, 종료일), ...] (녹화/벤치마크가 같은 요청을 쓰도록)
+  지난 연도는 1년 전체 한 구간이라 날짜와 무관하고, 올해는 이번 달을 경계로 나뉘므로 달이 바뀌면 달라짐"""
+  return [_segment_dates(year, start_month, end_month) for start_month, end_month in _full_segments(_live_start_month(year))]
+
+def _apply(year, live_start, entry, segments, results):
+  """받은 구간을 캐시에 반영 -> (캐시, 경고 또는 None), 처음 조회가 실패하면 (None, 오류 결과)"""
+  if not segments:
+    return entry, None
+
+  failed = next((result for result in results if not result.get("success", False)), None)
+  if entry is not None:
+    # live 구간만 갱신
+    if failed is not None:
+      return entry, f"이번 달 이후 일정 갱신 실패 (이전 데이터 사용): {failed.get('error', '알 수 없는 오류')}"
+    entry = _build_entry(live_start, entry["past"], results[0]["economic_columns"], time.time(), results[0])
+  else:
+    if failed is not None:
+      return None, failed
+    past = results[0]["economic_columns"] if live_start > 1 else _empty_columns()
+    live = results[-1]["economic_columns"] if live_start <= 12 else _empty_columns()
+    entry = _build_entry(live_start, past, live, time.time(), results[-1])
+
+  with _lock:
+    _years[year] = entry
+  return entry, None
+
+def _load(year):
+  live_start, entry, segments = _plan(year)
+  results = [_fetch(year, start_month, end_month) for start_month, end_month in segments]
+  return _apply(year, live_start, entry, segments, results)
+
+async def _load_async(year):
+  """_load 의 비동기 버전 (past/live 구간을 동시에 조회)"""
+  live_start, entry, segments = _plan(year)
+  results = await asyncio.gather(*(_fetch_async(year, start_month, end_month) for start_month, end_month in segments))
+  return _apply(year, live_start, entry, segments, list(results))
+
+def _select(entry, countries, importance_levels):
+  """색인으로 필터에 맞는 행 번호 선택 (필터가 없으면 None)"""
+  selected = None
+  if countries is not None:
+    selected = set()
+    for country in countries:
+      selected.update(entry["by_country"].get(country.lower(), []))
+
+  if importance_levels is not None:
+    by_importance = set()
+    for level in importance_levels:
+      by_importance.update(entry["by_importance"].get(level, []))
+    selected = by_importance if selected is None else selected & by_importance
+
+  return None if selected is None else sorted(selected)
+
+def _respond(year, entry, problem, countries, importance_levels, columnar):
+  if entry is None:
+    return problem
+
+  indices = _select(entry, countries, importance_levels)
+  result = {
+    "success": True,
+    "method": "ZeroIn API (연도별 캐시)",
+    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    "api_url": entry["api_url"],
+    "parameters": {
+      "start_date": f"{year}-01-01",
+      "end_date": f"{year}-12-31",
+      "countries": countries,
+      "importance_levels": importance_levels
+    },
+    "total_count": entry["count"] if indices is None else len(indices),
+    "cache": {
+      "liveStartMonth": entry["live_start"] if entry["live_start"] <= 12 else None,
+      "liveFetchedAt": datetime.fromtimestamp(entry["live_fetched_at"]).strftime("%Y-%m-%d %H:%M:%S"),
+      "cachedCount": entry["count"]
+    }
+  }
+  if columnar:
+    result["format"] = "columnar"
+    if indices is None:
+      result["economic_columns"] = entry["columns"]
+    else:
+      result["economic_columns"] = {field: [column[i] for i in indices] for field, column in entry["columns"].items()}
+  else:
+    result["economic_data"] = WebCrawling.zeroin_columns_to_rows(entry["columns"], indices)
+  if problem:
+    result["warnings"] = problem
+  return result
+
+def GetEconomicCalendar(year, countries=None, importance_levels=None, columnar=False):
+  """연도별 경제 캘린더 (crawl_zeroin_economic_calendar 와 같은 형식, 필터는 캐시에서 처리)"""
+  with _year_lock(year):
+    entry, problem = _load(year)
+  return _respond(year, entry, problem, countries, importance_levels, columnar)
+
+async def GetEconomicCalendarAsync(year, countries=None, importance_levels=None, columnar=False):
+  """GetEconomicCalendar 의 비동기 버전 (같은 연도 동시 요청은 한 번만 조회)"""
+  entry, problem = await AsyncCrawler.single_flight(('economic_calendar', year), lambda: _load_async(year))
+  return _respond(year, entry, problem, countries, importance_levels, columnar)
+
+def InvalidateEconomicCalendar(year=None):
+  """캐시 비우기 (year 를 지정하면 해당 연도만)"""
+  with _lock:
+    if year is None:
+      _years.clear()
+    else:
+      _years.pop(year, None)
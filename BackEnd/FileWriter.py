@@ -0,0 +1,160 @@
+import os, threading, hashlib, tempfile
+from contextlib import contextmanager
+import setting
+
+try:
+  import fcntl
+  msvcrt = None
+except ImportError:  # Windows
+  fcntl = None
+  import msvcrt
+
+# [파일 쓰기 조정]
+# 모든 저장소(JsonDataBase / XmlDataBase / 저널) 쓰기는 이 모듈을 거침
+#   file_lock      : 파일별 잠금 - 같은 프로세스의 스레드끼리는 RLock, 프로세스끼리는 잠금 파일(fcntl / msvcrt)
+#                    같은 스레드가 다시 잡아도 됨 (잠금 안에서 atomic_write / append_write 호출 가능)
+#   atomic_write   : 같은 폴더의 임시 파일에 쓰고 fsync 후 os.replace (읽는 쪽은 이전 파일 또는 새 파일만 봄)
+#   append_write   : 잠금 안에서 파일 끝에 추가하고 fsync
+#   write_coalesced: 같은 파일에 대한 쓰기 요청이 몰리면 진행 중인 쓰기가 끝난 뒤 가장 마지막 요청만 한 번 실행
+# 잠금 파일은 WRITE_LOCK_DIR 아래에 대상 경로의 해시 이름으로 만듦 (데이터 폴더를 어지럽히지 않음)
+# uvicorn 워커를 여러 개 띄워도 같은 파일을 동시에 쓰지 않음
+
+class _PathLock:
+  def __init__(self):
+    self.rlock = threading.RLock()
+    self.depth = 0
+    self.handle = None
+
+class _Generation:
+  def __init__(self):
+    self.done = threading.Event()
+    self.error = None
+
+_registry_lock = threading.Lock()
+_path_locks = {}
+_coalesce_slots = {}
+
+def _lock_key(path):
+  return os.path.normcase(os.path.abspath(path))
+
+def _lock_file_path(key):
+  return os.path.join(setting.WRITE_LOCK_DIR, hashlib.md5(key.encode('utf-8')).hexdigest() + '.lock')
+
+def _acquire_os_lock(handle):
+  if fcntl is not None:
+    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+    return
+  # msvcrt.LK_LOCK 은 약 10초 재시도 후 OSError - 잡힐 때까지 반복
+  while True:
+    try:
+      handle.seek(0)
+      msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+      return
+    except OSError:
+      continue
+
+def _release_os_lock(handle):
+  if fcntl is not None:
+    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+  else:
+    handle.seek(0)
+    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+@contextmanager
+def file_lock(path):
+  """path 에 대한 프로세스 간 배타 잠금 (같은 스레드에서 중첩 가능)"""
+  key = _lock_key(path)
+  with _registry_lock:
+    state = _path_locks.setdefault(key, _PathLock())
+
+  with state.rlock:
+    if state.depth == 0:
+      os.makedirs(setting.WRITE_LOCK_DIR, exist_ok=True)
+      handle = open(_lock_file_path(key), 'a+b')
+      try:
+        _acquire_os_lock(handle)
+      except Exception:
+        handle.close()
+        raise
+      state.handle = handle
+    state.depth += 1
+
+    try:
+      yield
+    finally:
+      state.depth -= 1
+      if state.depth == 0:
+        handle, state.handle = state.handle, None
+        try:
+          _release_os_lock(handle)
+        finally:
+          handle.close()
+
+def _write_content(f, content):
+  if callable(content):
+    content(f)
+  else:
+    f.write(content)
+
+def atomic_write(path, content, binary=False, encoding='utf-8'):
+  """content(str/bytes 또는 파일 객체를 받는 함수)를 임시 파일에 쓰고 fsync 후 path 로 교체"""
+  directory = os.path.dirname(path) or '.'
+  os.makedirs(directory, exist_ok=True)
+
+  with file_lock(path):
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+      with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding=encoding)) as f:
+        _write_content(f, content)
+        f.flush()
+        os.fsync(f.fileno())
+      os.replace(temp_path, path)
+    except Exception:
+      if os.path.exists(temp_path):
+        os.remove(temp_path)
+      raise
+
+def append_write(path, content, binary=False, encoding='utf-8'):
+  """잠금 안에서 파일 끝에 추가하고 fsync"""
+  os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+  with file_lock(path):
+    with (open(path, 'ab') if binary else open(path, 'a', encoding=encoding)) as f:
+      _write_content(f, content)
+      f.flush()
+      os.fsync(f.fileno())
+
+def write_coalesced(path, action):
+  """path 에 대한 쓰기 작업(action: 인자 없는 함수)을 합쳐서 실행
+  이미 쓰는 중이면 대기열의 작업을 최신 것으로 바꿔두고, 쓰던 스레드가 끝나면 최신 작업 하나만 실행
+  호출한 스레드는 자기 요청이 반영된 쓰기가 끝날 때까지 기다림 (실패하면 예외 전달)"""
+  key = _lock_key(path)
+  with _registry_lock:
+    slot = _coalesce_slots.setdefault(key, {"action": None, "generation": None, "writing": False})
+    slot["action"] = action
+    if slot["generation"] is None:
+      slot["generation"] = _Generation()
+    generation = slot["generation"]
+    leader = not slot["writing"]
+    if leader:
+      slot["writing"] = True
+
+  if leader:
+    while True:
+      with _registry_lock:
+        pending_action, pending_generation = slot["action"], slot["generation"]
+        slot["action"], slot["generation"] = None, None
+        if pending_action is None:
+          slot["writing"] = False
+          break
+
+      try:
+        with file_lock(path):
+          pending_action()
+      except Exception as e:
+        pending_generation.error = e
+      pending_generation.done.set()
+  else:
+    generation.done.wait()
+
+  if generation.error is not None:
+    raise generation.error
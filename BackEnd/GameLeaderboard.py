@@ -0,0 +1,346 @@
+import os, json, threading, atexit, time
+from bisect import bisect_left
+from contextlib import contextmanager
+import setting, FileWriter
+from datetime import datetime
+
+# [게임 리더보드]
+# 게임/모드별로 점수 내림차순 정렬 목록을 메모리에 유지 (모드 '' 는 해당 게임 전체 모드)
+#   keys    : (-점수, 입력 순번) - 같은 점수면 먼저 기록된 점수가 앞
+#   entries : keys 와 같은 순서의 스코어 항목 {"id", "mode", "score", "timestamp"}
+# 저장은 메모리에 반영한 뒤 기록 대기열에 넣고, 백그라운드 스레드가 추가 전용 로그(JSON Lines)에 모아서 기록
+# 로그가 일정 건수 이상 쌓이면 전체 스냅샷(game-store-db.txt, 기존 형식)을 다시 쓰고 로그를 비움
+#
+# [보관 정책] 모드별로(모드 없이 기록된 점수도 하나의 모드로) 사용자별 상위 GAME_SCORE_KEEP_PER_USER 개 + 전체 상위 GAME_SCORE_KEEP_GLOBAL 개만 남기고
+# 나머지는 점수 구간별 개수(_compacted)로 합쳐서 보관 (순위/백분위 계산에 계속 반영)
+# 남길 점수는 기록 시점이 아니라 점수 순위로 고르므로 오래된 점수라도 상위권이면 그대로 남음
+# 스냅샷의 "_compacted" 키에 함께 저장
+# 합쳐진 구간에는 개별 점수가 없어서 조회 점수와 같은 구간의 합쳐진 점수는 높은/낮은 쪽 어디에도 세지 않음
+#   -> 그런 점수가 있으면 GetScoreRank 결과의 approximate 가 True (rank 는 그 점수들이 모두 낮다고 본 값)
+#
+# [여러 워커 프로세스] 로그/스냅샷 쓰기는 FileWriter 파일 잠금 안에서 하고, 기록할 때마다 먼저 디스크와 맞춤
+#   스냅샷이 바뀌었으면(다른 프로세스가 압축) 전체를 다시 읽고, 아니면 로그에서 마지막으로 읽은 위치 이후만 반영
+#   조회할 때도 파일 잠금 안에서 스냅샷/로그 크기를 확인해 바뀌었을 때만 같은 방식으로 반영
+
+DEFAULT_GAME_TYPES = ["SnakeGame", "SpaceShootingGame"]
+
+_lock = threading.RLock()
+_boards = None
+_compacted = {}
+_sequence = 0
+_pending_entries = []   # (game_type, entry) - 아직 로그에 기록하지 않은 점수
+_log_line_count = 0
+_log_offset = 0
+_snapshot_signature = None
+_flush_thread = None
+
+def _log_path():
+  return setting.JSON_GAME_SCORE_PATH + '.log'
+
+def _new_board():
+  return {"keys": [], "entries": []}
+
+def _insert(game_type, entry):
+  global _sequence
+  _sequence += 1
+  key = (-entry.get("score", 0), _sequence)
+
+  modes = _boards.setdefault(game_type, {"": _new_board()})
+  mode = entry.get("mode", "")
+  for target in ([""] if mode == "" else ["", mode]):
+    board = modes.setdefault(target, _new_board())
+    position = bisect_left(board["keys"], key)
+    board["keys"].insert(position, key)
+    board["entries"].insert(position, entry)
+
+def _entry_identity(game_type, entry):
+  return (game_type, entry.get("id"), entry.get("mode"), entry.get("score"), entry.get("timestamp"))
+
+def _read_snapshot_signature():
+  try:
+    stat = os.stat(setting.JSON_GAME_SCORE_PATH)
+    return (stat.st_mtime_ns, stat.st_size)
+  except FileNotFoundError:
+    return None
+
+def _replay_log(loaded=None):
+  """로그에서 _log_offset 이후의 완전한 줄을 반영 (loaded 에 있는 항목은 건너뜀)"""
+  global _log_line_count, _log_offset
+  if not os.path.exists(_log_path()):
+    return
+
+  with open(_log_path(), "rb") as f:
+    f.seek(_log_offset)
+    data = f.read()
+
+  # 기록 도중 끊긴 마지막 줄은 다음에 다시 읽도록 남겨둠
+  complete = data[:data.rfind(b'\n') + 1]
+  for line in complete.splitlines():
+    _log_offset += len(line) + 1
+    try:
+      record = json.loads(line.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+      continue
+    _log_line_count += 1
+    if loaded is None or _entry_identity(record["gameType"], record["entry"]) not in loaded:
+      _insert(record["gameType"], record["entry"])
+
+def _load_from_disk():
+  """스냅샷 + 로그를 읽어 메모리 리더보드 구성"""
+  global _boards, _compacted, _log_line_count, _log_offset, _snapshot_signature
+
+  _boards = {game_type: {"": _new_board()} for game_type in DEFAULT_GAME_TYPES}
+  _compacted = {}
+  _log_line_count = 0
+  _log_offset = 0
+  _snapshot_signature = _read_snapshot_signature()
+
+  snapshot = {}
+  if os.path.exists(setting.JSON_GAME_SCORE_PATH):
+    try:
+      with open(setting.JSON_GAME_SCORE_PATH, "r", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    except Exception as e:
+      print(f"게임 스코어 스냅샷 읽기 오류: {e}")
+
+  if isinstance(snapshot.get("_compacted"), dict):
+    _compacted = snapshot["_compacted"]
+
+  loaded = set()
+  for game_type, entries in snapshot.items():
+    if not isinstance(entries, list):
+      continue
+    _boards.setdefault(game_type, {"": _new_board()})
+    for entry in entries:
+      _insert(game_type, entry)
+      loaded.add(_entry_identity(game_type, entry))
+
+  # 스냅샷 이후 로그에 남은 점수 반영 (스냅샷 작성 직후 중단된 경우 이미 반영된 항목은 건너뜀)
+  _replay_log(loaded)
+
+def _ensure_loaded():
+  """최초 1회 디스크에서 읽음"""
+  if _boards is None:
+    _load_from_disk()
+
+def _sync_from_disk():
+  """다른 프로세스가 기록한 내용 반영 (파일 잠금 안에서 호출)"""
+  if _boards is None or _read_snapshot_signature() != _snapshot_signature:
+    # 스냅샷이 바뀌었으면 전체를 다시 읽고, 아직 기록하지 않은 점수는 다시 넣음
+    _load_from_disk()
+    for game_type, entry in _pending_entries:
+      _insert(game_type, entry)
+  else:
+    _replay_log()
+
+def _log_size():
+  try:
+    return os.path.getsize(_log_path())
+  except FileNotFoundError:
+    return 0
+
+@contextmanager
+def _synced():
+  """조회용 - 파일 잠금 안에서 스냅샷 서명/로그 위치가 바뀌었으면 디스크와 맞춘 뒤 메모리 잠금을 잡은 채로 실행"""
+  with FileWriter.file_lock(setting.JSON_GAME_SCORE_PATH), _lock:
+    if _boards is None or _read_snapshot_signature() != _snapshot_signature or _log_size() != _log_offset:
+      _sync_from_disk()
+    yield
+
+def _snapshot_data(include_compacted=False):
+  data = {game_type: list(modes[""]["entries"]) for game_type, modes in _boards.items()}
+  if include_compacted and _compacted:
+    data["_compacted"] = _compacted
+  return data
+
+def _write_snapshot():
+  """스냅샷을 다시 쓰고 로그를 비움 (write_coalesced 로 실행 - 파일 잠금 안)"""
+  global _log_line_count, _log_offset, _snapshot_signature
+  with _lock:
+    if _boards is None:
+      return
+    _sync_from_disk()
+    FileWriter.atomic_write(setting.JSON_GAME_SCORE_PATH, json.dumps(_snapshot_data(include_compacted=True), ensure_ascii=False, indent=2))
+    FileWriter.atomic_write(_log_path(), '')
+    _log_line_count = 0
+    _log_offset = 0
+    _snapshot_signature = _read_snapshot_signature()
+
+def FlushGameScores(compact=False):
+  """대기 중인 점수를 로그에 기록하고, 로그가 충분히 쌓였거나 compact=True 면 스냅샷을 다시 씀
+  스냅샷 쓰기는 잠금을 푼 뒤 write_coalesced 로 - 동시에 몰린 스냅샷 요청은 한 번만 씀"""
+  global _pending_entries, _log_line_count, _log_offset
+  try:
+    with FileWriter.file_lock(setting.JSON_GAME_SCORE_PATH), _lock:
+      if _boards is None:
+        return True
+      _sync_from_disk()
+      entries = _pending_entries
+      _pending_entries = []
+
+      if entries:
+        lines = [json.dumps({"gameType": game_type, "entry": entry}, ensure_ascii=False) + '\n' for game_type, entry in entries]
+        FileWriter.append_write(_log_path(), ''.join(lines))
+        _log_line_count += len(lines)
+        _log_offset = os.path.getsize(_log_path())
+
+      needs_snapshot = compact or _log_line_count >= setting.GAME_SCORE_COMPACT_LOG_LINES
+
+    if needs_snapshot:
+      FileWriter.write_coalesced(setting.JSON_GAME_SCORE_PATH, _write_snapshot)
+    return True
+  except Exception as e:
+    print(f"FlushGameScores 오류: {e}")
+    return False
+
+def _flush_worker():
+  last_retention = time.time()
+  while True:
+    time.sleep(setting.GAME_SCORE_FLUSH_INTERVAL_SECONDS)
+    if time.time() - last_retention >= setting.GAME_SCORE_RETENTION_INTERVAL_SECONDS:
+      last_retention = time.time()
+      ApplyRetention()
+    else:
+      FlushGameScores()
+
+def _select_retained(entries):
+  """점수 내림차순 목록에서 전체 상위 M 개와 사용자별 상위 K 개만 고름"""
+  retained = set()
+  per_user = {}
+  for position, entry in enumerate(entries):
+    user_count = per_user.get(entry.get("id"), 0)
+    if position < setting.GAME_SCORE_KEEP_GLOBAL or user_count < setting.GAME_SCORE_KEEP_PER_USER:
+      retained.add(id(entry))
+    per_user[entry.get("id")] = user_count + 1
+  return retained
+
+def _add_compacted(game_type, mode, entry):
+  stats = _compacted.setdefault(game_type, {}).setdefault(mode, {"count": 0, "scoreSum": 0, "buckets": {}})
+  score = entry.get("score", 0)
+  bucket = str(score // setting.GAME_SCORE_BUCKET_SIZE * setting.GAME_SCORE_BUCKET_SIZE)
+  stats["count"] += 1
+  stats["scoreSum"] += score
+  stats["buckets"][bucket] = stats["buckets"].get(bucket, 0) + 1
+
+def ApplyRetention():
+  """보관 정책을 적용해 오래된 하위 점수를 구간별 개수로 합치고 스냅샷을 다시 씀
+  선별은 잠금 밖에서 복사본으로 하고, 제거만 잠금 안에서 하므로 저장 요청을 오래 막지 않음"""
+  try:
+    with _lock:
+      if _boards is None:
+        return True
+      # 모드 보드마다 선별하고, 모드 '' 로 기록된 점수는 전체 보드('')에만 있으므로 따로 모아서 선별
+      mode_entries = {}
+      for game_type, modes in _boards.items():
+        for mode, board in modes.items():
+          if mode != "":
+            mode_entries[(game_type, mode)] = list(board["entries"])
+        mode_entries[(game_type, "")] = [entry for entry in modes[""]["entries"] if entry.get("mode", "") == ""]
+
+    removed = {}
+    for (game_type, mode), entries in mode_entries.items():
+      retained = _select_retained(entries)
+      for entry in entries:
+        if id(entry) not in retained:
+          removed[id(entry)] = (game_type, mode, entry)
+
+    if removed:
+      with _lock:
+        # 선별하는 동안 디스크에서 다시 읽었으면 해당 항목은 더 이상 없으므로 남아있는 항목만 합침
+        present = {id(entry) for modes in _boards.values() for board in modes.values() for entry in board["entries"]}
+        removed = {key: value for key, value in removed.items() if key in present}
+        for game_type, mode, entry in removed.values():
+          _add_compacted(game_type, mode, entry)
+        for game_type, modes in _boards.items():
+          for board in modes.values():
+            kept = [(key, entry) for key, entry in zip(board["keys"], board["entries"]) if id(entry) not in removed]
+            board["keys"] = [key for key, _ in kept]
+            board["entries"] = [entry for _, entry in kept]
+
+    return FlushGameScores(compact=bool(removed))
+  except Exception as e:
+    print(f"ApplyRetention 오류: {e}")
+    return False
+
+def _compacted_counts(game_type, mode, score):
+  """합쳐진 점수 중 score 보다 높은 구간/낮은 구간/score 와 같은 구간/전체 개수 (mode '' 는 모든 모드 합산)"""
+  bucket_size = setting.GAME_SCORE_BUCKET_SIZE
+  higher = lower = same = total = 0
+  for stats_mode, stats in _compacted.get(game_type, {}).items():
+    if mode != "" and stats_mode != mode:
+      continue
+    total += stats["count"]
+    for bucket, count in stats["buckets"].items():
+      if int(bucket) > score:
+        higher += count
+      elif int(bucket) + bucket_size <= score:
+        lower += count
+      else:
+        same += count
+  return higher, lower, same, total
+
+def _start_flush_thread():
+  global _flush_thread
+  if _flush_thread is None or not _flush_thread.is_alive():
+    _flush_thread = threading.Thread(target=_flush_worker, name='game-score-flush', daemon=True)
+    _flush_thread.start()
+    atexit.register(FlushGameScores)
+
+def AddScore(game_type, user_id, mode, score):
+  """점수를 리더보드에 추가하고 기록 대기열에 넣음 (디스크 기록은 백그라운드)"""
+  entry = {
+    "id": user_id,
+    "mode": mode,
+    "score": score,
+    "timestamp": datetime.now().isoformat()
+  }
+
+  with _lock:
+    _ensure_loaded()
+    _insert(game_type, entry)
+    _pending_entries.append((game_type, entry))
+    _start_flush_thread()
+
+  return entry
+
+def GetAllScores(game_type=""):
+  """게임별 전체 점수 (점수 내림차순), game_type 을 지정하면 해당 게임만"""
+  with _synced():
+    if game_type and game_type in _boards:
+      return {game_type: list(_boards[game_type][""]["entries"])}
+    return _snapshot_data()
+
+def GetTopScores(game_type, mode="", limit=10):
+  """상위 limit 개 점수"""
+  with _synced():
+    modes = _boards.get(game_type)
+    if modes is None or mode not in modes:
+      return []
+    return modes[mode]["entries"][:max(limit, 0)]
+
+def GetScoreRank(game_type, mode, score):
+  """임의 점수의 순위/상위 비율 - 정렬된 keys 에서 이분 탐색 (O(log N) + 합쳐진 점수 구간 수)
+  rank: 이 점수보다 높은 점수 수 + 1, topPercent: rank / 전체 * 100, percentile: 이 점수보다 낮은 점수 비율
+  approximate: 같은 구간에 합쳐진 점수가 있어 rank/percentile 이 정확하지 않으면 True"""
+  with _synced():
+    modes = _boards.get(game_type)
+    keys = modes[mode]["keys"] if modes is not None and mode in modes else []
+
+    total_count = len(keys)
+    higher_count = bisect_left(keys, (-score, 0))
+    lower_count = total_count - bisect_left(keys, (-score, float('inf')))
+
+    # 보관 정책으로 합쳐진 점수도 구간 단위로 반영 (같은 구간은 높은/낮은 쪽 어디에도 세지 않음)
+    compacted_higher, compacted_lower, compacted_same, compacted_total = _compacted_counts(game_type, mode, score)
+    total_count += compacted_total
+    higher_count += compacted_higher
+    lower_count += compacted_lower
+
+  rank = higher_count + 1
+  return {
+    "rank": rank,
+    "totalCount": total_count,
+    "topPercent": round(min(rank / total_count, 1.0) * 100, 2) if total_count else 100.0,
+    "percentile": round(lower_count / total_count * 100, 2) if total_count else 0.0,
+    "approximate": compacted_same > 0
+  }
@@ -0,0 +1,235 @@
+import os, json, threading, time, asyncio
+from datetime import date, datetime, timedelta
+import setting, FileWriter, WebCrawling, AsyncCrawler
+
+# [한국 공휴일 캐시 / 로컬 계산]
+# 공휴일은 한 해에 거의 바뀌지 않으므로 연도별 결과를 파일로 저장해두고 HOLIDAY_CACHE_TTL_DAYS 일 동안 재사용
+#   파일 : JSON_HOLIDAY_CACHE_FOLDER_PATH/{연도}.json  {"fetchedAt": 저장 시각(epoch), "result": getKoreanHolidays 결과}
+#   지난 연도는 더 바뀌지 않으므로 유지 기간 없이 계속 사용
+#   refresh=True 이면 유지 기간과 상관없이 API 에서 다시 받음 (임시공휴일 지정 등)
+# API 가 느리거나 실패하면
+#   1) 이전에 받은 파일이 있으면 유지 기간이 지났어도 그 결과 사용
+#   2) 일부 월만 받았으면 실패한 월을 로컬 계산으로 채움 (파일로 저장하지 않고 다음 요청에서 다시 시도)
+#   3) 모두 실패하면 로컬 계산 결과 사용
+# 로컬 계산 = 양력 고정 공휴일 + 음력 공휴일 표(LUNAR_HOLIDAYS) + 대체공휴일 규칙
+#   임시공휴일/선거일은 알 수 없고, 표에 없는 연도는 설날/부처님오신날/추석이 빠짐
+# 응답의 "cache" 에 출처(cache / api / stale_cache / partial_api / local)와 저장 시각, 경과 초를 담음
+
+# 양력 고정 공휴일 (API 의 dateName 과 같은 이름)
+SOLAR_HOLIDAYS = (
+  ((1, 1), '1월1일'),
+  ((3, 1), '삼일절'),
+  ((5, 5), '어린이날'),
+  ((6, 6), '현충일'),
+  ((8, 15), '광복절'),
+  ((10, 3), '개천절'),
+  ((10, 9), '한글날'),
+  ((12, 25), '기독탄신일'),
+)
+
+# 음력 공휴일의 양력 날짜 (설날 당일, 부처님오신날, 추석 당일) - 설날/추석은 앞뒤 하루씩 포함해 사흘
+LUNAR_HOLIDAYS = {
+  2020: ('0125', '0430', '1001'),
+  2021: ('0212', '0519', '0921'),
+  2022: ('0201', '0508', '0910'),
+  2023: ('0122', '0527', '0929'),
+  2024: ('0210', '0515', '0917'),
+  2025: ('0129', '0505', '1006'),
+  2026: ('0217', '0524', '0925'),
+  2027: ('0207', '0513', '0915'),
+  2028: ('0127', '0502', '1003'),
+  2029: ('0213', '0520', '0922'),
+  2030: ('0203', '0509', '0912'),
+}
+
+# 대체공휴일 적용 시작일 (없는 공휴일은 대체공휴일 없음: 1월1일, 현충일)
+#   설날/추석 : 일요일 또는 다른 공휴일과 겹칠 때 (토요일은 해당 없음)
+#   나머지    : 토요일/일요일 또는 다른 공휴일과 겹칠 때
+SUBSTITUTE_SINCE = {
+  '설날': date(2014, 1, 1),
+  '추석': date(2014, 1, 1),
+  '어린이날': date(2014, 1, 1),
+  '삼일절': date(2021, 8, 4),
+  '광복절': date(2021, 8, 4),
+  '개천절': date(2021, 8, 4),
+  '한글날': date(2021, 8, 4),
+  '부처님오신날': date(2023, 5, 4),
+  '기독탄신일': date(2023, 5, 4),
+}
+SUNDAY_ONLY_SUBSTITUTE = ('설날', '추석')
+
+WEEKDAY_KR = ['월', '화', '수', '목', '금', '토', '일']
+
+_locks_guard = threading.Lock()
+_year_locks = {}
+
+def _year_lock(year):
+  """같은 연도를 동시에 요청하면 API 는 한 번만 호출"""
+  with _locks_guard:
+    return _year_locks.setdefault(year, threading.Lock())
+
+def _cache_path(year):
+  return os.path.join(setting.JSON_HOLIDAY_CACHE_FOLDER_PATH, f"{year}.json")
+
+def _read_cache(year):
+  path = _cache_path(year)
+  if not os.path.exists(path):
+    return None
+  try:
+    with open(path, "r", encoding="utf-8") as f:
+      return json.load(f)
+  except Exception as e:
+    print(f"공휴일 캐시 읽기 오류 ({year}): {e}")
+    return None
+
+def _write_cache(year, fetched_at, result):
+  FileWriter.atomic_write(_cache_path(year), json.dumps({"fetchedAt": fetched_at, "result": result}, ensure_ascii=False))
+
+def _is_fresh(year, cached):
+  if year < datetime.now().year:
+    return True
+  return time.time() - cached["fetchedAt"] < setting.HOLIDAY_CACHE_TTL_DAYS * 86400
+
+def _with_cache_info(result, source, fetched_at=None):
+  result["cache"] = {
+    "source": source,
+    "fetchedAt": datetime.fromtimestamp(fetched_at).strftime("%Y-%m-%d %H:%M:%S") if fetched_at else None,
+    "ageSeconds": int(time.time() - fetched_at) if fetched_at else None
+  }
+  return result
+
+def _base_holidays(year):
+  """대체공휴일을 뺀 (날짜, 이름) 목록"""
+  entries = [(date(year, month, day), name) for (month, day), name in SOLAR_HOLIDAYS]
+
+  lunar = LUNAR_HOLIDAYS.get(year)
+  if lunar is not None:
+    seollal, buddha, chuseok = (date(year, int(text[:2]), int(text[2:])) for text in lunar)
+    entries += [(seollal + timedelta(days=offset), '설날') for offset in (-1, 0, 1)]
+    entries.append((buddha, '부처님오신날'))
+    entries += [(chuseok + timedelta(days=offset), '추석') for offset in (-1, 0, 1)]
+
+  return entries
+
+def _lost_count(day, names):
+  """그 날짜에서 쉬지 못하게 된 (대체공휴일이 생기는) 공휴일 수"""
+  eligible = [name for name in names if name in SUBSTITUTE_SINCE and day >= SUBSTITUTE_SINCE[name]]
+  if day.weekday() == 6:
+    return len(eligible)
+  if day.weekday() == 5:
+    return len([name for name in eligible if name not in SUNDAY_ONLY_SUBSTITUTE])
+  return min(len(names) - 1, len(eligible))
+
+def _substitute_holidays(entries):
+  """겹친 날짜 다음의 첫 번째 평일 비공휴일을 대체공휴일로 지정 (설날/추석은 연휴가 끝난 뒤)"""
+  by_date = {}
+  for day, name in entries:
+    by_date.setdefault(day, []).append(name)
+
+  taken = set(by_date)
+  substitutes = []
+  for day in sorted(by_date):
+    for _ in range(_lost_count(day, by_date[day])):
+      candidate = day + timedelta(days=1)
+      while candidate.weekday() >= 5 or candidate in taken:
+        candidate += timedelta(days=1)
+      taken.add(candidate)
+      substitutes.append(candidate)
+
+  return substitutes
+
+def _holiday_item(day, name):
+  """crawl_monthly_holidays 결과와 같은 형식의 공휴일 항목"""
+  return {
+    'date_code': day.strftime('%Y%m%d'),
+    'date_name': name,
+    'is_holiday': 'Y',
+    'year': day.year,
+    'month': day.month,
+    'year_month': f"{day.year}-{day.month:02d}",
+    'formatted_date': day.strftime('%Y-%m-%d'),
+    'weekday': day.strftime('%A'),
+    'weekday_kr': WEEKDAY_KR[day.weekday()]
+  }
+
+def CalculateHolidays(year, months=None):
+  """로컬 계산 공휴일 목록 (months 를 주면 해당 월만)"""
+  entries = _base_holidays(year)
+  entries += [(day, '대체공휴일') for day in _substitute_holidays(entries)]
+
+  items = [_holiday_item(day, name) for day, name in entries if day.year == year and (months is None or day.month in months)]
+  items.sort(key=lambda x: x['date_code'])
+  return items
+
+def LocalHolidayResult(year):
+  """로컬 계산만으로 만든 연간 결과 (getKoreanHolidays 와 같은 형식)"""
+  result = WebCrawling.summarizeKoreanHolidays(year, CalculateHolidays(year), list(range(1, 13)), [], method="로컬 계산 (양력 고정 공휴일 + 음력 표 + 대체공휴일 규칙)")
+  if year not in LUNAR_HOLIDAYS:
+    result["warnings"] = f"{year}년 음력 공휴일 표가 없어 설날/부처님오신날/추석이 빠져 있습니다."
+  return result
+
+def _fill_failed_months(year, fetched):
+  """일부 월만 받은 결과의 실패한 월을 로컬 계산으로 채움"""
+  failed_months = fetched.get("failed_months", [])
+  holidays = fetched.get("holidays", []) + CalculateHolidays(year, failed_months)
+  result = WebCrawling.summarizeKoreanHolidays(year, holidays, fetched.get("successful_months", []), [], method=f"{fetched.get('method')} + 로컬 계산")
+  result["warnings"] = f"{len(failed_months)}개월은 로컬 계산으로 채움: {failed_months}"
+  return result
+
+def _resolve(year, cached, fetched):
+  """API 결과로 캐시를 갱신하거나, 실패했으면 이전 캐시 -> 부분 결과 + 로컬 계산 -> 로컬 계산 순으로 대체"""
+  if fetched.get("success", False) and not fetched.get("failed_months"):
+    fetched_at = time.time()
+    try:
+      _write_cache(year, fetched_at, fetched)
+    except Exception as e:
+      print(f"공휴일 캐시 저장 오류 ({year}): {e}")
+    return _with_cache_info(fetched, 'api', fetched_at)
+
+  if cached is not None:
+    return _with_cache_info(cached["result"], 'stale_cache', cached["fetchedAt"])
+  if fetched.get("success", False):
+    return _with_cache_info(_fill_failed_months(year, fetched), 'partial_api')
+  return _with_cache_info(LocalHolidayResult(year), 'local')
+
+def GetKoreanHolidays(year=None, refresh=False):
+  """연간 공휴일 - 캐시 -> API -> 이전 캐시 -> 로컬 계산 순으로 사용"""
+  if year is None:
+    year = datetime.now().year
+
+  with _year_lock(year):
+    cached = _read_cache(year)
+    if cached is not None and not refresh and _is_fresh(year, cached):
+      return _with_cache_info(cached["result"], 'cache', cached["fetchedAt"])
+
+    return _resolve(year, cached, WebCrawling.getKoreanHolidays(year))
+
+async def GetKoreanHolidaysAsync(year=None, refresh=False):
+  """GetKoreanHolidays 의 비동기 버전 (12개월을 AsyncCrawler 로 동시에 수집, 같은 연도 동시 요청은 한 번만 수집)"""
+  if year is None:
+    year = datetime.now().year
+
+  cached = await asyncio.to_thread(_read_cache, year)
+  if cached is not None and not refresh and _is_fresh(year, cached):
+    return _with_cache_info(cached["result"], 'cache', cached["fetchedAt"])
+
+  fetched = await AsyncCrawler.single_flight(('korean_holidays', year), lambda: AsyncCrawler.get_korean_holidays(year))
+  # 같은 결과를 여러 요청이 함께 받으므로 복사본에 캐시 정보를 붙임
+  return await asyncio.to_thread(_resolve, year, cached, json.loads(json.dumps(fetched)))
+
+def test_local_holidays():
+  """로컬 계산의 대체공휴일이 발표된 날짜와 같은지 확인"""
+  expected = {
+    2022: ['20220912', '20221010'],
+    2023: ['20230124', '20230529'],
+    2024: ['20240212', '20240506'],
+    2025: ['20250303', '20250506', '20251008'],
+    2026: ['20260302', '20260525', '20260817', '20261005'],
+  }
+  for year, dates in expected.items():
+    substitutes = [h['date_code'] for h in CalculateHolidays(year) if h['date_name'] == '대체공휴일']
+    print(f"{year}년 대체공휴일: {substitutes} {'OK' if substitutes == dates else f'(기대값 {dates})'}")
+    print(f"  전체 {len(CalculateHolidays(year))}일")
+
+if __name__ == "__main__":
+  test_local_holidays()
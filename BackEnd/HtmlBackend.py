@@ -0,0 +1,157 @@
+import re
+from bs4 import BeautifulSoup, UnicodeDammit
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:  # selectolax 가 없으면 lxml 또는 html.parser 사용
+    SelectolaxParser = None
+
+try:
+    import lxml.html, lxml.etree
+except ImportError:
+    lxml = None
+
+# [HTML 파서 선택]
+# 정적 크롤링(Signal.bz)에서 HTML 파싱과 CSS 선택자 조회를 C 기반 파서로 처리 (설정: setting.SIGNAL_HTML_PARSER)
+#   'selectolax'  : selectolax(lexbor) - 파싱/선택자 조회 모두 C, 설치되어 있을 때만
+#   'lxml'        : lxml.html 트리 - class 가 있는 요소를 한 번만 모아두고 선택자마다 그 목록에서 골라냄
+#                   (선택자마다 트리 전체를 다시 훑지 않음, 지원 선택자는 아래 _SIMPLE_SELECTOR 형식)
+#   'html.parser' : 기존 BeautifulSoup(html.parser) - 순수 파이썬, 다른 파서가 없을 때
+#   'auto'        : 설치된 것 중 위 순서대로
+# 모든 문서 객체는 같은 메서드를 제공 : select(선택자), select_one(선택자), text(요소), descendants(요소, 태그 목록 - 문서 순서)
+#   text 는 BeautifulSoup 의 get_text(strip=True) 와 같음 (하위 텍스트를 각각 strip 해서 이어붙임, <script>/<style> 내용은 제외)
+
+BACKENDS = ('selectolax', 'lxml', 'html.parser')
+
+# 크롤러가 쓰는 단순 선택자 형식 : .클래스 / [class*="값"] / 태그[class*="값"]
+_SIMPLE_SELECTOR = re.compile(r'^([a-z0-9]*)(?:\.([\w-]+)|\[class\*="([^"]+)"\])$')
+
+def available_backends():
+    backends = []
+    if SelectolaxParser is not None:
+        backends.append('selectolax')
+    if lxml is not None:
+        backends.append('lxml')
+    backends.append('html.parser')
+    return backends
+
+def resolve_backend(name='auto'):
+    """설정 이름 -> 실제로 사용할 파서 (설치되지 않은 파서를 지정하면 ValueError)"""
+    if name == 'auto':
+        return available_backends()[0]
+    if name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 HTML 파서입니다: {name} (사용 가능: {', '.join(BACKENDS)})")
+    if name not in available_backends():
+        raise ValueError(f"{name} 파서가 설치되어 있지 않습니다.")
+    return name
+
+def _parse_selector(selector):
+    """선택자 -> (태그 또는 '', 클래스 이름 또는 None, class 에 포함될 값 또는 None)"""
+    match = _SIMPLE_SELECTOR.match(selector)
+    if match is None:
+        raise ValueError(f"lxml 파서에서 지원하지 않는 선택자입니다: {selector}")
+    return match.groups()
+
+if lxml is not None:
+    _CLASSED_ELEMENTS = lxml.etree.XPath('descendant-or-self::*[@class]')
+    # BeautifulSoup 처럼 <script>/<style> 안의 텍스트는 빼고 조회
+    _VISIBLE_TEXTS = lxml.etree.XPath('.//text()[not(ancestor::script or ancestor::style)]')
+
+def _decode(content):
+    """bytes 면 문자열로 (UTF-8 이 아니면 BeautifulSoup 과 같은 방식으로 인코딩 추정)"""
+    if isinstance(content, str):
+        return content
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        return UnicodeDammit(content, is_html=True).unicode_markup
+
+class SoupDocument:
+    label = 'BeautifulSoup'
+
+    def __init__(self, content):
+        self.soup = BeautifulSoup(content, 'html.parser')
+
+    def select(self, selector):
+        return self.soup.select(selector)
+
+    def select_one(self, selector):
+        return self.soup.select_one(selector)
+
+    def text(self, element):
+        return element.get_text(strip=True)
+
+    def descendants(self, element, tags):
+        return element.find_all(tags)
+
+class LxmlDocument:
+    label = 'lxml'
+
+    def __init__(self, content):
+        self.root = lxml.html.document_fromstring(_decode(content))
+        self._classed = None
+
+    def _classed_elements(self):
+        """[(요소, class 원문, 앞뒤 공백을 붙인 정리된 class)] 문서 순서 (처음 조회할 때 한 번만 생성)"""
+        if self._classed is None:
+            self._classed = [(element, element.get('class'), f" {' '.join(element.get('class').split())} ") for element in _CLASSED_ELEMENTS(self.root)]
+        return self._classed
+
+    def _matches(self, selector):
+        tag, class_name, class_part = _parse_selector(selector)
+        if class_name:
+            token = f" {class_name} "
+            return (element for element, _, padded in self._classed_elements() if token in padded and (not tag or element.tag == tag))
+        return (element for element, raw, _ in self._classed_elements() if class_part in raw and (not tag or element.tag == tag))
+
+    def select(self, selector):
+        return list(self._matches(selector))
+
+    def select_one(self, selector):
+        return next(self._matches(selector), None)
+
+    def text(self, element):
+        return ''.join(part.strip() for part in _VISIBLE_TEXTS(element))
+
+    def descendants(self, element, tags):
+        return list(element.iterdescendants(*tags))
+
+def _walk_selectolax(node):
+    """node 의 하위 노드를 문서 순서(깊이 우선)로"""
+    child = node.child
+    while child is not None:
+        yield child
+        yield from _walk_selectolax(child)
+        child = child.next
+
+class SelectolaxDocument:
+    label = 'selectolax'
+
+    def __init__(self, content):
+        self.tree = SelectolaxParser(content)
+        # text(deep=True) 는 <script>/<style> 내용도 포함하므로 파싱 직후 제거 (BeautifulSoup 과 같은 결과)
+        self.tree.strip_tags(['script', 'style'])
+
+    def select(self, selector):
+        return self.tree.css(selector)
+
+    def select_one(self, selector):
+        return self.tree.css_first(selector)
+
+    def text(self, element):
+        return element.text(deep=True, separator='', strip=True)
+
+    def descendants(self, element, tags):
+        # css('div, span, ...') 는 문서 순서를 보장하지 않으므로 직접 깊이 우선으로 순회 (검색어 순위 순서 유지)
+        wanted = set(tags)
+        return [node for node in _walk_selectolax(element) if node.tag in wanted]
+
+_DOCUMENT_CLASSES = {
+    'selectolax': SelectolaxDocument,
+    'lxml': LxmlDocument,
+    'html.parser': SoupDocument,
+}
+
+def parse(content, backend='auto'):
+    """HTML(bytes 또는 str)을 파싱한 문서 객체"""
+    return _DOCUMENT_CLASSES[resolve_backend(backend)](content)
@@ -0,0 +1,126 @@
+import threading, time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import setting, HttpFixture
+
+# [공용 HTTP 클라이언트]
+# 외부 호스트(Signal.bz, 제로인, FnGuide, 공공데이터포털, 네이버, 카카오)마다 requests.Session 하나를 만들어 재사용
+# 같은 호스트로 가는 요청은 연결 풀의 keep-alive 연결을 그대로 쓰므로 TLS 핸드셰이크를 매번 하지 않음
+#   - 연결 풀 크기 : HTTP_POOL_MAXSIZE
+#   - 재시도      : GET/HEAD 만 HTTP_RETRY_TOTAL 회, 지수 백오프(HTTP_RETRY_BACKOFF), 429/5xx 와 연결 오류 대상
+#                  (카카오 메시지 전송 같은 POST 는 중복 전송을 막기 위해 재시도하지 않음)
+#   - 타임아웃    : HTTP_HOST_TIMEOUTS 에 호스트별 (연결, 읽기) 초, 없으면 HTTP_DEFAULT_TIMEOUT
+#                  호출할 때 timeout 을 넘기면 그 값을 사용
+#   - 요청 속도    : HTTP_HOST_RATE_LIMITS 에 있는 호스트는 토큰 버킷(초당 토큰 수, 최대 누적)으로 요청 간격 제한
+#                  여러 스레드가 동시에 요청해도 호스트 전체 요청 속도는 설정값을 넘지 않음
+#   - 녹화/재생    : HTTP_FIXTURE_MODE 가 'record' 면 응답을 파일로 저장, 'replay' 면 저장된 응답만 사용 (HttpFixture)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_sessions = {}
+_rate_limiters = {}
+_sessions_lock = threading.Lock()
+
+class TokenBucket:
+    """초당 rate 개씩 토큰이 차고 최대 capacity 개까지 쌓이는 버킷 - acquire 는 토큰이 생길 때까지 대기"""
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+    def reserve(self):
+        """토큰 하나를 미리 가져가고 사용 가능해질 때까지 기다려야 할 초 반환 (비동기 호출용 - 대기는 호출하는 쪽에서)"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+def _host_of(url):
+    return urlsplit(url).netloc.lower()
+
+def _create_session():
+    retry = Retry(
+        total=setting.HTTP_RETRY_TOTAL,
+        backoff_factor=setting.HTTP_RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False  # 마지막 응답을 그대로 돌려주고 상태 코드 처리는 호출하는 쪽에서
+    )
+    if setting.HTTP_FIXTURE_MODE == 'replay':
+        adapter = HttpFixture.ReplayAdapter()
+    else:
+        adapter_class = HttpFixture.RecordingAdapter if setting.HTTP_FIXTURE_MODE == 'record' else HTTPAdapter
+        adapter = adapter_class(
+            pool_connections=1,
+            pool_maxsize=setting.HTTP_POOL_MAXSIZE,
+            max_retries=retry
+        )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def get_session(url):
+    """url 의 호스트 전용 세션 (없으면 생성)"""
+    host = _host_of(url)
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _sessions[host] = _create_session()
+        return session
+
+def get_rate_limiter(url):
+    """호스트별 토큰 버킷 (속도 제한이 없는 호스트이거나 재생 모드면 None)"""
+    host = _host_of(url)
+    limit = setting.HTTP_HOST_RATE_LIMITS.get(host)
+    if limit is None or setting.HTTP_FIXTURE_MODE == 'replay':
+        return None
+    with _sessions_lock:
+        limiter = _rate_limiters.get(host)
+        if limiter is None:
+            limiter = _rate_limiters[host] = TokenBucket(*limit)
+        return limiter
+
+def get_timeout(url):
+    return setting.HTTP_HOST_TIMEOUTS.get(_host_of(url), setting.HTTP_DEFAULT_TIMEOUT)
+
+def request(method, url, **kwargs):
+    """호스트별 세션으로 요청 (timeout 을 주지 않으면 호스트별 기본값)"""
+    kwargs.setdefault('timeout', get_timeout(url))
+    limiter = get_rate_limiter(url)
+    if limiter is not None:
+        limiter.acquire()
+    return get_session(url).request(method, url, **kwargs)
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
+
+def close_all():
+    """모든 세션의 연결 풀 정리 (서버 종료 시)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
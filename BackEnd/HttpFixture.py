@@ -0,0 +1,115 @@
+import os, json, base64, hashlib, re, time
+from contextlib import contextmanager
+from urllib.parse import urlsplit, parse_qsl, urlencode
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+import setting, FileWriter, HttpClient
+
+# [HTTP 녹화/재생]
+# 외부 사이트 응답을 파일로 저장해 두고(녹화) 같은 요청에 저장된 응답을 돌려줌(재생) - 오프라인 테스트, 파싱 벤치마크용
+#   - HttpClient 세션에 붙는 전송 어댑터로 동작하므로 크롤러 코드는 그대로 (AsyncCrawler 도 이 모드에서는 HttpClient 세션 사용)
+#   - 모드 : setting.HTTP_FIXTURE_MODE (None / 'record' / 'replay'), 코드에서는 with fixture_mode('replay'): ...
+#   - 파일 : HTTP_FIXTURE_FOLDER_PATH/{호스트}/{메서드}_{경로 끝}_{요청 해시}.json
+#            {"method", "url", "status", "reason", "headers", "encoding", "recordedAt", "body" 또는 "bodyBase64"}
+#   - 요청 구분 = 메서드 + 호스트 + 경로 + 정렬한 쿼리 파라미터 (HTTP_FIXTURE_IGNORED_PARAMS 는 빼고, 저장 파일에도 남기지 않음)
+#   - 재생 모드에서 저장된 응답이 없으면 requests.ConnectionError (실제 사이트로 나가지 않음), 호스트별 요청 속도 제한도 적용하지 않음
+
+SAVED_HEADERS = ('Content-Type',)
+
+def _normalized_url(url):
+    """무시할 파라미터를 빼고 쿼리를 정렬한 url"""
+    parts = urlsplit(url)
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key not in setting.HTTP_FIXTURE_IGNORED_PARAMS)
+    return parts._replace(query=urlencode(query), fragment='').geturl()
+
+def fixture_path(method, url):
+    """요청(method, 쿼리 포함 url)에 해당하는 fixture 파일 경로"""
+    normalized = _normalized_url(url)
+    parts = urlsplit(normalized)
+    digest = hashlib.sha1(f"{method.upper()} {normalized}".encode('utf-8')).hexdigest()[:12]
+    tail = re.sub(r'[^0-9A-Za-z._-]+', '_', parts.path.rstrip('/').rsplit('/', 1)[-1]) or 'root'
+    return os.path.join(setting.HTTP_FIXTURE_FOLDER_PATH, parts.netloc.lower(), f"{method.upper()}_{tail}_{digest}.json")
+
+def prepared_url(url, params=None):
+    """requests 가 실제로 보내는 url (params 포함)"""
+    return requests.Request('GET', url, params=params).prepare().url
+
+def save(method, url, response):
+    """응답을 fixture 파일로 저장 (본문은 압축을 푼 상태로)"""
+    content = response.content
+    fixture = {
+        "method": method.upper(),
+        "url": _normalized_url(url),
+        "status": response.status_code,
+        "reason": response.reason,
+        "headers": {name: response.headers[name] for name in SAVED_HEADERS if name in response.headers},
+        "encoding": response.encoding,
+        "recordedAt": time.strftime("%Y-%m-%d %H:%M:%S")
+    }
+    try:
+        fixture["body"] = content.decode('utf-8')
+    except UnicodeDecodeError:
+        fixture["bodyBase64"] = base64.b64encode(content).decode('ascii')
+
+    path = fixture_path(method, url)
+    FileWriter.atomic_write(path, json.dumps(fixture, ensure_ascii=False))
+    return path
+
+def load(method, url, request=None):
+    """저장된 응답을 requests.Response 로 (없으면 None)"""
+    path = fixture_path(method, url)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        fixture = json.load(f)
+
+    response = requests.Response()
+    response.status_code = fixture["status"]
+    response.reason = fixture.get("reason")
+    response.headers = CaseInsensitiveDict(fixture.get("headers", {}))
+    response.encoding = fixture.get("encoding")
+    response._content = fixture["body"].encode('utf-8') if "body" in fixture else base64.b64decode(fixture["bodyBase64"])
+    response.url = url
+    response.request = request
+    return response
+
+def load_get(url, params=None):
+    """GET 요청의 저장된 응답 (벤치마크처럼 세션 없이 바로 읽을 때)"""
+    return load('GET', prepared_url(url, params))
+
+class RecordingAdapter(HTTPAdapter):
+    """실제로 요청하고 응답을 fixture 로 저장 (재시도/연결 풀 설정은 HTTPAdapter 그대로)"""
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        try:
+            save(request.method, request.url, response)
+        except Exception as e:
+            print(f"HTTP 응답 저장 오류 ({request.url}): {e}")
+        return response
+
+class ReplayAdapter(BaseAdapter):
+    """저장된 응답만 돌려줌 (없으면 requests.ConnectionError)"""
+    def send(self, request, **kwargs):
+        response = load(request.method, request.url, request)
+        if response is None:
+            raise requests.ConnectionError(f"저장된 응답이 없습니다: {request.method} {_normalized_url(request.url)} ({fixture_path(request.method, request.url)})", request=request)
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+@contextmanager
+def fixture_mode(mode, folder=None):
+    """with 블록 동안 녹화('record') / 재생('replay') 모드 (HttpClient 세션을 새로 만들고 끝나면 원래대로)"""
+    previous = (setting.HTTP_FIXTURE_MODE, setting.HTTP_FIXTURE_FOLDER_PATH)
+    setting.HTTP_FIXTURE_MODE = mode
+    if folder is not None:
+        setting.HTTP_FIXTURE_FOLDER_PATH = folder
+    HttpClient.close_all()
+    try:
+        yield
+    finally:
+        setting.HTTP_FIXTURE_MODE, setting.HTTP_FIXTURE_FOLDER_PATH = previous
+        HttpClient.close_all()
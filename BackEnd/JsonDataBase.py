@@ -1,179 +1,250 @@
-import os, setting, json
+import os, setting, json, gzip, threading
+import PriceCache, Storage
+import numpy as np
 from datetime import datetime
 
+# 실제 저장 위치/형식은 Storage 에서 선택된 저장소(setting.STORAGE_BACKEND)가 결정
+
 def ReadHistoryJsonFile():
-  if not os.path.exists(setting.JSON_HISTORY_PATH):
-    return {}
+  """매수 이력 문서 조회"""
   try:
-    with open(setting.JSON_HISTORY_PATH, "r", encoding="utf-8") as f:
-      data = json.load(f)
-    return data
+    return Storage.history().read()[0]
   except Exception as e:
     return {}
-  
-def SaveHistoryJsonFile(data):
+
+def ReadHistoryWithVersion():
+  """매수 이력 문서와 현재 버전 (저장/패치 시 baseVersion 으로 사용)"""
+  return Storage.history().read()
+
+def SaveHistoryJsonFile(data, base_version=None):
+  """문서 전체 저장 후 이 저장으로 만들어진 새 버전 반환 - base_version 이 현재 버전과 다르면 HistoryVersionConflict, 저장 실패는 예외 그대로"""
+  return Storage.history().replace(data, base_version)
+
+def PatchHistoryJsonFile(ops, base_version):
+  """종목 단위 upsert/delete 작업만 저널에 추가하고 새 버전 반환"""
+  return Storage.history().patch(ops, base_version)
+
+def _to_number(value):
   try:
-    # JSON 포맷을 txt 파일로 저장
-    with open(setting.JSON_HISTORY_PATH, "w", encoding="utf-8") as f:
-      json.dump(data, f, ensure_ascii=False, indent=2)
-    return True
-  except Exception as e:
-    return False
+    return float(value)
+  except (TypeError, ValueError):
+    return 0.0
 
-def ReadAnalyzeJsonFile():
-  nowDate = str(datetime.today().year) + '-' + str(datetime.today().month) + '-' + str(datetime.today().day) + '.txt'
-  today_analyze_file_path = setting.JSON_ANALYZE_FOLDER_PATH + '/' + nowDate
+def GetPortfolioValuation(section="virtualInvestItemObject"):
+  """매수 이력을 한 번 읽고 보유 종목 종가를 한 번에 조회해 종목별/전체 평가 손익 계산
+  손익 계산은 화면과 같은 방식: 보유 수량이 있으면 종가 * 수량 - 매수 금액, 없으면 -매수 금액
+  종가 조회에 실패한 종목은 이력에 저장된 todayAmount 로 평가 (priceSource: 'history')"""
+  history, version = Storage.history().read()
+  holdings = history.get(section, {})
+  prices = PriceCache.GetLatestCloses(list(holdings.keys()))
 
-  if not os.path.exists(today_analyze_file_path):
-    return []
+  positions = []
+  total_cost = 0.0
+  total_value = 0.0
+  for code, item in holdings.items():
+    shares = _to_number(item.get("totalShares"))
+    cost = _to_number(item.get("haveAmount"))
+    price = prices.get(code)
+
+    if price is not None:
+      close, close_date, price_source = price["close"], price["date"], 'market'
+    else:
+      close, close_date, price_source = _to_number(item.get("todayAmount")), None, 'history'
+
+    market_value = close * shares if shares > 0 else 0.0
+    profit_loss = market_value - cost
+    total_cost += cost
+    total_value += market_value
+
+    positions.append({
+      "code": code,
+      "name": item.get("name"),
+      "shares": shares,
+      "costAmount": cost,
+      "avgPrice": round(cost / shares, 2) if shares > 0 else None,
+      "close": close,
+      "closeDate": close_date,
+      "priceSource": price_source,
+      "marketValue": market_value,
+      "profitLoss": profit_loss,
+      "profitLossRate": round(profit_loss / cost * 100, 2) if cost else 0.0
+    })
+
+  total_profit_loss = total_value - total_cost
+  return {
+    "section": section,
+    "version": version,
+    "positions": positions,
+    "totalCost": total_cost,
+    "totalMarketValue": total_value,
+    "totalProfitLoss": total_profit_loss,
+    "totalProfitLossRate": round(total_profit_loss / total_cost * 100, 2) if total_cost else 0.0
+  }
+
+def ReadAnalyzeJsonFile():
   try:
-    with open(today_analyze_file_path, "r", encoding="utf-8") as f:
-      data = json.load(f)
-    return data
+    return Storage.analysis().load(Storage.today_date_text()) or []
   except Exception as e:
     return []
 
 def ReadLatestAnalyzeJsonFile():
-  """Today_Analyze 폴더에서 가장 최신 분석 파일을 찾아서 데이터와 날짜를 반환"""
+  """가장 최신 분석 결과의 데이터와 날짜를 반환"""
   try:
-    if not os.path.exists(setting.JSON_ANALYZE_FOLDER_PATH):
+    latest = Storage.analysis().latest()
+    if latest is None:
       return {"data": [], "date": None}
-    
-    # 폴더 내 모든 .txt 파일 찾기
-    txt_files = []
-    for entry in os.scandir(setting.JSON_ANALYZE_FOLDER_PATH):
-      if entry.is_file() and entry.name.endswith('.txt'):
-        txt_files.append(entry.name)
-    
-    if not txt_files:
-      return {"data": [], "date": None}
-    
-    # 파일명을 날짜순으로 정렬 (가장 최신이 마지막)
-    txt_files.sort()
-    latest_file = txt_files[-1]
-    
-    # 파일명에서 날짜 추출 (예: 2024-1-15.txt -> 2024-1-15)
-    analyze_date = latest_file.replace('.txt', '')
-    
-    # 파일 내용 읽기
-    latest_file_path = os.path.join(setting.JSON_ANALYZE_FOLDER_PATH, latest_file)
-    with open(latest_file_path, "r", encoding="utf-8") as f:
-      data = json.load(f)
-    
+
+    analyze_date, data = latest
     return {"data": data, "date": analyze_date}
     
   except Exception as e:
     print(f"ReadLatestAnalyzeJsonFile 오류: {e}")
     return {"data": [], "date": None}
 
+# [최신 분석 결과 응답 캐시]
+# /get_today_analyze/ 응답을 미리 인코딩한 JSON 바이트(와 gzip 바이트)로 보관
+# 저장소의 최신 분석 revision (파일 저장소는 최신 파일의 경로, 수정시각, 크기) 이 같으면 파싱/검증/인코딩 없이 그대로 반환
+# SaveAnalyzeJsonFile 저장 시 무효화
+# 조건 조회용 컬럼 인덱스(index)도 같은 키로 캐시하여 처음 조건 조회할 때 한 번만 생성
+_analyze_response_cache = {"key": None, "body": None, "gzip": None, "date": None, "index": None}
+_analyze_cache_lock = threading.Lock()
+
+def _encode_analyze_response(data, date):
+  body = json.dumps({"data": data, "date": date}, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+  gzip_body = gzip.compress(body, compresslevel=6) if setting.ANALYZE_RESPONSE_GZIP else None
+  return body, gzip_body
+
+def _load_latest_analyze_cache():
+  """최신 분석 결과가 바뀌었으면 캐시를 다시 채우고 캐시를 반환 (_analyze_cache_lock 안에서 호출)"""
+  store = Storage.analysis()
+  cache_key = store.revision()
+  if cache_key is None:
+    body, gzip_body = _encode_analyze_response([], None)
+    return {"key": None, "body": body, "gzip": gzip_body, "date": None, "index": None}
+
+  if _analyze_response_cache["key"] != cache_key:
+    analyze_date, data = store.latest()
+    body, gzip_body = _encode_analyze_response(data, analyze_date)
+    _analyze_response_cache.update({"key": cache_key, "body": body, "gzip": gzip_body, "date": analyze_date, "index": None})
+
+  return _analyze_response_cache
+
+def GetLatestAnalyzeResponse():
+  """최신 분석 결과 응답 바이트를 반환 {"body": JSON 바이트, "gzip": gzip 바이트 또는 None}"""
+  try:
+    # 캐시 dict 는 다른 요청이 갱신할 수 있으므로 잠금 안에서 같은 revision 의 body/gzip 을 새 dict 로 복사해 반환
+    with _analyze_cache_lock:
+      cache = _load_latest_analyze_cache()
+      return {"body": cache["body"], "gzip": cache["gzip"]}
+
+  except Exception as e:
+    print(f"GetLatestAnalyzeResponse 오류: {e}")
+    body, gzip_body = _encode_analyze_response([], None)
+    return {"body": body, "gzip": gzip_body}
+
+def InvalidateAnalyzeCache():
+  with _analyze_cache_lock:
+    _analyze_response_cache.update({"key": None, "body": None, "gzip": None, "date": None, "index": None})
+
+# [분석 결과 컬럼 인덱스]
+# 조건 조회에 쓰는 필드만 numpy 배열로 모아두고 조건마다 마스크를 AND 하여 한 번에 거름
+ANALYZE_BOOL_FIELDS = ['isOverGoldenCross', 'isNearGoldenCross', 'isNearLowerBand', 'isGoodTotalScore']
+
+def BuildAnalyzeIndex(rows):
+  return {
+    "rows": rows,
+    "rank": np.array([row.get('rank', 0) for row in rows], dtype=np.int64),
+    "totalScore": np.array([row.get('totalScore', 0) for row in rows], dtype=np.float64),
+    "stockBuyLevel": np.array([row.get('stockBuyLevel', '') for row in rows], dtype=object),
+    **{field: np.array([bool(row.get(field, False)) for row in rows], dtype=bool) for field in ANALYZE_BOOL_FIELDS},
+    "fields": set(key for row in rows[:1] for key in row)
+  }
+
+def QueryLatestAnalyze(rank_from=None, rank_to=None, buy_levels=None, bool_filters=None, min_total_score=None, fields=None, offset=0, limit=None):
+  """최신 분석 결과를 조건으로 걸러서 {"data", "date", "totalCount"} 로 반환 (totalCount 는 페이지 적용 전 건수)"""
+  with _analyze_cache_lock:
+    cache = _load_latest_analyze_cache()
+    if cache["key"] is None:
+      return {"data": [], "date": None, "totalCount": 0}
+    if cache["index"] is None:
+      cache["index"] = BuildAnalyzeIndex(json.loads(cache["body"])["data"])
+    index = cache["index"]
+    analyze_date = cache["date"]
+
+  if fields:
+    unknown_fields = [field for field in fields if field not in index["fields"]]
+    if unknown_fields:
+      raise ValueError(f"존재하지 않는 필드입니다: {unknown_fields}")
+
+  mask = np.ones(len(index["rows"]), dtype=bool)
+  if rank_from is not None:
+    mask &= index["rank"] >= rank_from
+  if rank_to is not None:
+    mask &= index["rank"] <= rank_to
+  if buy_levels:
+    mask &= np.isin(index["stockBuyLevel"], list(buy_levels))
+  if min_total_score is not None:
+    mask &= index["totalScore"] >= min_total_score
+  for field, value in (bool_filters or {}).items():
+    if value is not None:
+      mask &= index[field] == value
+
+  matched = np.flatnonzero(mask)
+  page = matched[max(offset, 0):] if limit is None else matched[max(offset, 0):max(offset, 0) + limit]
+
+  rows = index["rows"]
+  if fields:
+    data = [{field: rows[i][field] for field in fields if field in rows[i]} for i in page]
+  else:
+    data = [rows[i] for i in page]
+
+  return {"data": data, "date": analyze_date, "totalCount": int(len(matched))}
+
 def ReadGameScores(game_type=""):
-  """게임 스코어 데이터 조회"""
-  if not os.path.exists(setting.JSON_GAME_SCORE_PATH):
-    # 파일이 없으면 초기 구조 생성
-    initial_data = {
-      "SnakeGame": [],
-      "SpaceShootingGame": []
-    }
-    SaveGameScoreFile(initial_data)
-    return initial_data
-  
+  """게임 스코어 데이터 조회 (메모리 리더보드에서 조회)"""
   try:
-    with open(setting.JSON_GAME_SCORE_PATH, "r", encoding="utf-8") as f:
-      data = json.load(f)
-    
-    # 특정 게임 타입이 요청되면 해당 데이터만 반환
-    if game_type and game_type in data:
-      return {game_type: data[game_type]}
-    
-    return data
+    return Storage.scores().all(game_type)
   except Exception as e:
     print(f"ReadGameScores 오류: {e}")
     return {"SnakeGame": [], "SpaceShootingGame": []}
 
 def SaveGameScore(game_type, user_id, mode, score):
-  """게임 스코어 저장"""
+  """게임 스코어 저장 (파일 저장소는 메모리 리더보드에 반영 후 백그라운드에서 로그에 기록)"""
   try:
-    # 기존 데이터 읽기
-    current_data = ReadGameScores()
-    
-    # 게임 타입이 없으면 초기화
-    if game_type not in current_data:
-      current_data[game_type] = []
-    
-    # 새 스코어 데이터 생성
-    new_score = {
-      "id": user_id,
-      "mode": mode,
-      "score": score,
-      "timestamp": datetime.now().isoformat()
-    }
-    
-    # 기존 데이터에 추가
-    current_data[game_type].append(new_score)
-    
-    # 점수순으로 정렬 (내림차순)
-    current_data[game_type].sort(key=lambda x: x["score"], reverse=True)
-    
-    # 파일에 저장
-    return SaveGameScoreFile(current_data)
+    Storage.scores().add(game_type, user_id, mode, score)
+    return True
     
   except Exception as e:
     print(f"SaveGameScore 오류: {e}")
     return False
 
-def SaveGameScoreFile(data):
-  """게임 스코어 파일 저장"""
-  try:
-    # 디렉토리가 없으면 생성
-    os.makedirs(os.path.dirname(setting.JSON_GAME_SCORE_PATH), exist_ok=True)
-    
-    # JSON 포맷으로 저장
-    with open(setting.JSON_GAME_SCORE_PATH, "w", encoding="utf-8") as f:
-      json.dump(data, f, ensure_ascii=False, indent=2)
-    return True
-  except Exception as e:
-    print(f"SaveGameScoreFile 오류: {e}")
-    return False
-
 def GetGameRanking(game_type, mode="", limit=10):
   """게임 랭킹 조회 (점수 순으로 정렬된 상위 N개)"""
   try:
-    all_scores = ReadGameScores(game_type)
-    
-    if game_type not in all_scores:
-      return []
-    
-    scores = all_scores[game_type]
-    
-    # 모드가 지정되면 해당 모드만 필터링
-    if mode:
-      scores = [score for score in scores if score.get("mode", "") == mode]
-    
-    # 점수순으로 정렬 (내림차순)
-    scores.sort(key=lambda x: x.get("score", 0), reverse=True)
-    
-    # 상위 limit개만 반환
-    return scores[:limit]
+    return Storage.scores().top(game_type, mode, limit)
     
   except Exception as e:
     print(f"GetGameRanking 오류: {e}")
     return []
 
-def SaveAnalyzeJsonFile(data):
-  nowDate = str(datetime.today().year) + '-' + str(datetime.today().month) + '-' + str(datetime.today().day) + '.txt'
-  today_analyze_file_path = setting.JSON_ANALYZE_FOLDER_PATH + '/' + nowDate
-
+def GetGameScoreRank(game_type, mode, score):
+  """임의 점수의 게임/모드 내 순위와 상위 비율 조회"""
   try:
-    for entry in os.scandir(setting.JSON_ANALYZE_FOLDER_PATH):
-      if entry.is_file():
-        os.remove(entry.path)
+    return Storage.scores().rank(game_type, mode, score)
 
-    # JSON 포맷을 txt 파일로 저장
-    with open(today_analyze_file_path, "w", encoding="utf-8") as f:
-      json.dump(data, f, ensure_ascii=False, indent=2)
+  except Exception as e:
+    print(f"GetGameScoreRank 오류: {e}")
+    return None
+
+def SaveAnalyzeJsonFile(data):
+  try:
+    # 파일 저장소는 이전 날짜 파일을 보관소로 옮기고 오늘 파일을 교체
+    Storage.analysis().save(data)
+    InvalidateAnalyzeCache()
     return True
   except Exception as e:
     print(e)
+    InvalidateAnalyzeCache()
     return False
 
 # print(SaveHistoryJsonFile({}))
@@ -0,0 +1,90 @@
+import threading, time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import FinanceDataReader as fdr
+import setting
+
+# [종가 캐시]
+# 종목코드 -> 최근 종가를 PRICE_CACHE_TTL_SECONDS 동안 메모리에 보관
+# 여러 종목은 GetLatestCloses 로 한 번에 요청하면 캐시에 없는 종목만 스레드 풀에서 동시에 조회
+# 같은 종목을 동시에 요청하면 먼저 시작한 조회 결과를 함께 사용
+
+_lock = threading.Lock()
+_cache = {}        # code -> (조회 시각, {"close", "date"})
+_in_flight = {}    # code -> threading.Event
+
+def _fetch_latest_close(code):
+  """FinanceDataReader 로 최근 2주 시세를 받아 마지막 종가 반환 (없으면 None)"""
+  start_date = datetime.now() - timedelta(days=14)
+  df = fdr.DataReader(code, start_date)
+
+  # FinanceDataReader가 "LOGOUT" 문자열을 반환하는 경우 처리
+  if isinstance(df, str) or df is None or df.empty or 'Close' not in df:
+    return None
+
+  return {"close": float(df['Close'].iloc[-1]), "date": df.index[-1].strftime('%Y-%m-%d')}
+
+def _get_cached(code, now):
+  cached = _cache.get(code)
+  if cached is not None and now - cached[0] < setting.PRICE_CACHE_TTL_SECONDS:
+    return cached[1]
+  return None
+
+def _load(code):
+  """캐시에 없는 종목 하나 조회 (다른 요청이 이미 조회 중이면 그 결과를 기다림)"""
+  with _lock:
+    cached = _get_cached(code, time.time())
+    if cached is not None:
+      return cached
+    event = _in_flight.get(code)
+    owner = event is None
+    if owner:
+      event = _in_flight[code] = threading.Event()
+
+  if not owner:
+    event.wait(setting.PRICE_FETCH_TIMEOUT_SECONDS)
+    with _lock:
+      cached = _cache.get(code)
+      return cached[1] if cached is not None else None
+
+  price = None
+  try:
+    price = _fetch_latest_close(code)
+  except Exception as e:
+    print(f"종가 조회 실패 ({code}): {e}")
+  finally:
+    with _lock:
+      if price is not None:
+        _cache[code] = (time.time(), price)
+      _in_flight.pop(code, None)
+    event.set()
+
+  return price
+
+def GetLatestCloses(codes):
+  """여러 종목의 최근 종가를 한 번에 조회 -> {code: {"close", "date"} 또는 None}"""
+  codes = list(dict.fromkeys(codes))
+  now = time.time()
+
+  prices = {}
+  with _lock:
+    for code in codes:
+      prices[code] = _get_cached(code, now)
+  missing = [code for code in codes if prices[code] is None]
+
+  if missing:
+    workers = max(1, min(setting.PRICE_FETCH_MAX_WORKERS, len(missing)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+      for code, price in zip(missing, executor.map(_load, missing)):
+        prices[code] = price
+
+  return prices
+
+def InvalidatePrices(codes=None):
+  """캐시 비우기 (codes 를 지정하면 해당 종목만)"""
+  with _lock:
+    if codes is None:
+      _cache.clear()
+    else:
+      for code in codes:
+        _cache.pop(code, None)
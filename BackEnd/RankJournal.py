@@ -0,0 +1,181 @@
+import os, struct, zlib, threading
+import setting, FileWriter
+from datetime import datetime
+
+# [일별 순위 저널]
+# /save_finance_rank/ 호출마다 (날짜, 종목코드, 순위) 목록을 월별 바이너리 파일 끝에 추가만 함
+# 월별 XML 집계는 XmlDataBase.CompactRankJournal 이 저널을 접어서(fold) 갱신
+#
+# 파일 구조: [배치 헤더][레코드 * N][배치 헤더][레코드 * N] ...
+#   배치 헤더 = 매직(4) + 날짜 YYYYMMDD(uint32) + 태그(8) + 레코드 수(uint32) + payload crc32(uint32)
+#   레코드    = 종목코드(8) + 순위(uint32)
+# 마지막 배치가 쓰다가 끊긴 경우(crc 불일치/길이 부족) 해당 배치부터는 무시하고 다음 추가 시 잘라냄
+# 추가할 때는 파일별로 검증을 마친 끝 오프셋과 날짜 목록을 기억해 두고 그 뒤(다른 프로세스가 추가한 부분)만 검증
+
+JOURNAL_MAGIC = b'RJ01'
+BATCH_HEADER = struct.Struct('<4sI8sII')
+RECORD = struct.Struct('<8sI')
+
+_append_lock = threading.Lock()
+_known_names = {}
+_journal_states = {}   # 저널 경로 -> {"end": 검증한 끝 오프셋, "dates": 그때까지의 날짜값 집합}
+
+def get_journal_path(journal_dir, date):
+  """날짜 기준 월별 저널 경로 (XML 파일명과 같은 YYYY.M 규칙)"""
+  return journal_dir + '/' + str(date.year) + '.' + str(date.month) + '.bin'
+
+def _encode_field(text, size):
+  encoded = str(text).encode('ascii')
+  if len(encoded) > size:
+    raise ValueError(f"저널 필드 길이 초과 ({size}바이트): {text}")
+  return encoded
+
+def _decode_field(raw):
+  return raw.rstrip(b'\x00').decode('ascii')
+
+def ReadJournal(journal_path, start_offset=0):
+  """저널을 start_offset 부터 읽어 (다음 오프셋, 날짜, 태그, [(코드, 순위)]) 를 순서대로 반환
+  손상된 배치를 만나면 그 앞에서 멈춤"""
+  batches = []
+  if not os.path.exists(journal_path):
+    return batches
+
+  with open(journal_path, 'rb') as f:
+    f.seek(start_offset)
+    offset = start_offset
+    while True:
+      header = f.read(BATCH_HEADER.size)
+      if len(header) < BATCH_HEADER.size:
+        break
+      magic, date_value, tag, count, crc = BATCH_HEADER.unpack(header)
+      if magic != JOURNAL_MAGIC:
+        break
+      payload = f.read(count * RECORD.size)
+      if len(payload) < count * RECORD.size or zlib.crc32(payload) != crc:
+        break
+
+      records = [(_decode_field(code), rank) for code, rank in RECORD.iter_unpack(payload)]
+      offset += BATCH_HEADER.size + len(payload)
+      batches.append((offset, date_value, _decode_field(tag), records))
+
+  return batches
+
+def GetValidJournalEnd(journal_path):
+  """손상되지 않은 마지막 배치의 끝 오프셋"""
+  batches = ReadJournal(journal_path)
+  return batches[-1][0] if batches else 0
+
+def _validated_state(journal_path):
+  """저널의 손상되지 않은 끝 오프셋과 날짜 목록 (기억해 둔 위치 뒤만 새로 읽음, 파일 잠금 안에서 호출)"""
+  size = os.path.getsize(journal_path) if os.path.exists(journal_path) else 0
+  state = _journal_states.get(journal_path)
+  if state is None or state["end"] > size:
+    state = {"end": 0, "dates": set()}
+
+  for end, date_value, _, _ in ReadJournal(journal_path, state["end"]):
+    state["end"] = end
+    state["dates"].add(date_value)
+  _journal_states[journal_path] = state
+  return state
+
+def _load_names(journal_dir):
+  names_path = journal_dir + '/names.tsv'
+  if journal_dir in _known_names:
+    return _known_names[journal_dir]
+
+  names = {}
+  if os.path.exists(names_path):
+    with open(names_path, 'r', encoding='utf-8') as f:
+      for line in f:
+        parts = line.rstrip('\n').split('\t', 1)
+        if len(parts) == 2 and parts[0] not in names:
+          names[parts[0]] = parts[1]
+  _known_names[journal_dir] = names
+  return names
+
+def ReadJournalNames(journal_dir=setting.RANK_JOURNAL_KR_PATH):
+  """저널에 기록된 종목코드 -> 종목명"""
+  with _append_lock:
+    return dict(_load_names(journal_dir))
+
+def AppendDailyRanks(stock, rank_list, date=None, journal_dir=setting.RANK_JOURNAL_KR_PATH, only_if_absent=False):
+  """오늘 순위 목록을 배치 하나로 저널 끝에 추가하고 fsync
+  only_if_absent=True 면 같은 날짜 배치가 이미 있을 때 추가하지 않음 (확인과 추가를 같은 파일 잠금 안에서)"""
+  try:
+    if date is None:
+      date = datetime.today()
+    date_value = date.year * 10000 + date.month * 100 + date.day
+
+    payload = b''.join(
+      RECORD.pack(_encode_field(item['code'], 8), int(item['rank'])) for item in rank_list
+    )
+    header = BATCH_HEADER.pack(JOURNAL_MAGIC, date_value, _encode_field(stock, 8), len(rank_list), zlib.crc32(payload))
+
+    os.makedirs(journal_dir, exist_ok=True)
+    journal_path = get_journal_path(journal_dir, date)
+
+    # 다른 워커 프로세스와 동시에 추가하지 않도록 저널 파일 잠금 안에서 기록
+    with FileWriter.file_lock(journal_path), _append_lock:
+      state = _validated_state(journal_path)
+      if only_if_absent and date_value in state["dates"]:
+        return True
+
+      # 이전에 쓰다가 끊긴 배치가 있으면 잘라내고 이어서 기록
+      if os.path.exists(journal_path) and state["end"] != os.path.getsize(journal_path):
+        with open(journal_path, 'r+b') as f:
+          f.truncate(state["end"])
+
+      FileWriter.append_write(journal_path, header + payload, binary=True)
+      state["end"] += len(header) + len(payload)
+      state["dates"].add(date_value)
+
+      # 처음 보는 종목만 이름 파일에 추가 (저널 레코드에는 이름을 넣지 않음)
+      names = _load_names(journal_dir)
+      new_names = [item for item in rank_list if item['code'] not in names]
+      if new_names:
+        FileWriter.append_write(journal_dir + '/names.tsv', ''.join(
+          item['code'] + '\t' + str(item['name']).replace('\t', ' ').replace('\n', ' ') + '\n' for item in new_names
+        ))
+        for item in new_names:
+          names[item['code']] = item['name']
+
+    return True
+  except Exception as e:
+    print(f"AppendDailyRanks 오류: {e}")
+    return False
+
+def HasDailyRanks(date=None, journal_dir=setting.RANK_JOURNAL_KR_PATH):
+  """해당 날짜 배치가 이미 저널에 있는지 확인"""
+  if date is None:
+    date = datetime.today()
+  date_value = date.year * 10000 + date.month * 100 + date.day
+  return any(batch[1] == date_value for batch in ReadJournal(get_journal_path(journal_dir, date)))
+
+def _date_value_from_text(date_text):
+  """'2026-03-10' / '2026-3-10' -> 20260310"""
+  return int(datetime.strptime(str(date_text), '%Y-%m-%d').strftime('%Y%m%d'))
+
+def ReadDailyRanks(code=None, start_date=None, end_date=None, journal_dir=setting.RANK_JOURNAL_KR_PATH):
+  """저널에서 일별 순위를 읽음 (날짜 'YYYY-MM-DD' -> [{'code', 'rank'}])
+  code 를 지정하면 해당 종목의 순위만 반환"""
+  if not os.path.exists(journal_dir):
+    return {}
+
+  start_value = _date_value_from_text(start_date) if start_date else 0
+  end_value = _date_value_from_text(end_date) if end_date else 99999999
+
+  journal_files = [f for f in os.listdir(journal_dir) if f.endswith('.bin')]
+  journal_files.sort(key=lambda x: tuple(map(int, x[:-4].split('.'))))
+
+  daily_ranks = {}
+  for journal_file in journal_files:
+    for _, date_value, _, records in ReadJournal(journal_dir + '/' + journal_file):
+      if date_value < start_value or date_value > end_value:
+        continue
+      date_key = f"{date_value // 10000}-{date_value // 100 % 100:02d}-{date_value % 100:02d}"
+      daily_ranks[date_key] = [
+        {'code': record_code, 'rank': rank} for record_code, rank in records
+        if code is None or record_code == code
+      ]
+
+  return daily_ranks
@@ -0,0 +1,80 @@
+import threading, time, asyncio
+from datetime import datetime
+import setting, WebCrawling
+
+# [실시간 검색어 백그라운드 수집]
+# 요청마다 Signal.bz 를 크롤링하지 않고 백그라운드 스레드가 REALTIME_SEARCH_POLL_SECONDS 마다 수집한 스냅샷을 응답
+#   - 외부 요청 수는 사용자 수와 상관없이 (워커 프로세스 수 x 수집 주기)로 고정
+#   - 수집이 실패하면 이전 스냅샷을 그대로 두고 lastError 에 기록
+#   - 검색어 목록이 바뀐 경우에만 version 증가 (SSE 스트림은 version 이 바뀔 때만 전송)
+#   - 스레드는 첫 조회 때(또는 서버 시작 시 Start) 시작, 첫 스냅샷이 없으면 REALTIME_SEARCH_FIRST_WAIT_SECONDS 까지 대기
+
+_cond = threading.Condition()
+_snapshot = None     # {"result", "fetchedAt"(epoch), "version"}
+_version = 0
+_last_error = None
+_poll_thread = None
+
+def _poll_once():
+    global _snapshot, _version, _last_error
+    try:
+        result = WebCrawling.getRealtimeSearchTerms()
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+
+    with _cond:
+        if result.get("success", False):
+            if _snapshot is None or _snapshot["result"].get("search_terms") != result.get("search_terms"):
+                _version += 1
+            _snapshot = {"result": result, "fetchedAt": time.time(), "version": _version}
+            _last_error = None
+        else:
+            _last_error = result.get("error", "알 수 없는 오류")
+            print(f"실시간 검색어 수집 실패 (이전 스냅샷 유지): {_last_error}")
+        _cond.notify_all()
+
+def _poll_worker():
+    while True:
+        started = time.monotonic()
+        _poll_once()
+        time.sleep(max(1, setting.REALTIME_SEARCH_POLL_SECONDS - (time.monotonic() - started)))
+
+def Start():
+    """수집 스레드 시작 (이미 돌고 있으면 그대로)"""
+    global _poll_thread
+    with _cond:
+        if _poll_thread is None or not _poll_thread.is_alive():
+            _poll_thread = threading.Thread(target=_poll_worker, name='realtime-search-poller', daemon=True)
+            _poll_thread.start()
+
+def GetSnapshot(wait=True):
+    """
+    최신 스냅샷 - {"result", "version", "fetchedAt", "ageSeconds", "lastError"}
+    아직 수집된 적이 없으면 wait=True 일 때 첫 수집을 기다리고, 그래도 없으면 None
+    """
+    Start()
+    with _cond:
+        if _snapshot is None and wait:
+            _cond.wait_for(lambda: _snapshot is not None or _last_error is not None, setting.REALTIME_SEARCH_FIRST_WAIT_SECONDS)
+        if _snapshot is None:
+            return None
+        return {
+            "result": _snapshot["result"],
+            "version": _snapshot["version"],
+            "fetchedAt": datetime.fromtimestamp(_snapshot["fetchedAt"]).strftime("%Y-%m-%d %H:%M:%S"),
+            "ageSeconds": round(time.time() - _snapshot["fetchedAt"], 1),
+            "lastError": _last_error
+        }
+
+async def GetSnapshotAsync():
+    """GetSnapshot 의 비동기 버전 (첫 수집을 기다리는 동안 이벤트 루프를 막지 않고, 취소 가능)"""
+    deadline = time.monotonic() + setting.REALTIME_SEARCH_FIRST_WAIT_SECONDS
+    while True:
+        snapshot = GetSnapshot(wait=False)
+        if snapshot is not None or GetLastError() is not None or time.monotonic() >= deadline:
+            return snapshot
+        await asyncio.sleep(setting.REALTIME_SEARCH_SSE_CHECK_SECONDS)
+
+def GetLastError():
+    with _cond:
+        return _last_error
@@ -0,0 +1,895 @@
+import os, json, sqlite3, threading, time, tempfile, shutil
+from abc import ABC, abstractmethod
+from datetime import datetime
+import setting
+import RankJournal, AnalyzeArchive, BuyHistoryStore, GameLeaderboard, FileWriter
+
+# [저장소 계층]
+# JsonDataBase / XmlDataBase 의 비즈니스 로직(집계, 캐시, 조건 조회, 손익 계산)은 아래 네 저장소 인터페이스만 사용
+#   RankStore     : 일별 순위 배치 추가/조회, 월별 집계 {코드: [이름, RANKSUM, COUNT, FULLCOUNT]}
+#   AnalysisStore : 날짜별 분석 결과 저장/조회, 최신 분석 결과
+#   HistoryStore  : 매수 이력 문서 (버전 + 종목 단위 upsert/delete)
+#   ScoreStore    : 게임 스코어 추가, 전체/상위 조회, 순위
+# 인터페이스는 abc.ABC (빠진 메서드가 있으면 생성할 때 TypeError), 메모리/SQLite 구현은 공통 로직이 있는 BatchRankStore / CountScoreStore 사용
+# 구현은 setting.STORAGE_BACKEND 로 선택
+#   'file'   : 기존 파일 형식 (월별 XML + 순위 저널, Today_Analyze + 보관소, history.txt + 저널, game-store-db.txt + 로그)
+#   'memory' : 프로세스 메모리 (재시작하면 사라짐, 테스트/비교용)
+#   'sqlite' : setting.STORAGE_SQLITE_PATH 의 SQLite 파일 하나 (WAL, 여러 워커 프로세스 가능)
+# 같은 작업을 세 구현에 돌려 결과와 시간을 비교하는 test_storage_conformance / benchmark_storage 는 파일 아래쪽
+
+def today_date_text(date=None):
+  """분석 파일명 규칙의 날짜 문자열 (예: 2026-3-10)"""
+  if date is None:
+    date = datetime.today()
+  return f"{date.year}-{date.month}-{date.day}"
+
+def _date_value(date):
+  return date.year * 10000 + date.month * 100 + date.day
+
+def _date_value_from_text(date_text):
+  """'YYYY-MM-DD' (월/일 한 자리도 가능) -> YYYYMMDD 정수"""
+  if not date_text:
+    return None
+  return _date_value(datetime.strptime(str(date_text), '%Y-%m-%d'))
+
+def _format_date_value(date_value):
+  return f"{date_value // 10000}-{date_value // 100 % 100:02d}-{date_value % 100:02d}"
+
+def _analyze_date_key(date_text):
+  return tuple(map(int, AnalyzeArchive.normalize_date(date_text).split('-')))
+
+# ------------------------------------------------------------------------------------------------
+# 인터페이스 (공통 로직 포함)
+# ------------------------------------------------------------------------------------------------
+
+class RankStore(ABC):
+  """일별 순위 저장소 - 누적합 저장소(prefix_store)는 revision / monthly_aggregates 로 공통 구현"""
+
+  @abstractmethod
+  def append_daily_ranks(self, stock, rank_list, date=None, only_if_absent=False):
+    """only_if_absent=True 면 같은 날짜 배치가 이미 있을 때 추가하지 않음 (확인과 추가를 한 번에)"""
+
+  @abstractmethod
+  def revision(self, stock):
+    """데이터가 바뀌면 달라지는 값 (누적합 캐시 키)"""
+
+  @abstractmethod
+  def has_daily_ranks(self, date=None):
+    """해당 날짜(기본 오늘) 배치가 있는지"""
+
+  @abstractmethod
+  def read_daily_ranks(self, code=None, start_date=None, end_date=None):
+    """날짜 'YYYY-MM-DD' -> [{'code', 'rank'}] (RankJournal.ReadDailyRanks 와 같은 형식)"""
+
+  @abstractmethod
+  def monthly_aggregates(self, stock):
+    """(월 목록 ['2025.3', ...], 월별 집계 목록) - 월 오래된 순"""
+
+  _prefix_lock = threading.Lock()
+
+  def prefix_store(self, stock):
+    """종목별 월 누적합 저장소 (revision 이 같으면 캐시 사용, 확인과 생성은 잠금 안에서)"""
+    import XmlDataBase
+
+    with self._prefix_lock:
+      revision = self.revision(stock)
+      cached = self._prefix_cache.get(stock) if hasattr(self, '_prefix_cache') else None
+      if cached is not None and cached[0] == revision:
+        return cached[1]
+
+      store = XmlDataBase.BuildRankPrefixStoreFromAggregates(*self.monthly_aggregates(stock))
+      if not hasattr(self, '_prefix_cache'):
+        self._prefix_cache = {}
+      self._prefix_cache[stock] = (revision, store)
+      return store
+
+class BatchRankStore(RankStore):
+  """배치 목록으로 조회/집계하는 순위 저장소 - 하위 구현은 _iter_batches / _names 와 추가/revision 을 구현"""
+
+  @abstractmethod
+  def _iter_batches(self, stock=None, start_value=0, end_value=99999999):
+    """(날짜값 YYYYMMDD, 종목 구분, [(코드, 순위)]) 를 기록 순서대로"""
+
+  @abstractmethod
+  def _names(self):
+    """{코드: 이름}"""
+
+  def has_daily_ranks(self, date=None):
+    date_value = _date_value(date or datetime.today())
+    return any(True for _ in self._iter_batches(start_value=date_value, end_value=date_value))
+
+  def read_daily_ranks(self, code=None, start_date=None, end_date=None):
+    start_value = _date_value_from_text(start_date) or 0
+    end_value = _date_value_from_text(end_date) or 99999999
+    daily_ranks = {}
+    for date_value, _, records in self._iter_batches(None, start_value, end_value):
+      daily_ranks[_format_date_value(date_value)] = [
+        {'code': record_code, 'rank': rank} for record_code, rank in records
+        if code is None or record_code == code
+      ]
+    return daily_ranks
+
+  def monthly_aggregates(self, stock):
+    import XmlDataBase
+
+    months = {}
+    for date_value, _, records in self._iter_batches(stock):
+      months.setdefault((date_value // 10000, date_value // 100 % 100), []).append((None, None, None, records))
+
+    names = self._names()
+    month_keys = sorted(months)
+    return (
+      [f"{year}.{month}" for year, month in month_keys],
+      [XmlDataBase.FoldJournalBatches({}, months[key], names) for key in month_keys]
+    )
+
+class AnalysisStore(ABC):
+  """날짜별 분석 결과 저장소 (날짜는 '2026-3-10' 규칙)"""
+
+  @abstractmethod
+  def save(self, rows, analyze_date=None):
+    pass
+
+  @abstractmethod
+  def load(self, analyze_date):
+    """해당 날짜 분석 결과 (없으면 None)"""
+
+  @abstractmethod
+  def latest(self):
+    """(날짜, 분석 결과) - 없으면 None"""
+
+  @abstractmethod
+  def revision(self):
+    """최신 분석 결과가 바뀌면 달라지는 값 (없으면 None)"""
+
+  def has(self, analyze_date=None):
+    return self.load(analyze_date or today_date_text()) is not None
+
+class HistoryStore(ABC):
+  """매수 이력 저장소 - 버전이 다르면 BuyHistoryStore.HistoryVersionConflict"""
+
+  @abstractmethod
+  def read(self):
+    """(문서, 버전)"""
+
+  @abstractmethod
+  def replace(self, data, base_version=None):
+    pass
+
+  @abstractmethod
+  def patch(self, ops, base_version):
+    pass
+
+class ScoreStore(ABC):
+  """게임 스코어 저장소 - 같은 점수는 먼저 기록된 점수가 앞"""
+
+  @abstractmethod
+  def add(self, game_type, user_id, mode, score):
+    pass
+
+  @abstractmethod
+  def all(self, game_type=""):
+    """{게임: [점수 내림차순 항목]}"""
+
+  @abstractmethod
+  def top(self, game_type, mode="", limit=10):
+    pass
+
+  @abstractmethod
+  def rank(self, game_type, mode, score):
+    """{"rank", "totalCount", "topPercent", "percentile", "approximate"} (GameLeaderboard.GetScoreRank 와 같은 형식)"""
+
+class CountScoreStore(ScoreStore):
+  """점수 개수 조회(count)로 순위를 계산하는 스코어 저장소 - 하위 구현은 count 와 추가/조회를 구현"""
+
+  @abstractmethod
+  def count(self, game_type, mode, score):
+    """(score 보다 높은 수, 낮은 수, 전체 수)"""
+
+  def rank(self, game_type, mode, score):
+    higher_count, lower_count, total_count = self.count(game_type, mode, score)
+    rank = higher_count + 1
+    return {
+      "rank": rank,
+      "totalCount": total_count,
+      "topPercent": round(min(rank / total_count, 1.0) * 100, 2) if total_count else 100.0,
+      "percentile": round(lower_count / total_count * 100, 2) if total_count else 0.0,
+      "approximate": False
+    }
+
+def _new_score_entry(user_id, mode, score):
+  return {
+    "id": user_id,
+    "mode": mode,
+    "score": score,
+    "timestamp": datetime.now().isoformat()
+  }
+
+# ------------------------------------------------------------------------------------------------
+# 파일 구현 (기존 형식, 경로는 호출할 때 setting 에서 읽음)
+# ------------------------------------------------------------------------------------------------
+
+class FileRankStore(RankStore):
+  def append_daily_ranks(self, stock, rank_list, date=None, only_if_absent=False):
+    import XmlDataBase
+    isSuccess = RankJournal.AppendDailyRanks(stock, rank_list, date, setting.RANK_JOURNAL_KR_PATH, only_if_absent)
+    if isSuccess:
+      XmlDataBase.ScheduleRankCompaction()
+    return isSuccess
+
+  def has_daily_ranks(self, date=None):
+    return RankJournal.HasDailyRanks(date, setting.RANK_JOURNAL_KR_PATH)
+
+  def read_daily_ranks(self, code=None, start_date=None, end_date=None):
+    return RankJournal.ReadDailyRanks(code, start_date, end_date, setting.RANK_JOURNAL_KR_PATH)
+
+  def _compact(self):
+    import XmlDataBase
+    os.makedirs(setting.XML_KR_READPATH, exist_ok=True)
+    XmlDataBase.CompactRankJournal(setting.XML_KR_READPATH, setting.RANK_JOURNAL_KR_PATH)
+
+  def monthly_aggregates(self, stock):
+    import XmlDataBase
+    self._compact()
+    return XmlDataBase.GetMonthlyAggregates(setting.XML_KR_READPATH, stock)
+
+  def prefix_store(self, stock):
+    import XmlDataBase
+    self._compact()
+    return XmlDataBase.GetRankPrefixStore(setting.XML_KR_READPATH, stock)
+
+  def revision(self, stock):
+    import XmlDataBase
+    self._compact()
+    return XmlDataBase._rank_folder_signature(setting.XML_KR_READPATH)[1]
+
+class FileAnalysisStore(AnalysisStore):
+  """Today_Analyze 폴더에는 최신 하루치만 두고 이전 날짜는 AnalyzeArchive 보관소로 옮김"""
+
+  def find_latest_file(self):
+    """가장 최신 분석 파일의 (파일명, 경로) (없으면 None)"""
+    if not os.path.exists(setting.JSON_ANALYZE_FOLDER_PATH):
+      return None
+
+    # 폴더 내 모든 .txt 파일 찾기
+    txt_files = []
+    for entry in os.scandir(setting.JSON_ANALYZE_FOLDER_PATH):
+      if entry.is_file() and entry.name.endswith('.txt'):
+        txt_files.append(entry.name)
+
+    if not txt_files:
+      return None
+
+    # 파일명을 날짜순으로 정렬 (가장 최신이 마지막)
+    txt_files.sort()
+    latest_file = txt_files[-1]
+    return latest_file, os.path.join(setting.JSON_ANALYZE_FOLDER_PATH, latest_file)
+
+  def save(self, rows, analyze_date=None):
+    analyze_date = analyze_date or today_date_text()
+    file_name = analyze_date + '.txt'
+    os.makedirs(setting.JSON_ANALYZE_FOLDER_PATH, exist_ok=True)
+
+    # 같은 날짜 저장 요청이 몰리면 write_coalesced 로 마지막 요청만 한 번 씀 (호출한 쪽은 반영될 때까지 대기)
+    # 이전 파일 정리 + 저장은 폴더 단위로 잠가 다른 워커 프로세스의 임시 파일을 지우지 않도록 함
+    def write():
+      with FileWriter.file_lock(setting.JSON_ANALYZE_FOLDER_PATH):
+        for entry in os.scandir(setting.JSON_ANALYZE_FOLDER_PATH):
+          # 저장할 날짜 파일은 지우지 않고 교체 (교체 전까지 이전 내용을 계속 읽을 수 있음)
+          if entry.is_file() and entry.name != file_name:
+            # 이전 날짜 분석 결과는 지우기 전에 보관소에 없으면 보관
+            if entry.name.endswith('.txt'):
+              previous_date = entry.name.replace('.txt', '')
+              if previous_date not in AnalyzeArchive.ListArchivedDates():
+                with open(entry.path, "r", encoding="utf-8") as f:
+                  AnalyzeArchive.ArchiveAnalyze(previous_date, json.load(f))
+            os.remove(entry.path)
+
+        # JSON 포맷을 txt 파일로 저장
+        FileWriter.atomic_write(os.path.join(setting.JSON_ANALYZE_FOLDER_PATH, file_name), json.dumps(rows, ensure_ascii=False, indent=2))
+
+        # 날짜별 보관 (같은 날 다시 저장하면 덮어씀)
+        AnalyzeArchive.ArchiveAnalyze(analyze_date, rows)
+    FileWriter.write_coalesced(os.path.join(setting.JSON_ANALYZE_FOLDER_PATH, file_name), write)
+    return True
+
+  def load(self, analyze_date):
+    file_path = os.path.join(setting.JSON_ANALYZE_FOLDER_PATH, AnalyzeArchive.normalize_date(analyze_date) + '.txt')
+    if os.path.exists(file_path):
+      with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+    return AnalyzeArchive.ReadArchivedAnalyze(analyze_date)
+
+  def has(self, analyze_date=None):
+    file_name = AnalyzeArchive.normalize_date(analyze_date or today_date_text()) + '.txt'
+    return os.path.exists(os.path.join(setting.JSON_ANALYZE_FOLDER_PATH, file_name))
+
+  def latest(self):
+    latest = self.find_latest_file()
+    if latest is None:
+      return None
+    latest_file, latest_file_path = latest
+    with open(latest_file_path, "r", encoding="utf-8") as f:
+      return latest_file.replace('.txt', ''), json.load(f)
+
+  def revision(self):
+    latest = self.find_latest_file()
+    if latest is None:
+      return None
+    stat = os.stat(latest[1])
+    return (latest[1], stat.st_mtime_ns, stat.st_size)
+
+class FileHistoryStore(HistoryStore):
+  def read(self):
+    return BuyHistoryStore.ReadHistory()
+
+  def replace(self, data, base_version=None):
+    return BuyHistoryStore.ReplaceHistory(data, base_version)
+
+  def patch(self, ops, base_version):
+    return BuyHistoryStore.PatchHistory(ops, base_version)
+
+class FileScoreStore(ScoreStore):
+  def add(self, game_type, user_id, mode, score):
+    return GameLeaderboard.AddScore(game_type, user_id, mode, score)
+
+  def all(self, game_type=""):
+    return GameLeaderboard.GetAllScores(game_type)
+
+  def top(self, game_type, mode="", limit=10):
+    return GameLeaderboard.GetTopScores(game_type, mode, limit)
+
+  def rank(self, game_type, mode, score):
+    return GameLeaderboard.GetScoreRank(game_type, mode, score)
+
+# ------------------------------------------------------------------------------------------------
+# 메모리 구현
+# ------------------------------------------------------------------------------------------------
+
+class MemoryRankStore(BatchRankStore):
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._batches = []
+    self._known_names = {}
+
+  def append_daily_ranks(self, stock, rank_list, date=None, only_if_absent=False):
+    records = [(str(item['code']), int(item['rank'])) for item in rank_list]
+    date_value = _date_value(date or datetime.today())
+    with self._lock:
+      if only_if_absent and any(batch[0] == date_value for batch in self._batches):
+        return True
+      self._batches.append((date_value, stock, records))
+      for item in rank_list:
+        self._known_names.setdefault(str(item['code']), item['name'])
+    return True
+
+  def _iter_batches(self, stock=None, start_value=0, end_value=99999999):
+    with self._lock:
+      batches = list(self._batches)
+    for date_value, batch_stock, records in batches:
+      if (stock is None or batch_stock == stock) and start_value <= date_value <= end_value:
+        yield date_value, batch_stock, records
+
+  def _names(self):
+    with self._lock:
+      return dict(self._known_names)
+
+  def revision(self, stock):
+    with self._lock:
+      return len(self._batches)
+
+class MemoryAnalysisStore(AnalysisStore):
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._days = {}
+    self._revision = 0
+
+  def save(self, rows, analyze_date=None):
+    analyze_date = AnalyzeArchive.normalize_date(analyze_date or today_date_text())
+    with self._lock:
+      self._days[analyze_date] = json.loads(json.dumps(rows))
+      self._revision += 1
+    return True
+
+  def load(self, analyze_date):
+    with self._lock:
+      rows = self._days.get(AnalyzeArchive.normalize_date(analyze_date))
+    return json.loads(json.dumps(rows)) if rows is not None else None
+
+  def latest(self):
+    with self._lock:
+      if not self._days:
+        return None
+      analyze_date = max(self._days, key=_analyze_date_key)
+      return analyze_date, json.loads(json.dumps(self._days[analyze_date]))
+
+  def revision(self):
+    with self._lock:
+      return self._revision if self._days else None
+
+class MemoryHistoryStore(HistoryStore):
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._document = {}
+    self._version = 0
+
+  def _check_version(self, base_version):
+    if base_version is not None and base_version != self._version:
+      raise BuyHistoryStore.HistoryVersionConflict(self._version)
+
+  def read(self):
+    with self._lock:
+      return json.loads(json.dumps(self._document)), self._version
+
+  def replace(self, data, base_version=None):
+    with self._lock:
+      self._check_version(base_version)
+      self._document = json.loads(json.dumps(data))
+      self._version += 1
+      return self._version
+
+  def patch(self, ops, base_version):
+    BuyHistoryStore.validate_ops(ops)
+    with self._lock:
+      self._check_version(base_version)
+      BuyHistoryStore.apply_ops(self._document, json.loads(json.dumps(ops)))
+      self._version += 1
+      return self._version
+
+class MemoryScoreStore(CountScoreStore):
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._scores = {game_type: [] for game_type in GameLeaderboard.DEFAULT_GAME_TYPES}
+
+  def _sorted(self, game_type, mode=""):
+    entries = [entry for entry in self._scores.get(game_type, []) if mode == "" or entry["mode"] == mode]
+    return sorted(entries, key=lambda entry: -entry["score"])
+
+  def add(self, game_type, user_id, mode, score):
+    entry = _new_score_entry(user_id, mode, score)
+    with self._lock:
+      self._scores.setdefault(game_type, []).append(entry)
+    return entry
+
+  def all(self, game_type=""):
+    with self._lock:
+      if game_type and game_type in self._scores:
+        return {game_type: self._sorted(game_type)}
+      return {name: self._sorted(name) for name in self._scores}
+
+  def top(self, game_type, mode="", limit=10):
+    with self._lock:
+      return self._sorted(game_type, mode)[:max(limit, 0)]
+
+  def count(self, game_type, mode, score):
+    with self._lock:
+      scores = [entry["score"] for entry in self._scores.get(game_type, []) if mode == "" or entry["mode"] == mode]
+    return sum(1 for value in scores if value > score), sum(1 for value in scores if value < score), len(scores)
+
+# ------------------------------------------------------------------------------------------------
+# SQLite 구현 - 연결 하나를 잠금으로 공유, 쓰기는 BEGIN IMMEDIATE 트랜잭션 (여러 프로세스 직렬화)
+# ------------------------------------------------------------------------------------------------
+
+SQLITE_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS rank_batches (id INTEGER PRIMARY KEY AUTOINCREMENT, date INTEGER NOT NULL, stock TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS rank_batches_date ON rank_batches (date);
+CREATE TABLE IF NOT EXISTS rank_records (batch_id INTEGER NOT NULL, code TEXT NOT NULL, rank INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS rank_records_batch ON rank_records (batch_id);
+CREATE TABLE IF NOT EXISTS rank_names (code TEXT PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS analysis (date TEXT PRIMARY KEY, date_key INTEGER NOT NULL, revision INTEGER NOT NULL, body TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS history (id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL, body TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS game_scores (id INTEGER PRIMARY KEY AUTOINCREMENT, game_type TEXT NOT NULL, user_id TEXT, mode TEXT NOT NULL, score INTEGER NOT NULL, timestamp TEXT);
+CREATE INDEX IF NOT EXISTS game_scores_rank ON game_scores (game_type, mode, score);
+'''
+
+class SqliteDatabase:
+  def __init__(self, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    self.path = path
+    self.lock = threading.RLock()
+    self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+    self.connection.execute('PRAGMA journal_mode=WAL')
+    self.connection.execute('PRAGMA synchronous=NORMAL')
+    self.connection.executescript(SQLITE_SCHEMA)
+
+  def query(self, sql, params=()):
+    with self.lock:
+      return self.connection.execute(sql, params).fetchall()
+
+  def transaction(self, work):
+    """work(connection) 를 BEGIN IMMEDIATE ~ COMMIT 안에서 실행하고 결과 반환"""
+    with self.lock:
+      self.connection.execute('BEGIN IMMEDIATE')
+      try:
+        result = work(self.connection)
+        self.connection.execute('COMMIT')
+        return result
+      except Exception:
+        self.connection.execute('ROLLBACK')
+        raise
+
+  def close(self):
+    with self.lock:
+      self.connection.close()
+
+class SqliteRankStore(BatchRankStore):
+  def __init__(self, database):
+    self.db = database
+
+  def append_daily_ranks(self, stock, rank_list, date=None, only_if_absent=False):
+    date_value = _date_value(date or datetime.today())
+
+    def work(connection):
+      if only_if_absent and connection.execute('SELECT 1 FROM rank_batches WHERE date = ? LIMIT 1', (date_value,)).fetchone():
+        return
+      batch_id = connection.execute('INSERT INTO rank_batches (date, stock) VALUES (?, ?)', (date_value, stock)).lastrowid
+      connection.executemany(
+        'INSERT INTO rank_records (batch_id, code, rank) VALUES (?, ?, ?)',
+        [(batch_id, str(item['code']), int(item['rank'])) for item in rank_list]
+      )
+      connection.executemany(
+        'INSERT OR IGNORE INTO rank_names (code, name) VALUES (?, ?)',
+        [(str(item['code']), str(item['name'])) for item in rank_list]
+      )
+
+    self.db.transaction(work)
+    return True
+
+  def _iter_batches(self, stock=None, start_value=0, end_value=99999999):
+    rows = self.db.query(
+      'SELECT b.id, b.date, b.stock, r.code, r.rank FROM rank_batches b JOIN rank_records r ON r.batch_id = b.id '
+      'WHERE b.date BETWEEN ? AND ? AND (? IS NULL OR b.stock = ?) ORDER BY b.id, r.rowid',
+      (start_value, end_value, stock, stock)
+    )
+    current_id, current = None, None
+    for batch_id, date_value, batch_stock, code, rank in rows:
+      if batch_id != current_id:
+        if current is not None:
+          yield current
+        current_id, current = batch_id, (date_value, batch_stock, [])
+      current[2].append((code, rank))
+    if current is not None:
+      yield current
+
+  def _names(self):
+    return dict(self.db.query('SELECT code, name FROM rank_names'))
+
+  def monthly_aggregates(self, stock):
+    """월별 집계를 SQL GROUP BY 로 계산"""
+    names = self._names()
+    batch_counts = self.db.query(
+      'SELECT date / 100, COUNT(*) FROM rank_batches WHERE stock = ? GROUP BY date / 100 ORDER BY date / 100', (stock,)
+    )
+    rows = self.db.query(
+      'SELECT b.date / 100, r.code, SUM(r.rank), SUM(r.rank <= 30), COUNT(*) FROM rank_batches b '
+      'JOIN rank_records r ON r.batch_id = b.id WHERE b.stock = ? GROUP BY b.date / 100, r.code ORDER BY MIN(r.rowid)',
+      (stock,)
+    )
+
+    aggregates = {month_value: {'ALL': ['횟수', 0, count, count]} for month_value, count in batch_counts}
+    for month_value, code, rank_sum, count, full_count in rows:
+      aggregates[month_value][code] = [names.get(code, code), rank_sum, count, full_count]
+
+    month_values = [month_value for month_value, _ in batch_counts]
+    return [f"{value // 100}.{value % 100}" for value in month_values], [aggregates[value] for value in month_values]
+
+  def revision(self, stock):
+    return self.db.query('SELECT COALESCE(MAX(id), 0) FROM rank_batches')[0][0]
+
+class SqliteAnalysisStore(AnalysisStore):
+  def __init__(self, database):
+    self.db = database
+
+  def save(self, rows, analyze_date=None):
+    analyze_date = AnalyzeArchive.normalize_date(analyze_date or today_date_text())
+    year, month, day = _analyze_date_key(analyze_date)
+    body = json.dumps(rows, ensure_ascii=False, separators=(',', ':'))
+
+    def work(connection):
+      revision = connection.execute('SELECT COALESCE(MAX(revision), 0) + 1 FROM analysis').fetchone()[0]
+      connection.execute(
+        'INSERT OR REPLACE INTO analysis (date, date_key, revision, body) VALUES (?, ?, ?, ?)',
+        (analyze_date, year * 10000 + month * 100 + day, revision, body)
+      )
+
+    self.db.transaction(work)
+    return True
+
+  def load(self, analyze_date):
+    rows = self.db.query('SELECT body FROM analysis WHERE date = ?', (AnalyzeArchive.normalize_date(analyze_date),))
+    return json.loads(rows[0][0]) if rows else None
+
+  def latest(self):
+    rows = self.db.query('SELECT date, body FROM analysis ORDER BY date_key DESC LIMIT 1')
+    return (rows[0][0], json.loads(rows[0][1])) if rows else None
+
+  def revision(self):
+    rows = self.db.query('SELECT date, revision FROM analysis ORDER BY date_key DESC LIMIT 1')
+    return tuple(rows[0]) if rows else None
+
+class SqliteHistoryStore(HistoryStore):
+  def __init__(self, database):
+    self.db = database
+
+  def _current(self, connection):
+    row = connection.execute('SELECT body, version FROM history WHERE id = 1').fetchone()
+    return (json.loads(row[0]), row[1]) if row else ({}, 0)
+
+  def _write(self, connection, document, version):
+    connection.execute(
+      'INSERT OR REPLACE INTO history (id, version, body) VALUES (1, ?, ?)',
+      (version, json.dumps(document, ensure_ascii=False))
+    )
+
+  def read(self):
+    with self.db.lock:
+      return self._current(self.db.connection)
+
+  def replace(self, data, base_version=None):
+    def work(connection):
+      _, version = self._current(connection)
+      if base_version is not None and base_version != version:
+        raise BuyHistoryStore.HistoryVersionConflict(version)
+      self._write(connection, data, version + 1)
+      return version + 1
+
+    return self.db.transaction(work)
+
+  def patch(self, ops, base_version):
+    BuyHistoryStore.validate_ops(ops)
+
+    def work(connection):
+      document, version = self._current(connection)
+      if base_version != version:
+        raise BuyHistoryStore.HistoryVersionConflict(version)
+      BuyHistoryStore.apply_ops(document, ops)
+      self._write(connection, document, version + 1)
+      return version + 1
+
+    return self.db.transaction(work)
+
+class SqliteScoreStore(CountScoreStore):
+  def __init__(self, database):
+    self.db = database
+
+  def _entries(self, rows):
+    return [{"id": user_id, "mode": mode, "score": score, "timestamp": timestamp} for user_id, mode, score, timestamp in rows]
+
+  def add(self, game_type, user_id, mode, score):
+    entry = _new_score_entry(user_id, mode, score)
+    self.db.transaction(lambda connection: connection.execute(
+      'INSERT INTO game_scores (game_type, user_id, mode, score, timestamp) VALUES (?, ?, ?, ?, ?)',
+      (game_type, user_id, mode, score, entry["timestamp"])
+    ))
+    return entry
+
+  def all(self, game_type=""):
+    game_types = list(GameLeaderboard.DEFAULT_GAME_TYPES)
+    for (name,) in self.db.query('SELECT DISTINCT game_type FROM game_scores'):
+      if name not in game_types:
+        game_types.append(name)
+    if game_type and game_type in game_types:
+      game_types = [game_type]
+
+    return {
+      name: self._entries(self.db.query(
+        'SELECT user_id, mode, score, timestamp FROM game_scores WHERE game_type = ? ORDER BY score DESC, id', (name,)
+      ))
+      for name in game_types
+    }
+
+  def top(self, game_type, mode="", limit=10):
+    return self._entries(self.db.query(
+      'SELECT user_id, mode, score, timestamp FROM game_scores WHERE game_type = ? AND (? = \'\' OR mode = ?) '
+      'ORDER BY score DESC, id LIMIT ?',
+      (game_type, mode, mode, max(limit, 0))
+    ))
+
+  def count(self, game_type, mode, score):
+    row = self.db.query(
+      'SELECT COALESCE(SUM(score > ?), 0), COALESCE(SUM(score < ?), 0), COUNT(*) FROM game_scores '
+      'WHERE game_type = ? AND (? = \'\' OR mode = ?)',
+      (score, score, game_type, mode, mode)
+    )[0]
+    return row[0], row[1], row[2]
+
+# ------------------------------------------------------------------------------------------------
+# 구현 선택
+# ------------------------------------------------------------------------------------------------
+
+STORAGE_BACKENDS = ('file', 'memory', 'sqlite')
+
+class StorageBackend:
+  def __init__(self, name, ranks, analysis, history, scores, close=None):
+    self.name = name
+    self.ranks = ranks
+    self.analysis = analysis
+    self.history = history
+    self.scores = scores
+    self._close = close
+
+  def close(self):
+    if self._close is not None:
+      self._close()
+
+def create_backend(name, sqlite_path=None):
+  """이름으로 저장소 묶음 생성 ('file' | 'memory' | 'sqlite')"""
+  if name == 'file':
+    return StorageBackend(name, FileRankStore(), FileAnalysisStore(), FileHistoryStore(), FileScoreStore())
+  if name == 'memory':
+    return StorageBackend(name, MemoryRankStore(), MemoryAnalysisStore(), MemoryHistoryStore(), MemoryScoreStore())
+  if name == 'sqlite':
+    database = SqliteDatabase(sqlite_path or setting.STORAGE_SQLITE_PATH)
+    return StorageBackend(name, SqliteRankStore(database), SqliteAnalysisStore(database),
+                          SqliteHistoryStore(database), SqliteScoreStore(database), database.close)
+  raise ValueError(f"지원하지 않는 저장소입니다: {name} ({', '.join(STORAGE_BACKENDS)})")
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_backend():
+  """setting.STORAGE_BACKEND 로 선택된 저장소 (최초 1회 생성)"""
+  global _backend
+  with _backend_lock:
+    if _backend is None:
+      _backend = create_backend(setting.STORAGE_BACKEND)
+    return _backend
+
+def ranks():
+  return get_backend().ranks
+
+def analysis():
+  return get_backend().analysis
+
+def history():
+  return get_backend().history
+
+def scores():
+  return get_backend().scores
+
+# ------------------------------------------------------------------------------------------------
+# 적합성 / 성능 비교 (python Storage.py)
+# 같은 작업을 각 구현에 실행해 결과가 메모리 구현과 같은지 확인하고 구간별 시간을 측정
+# 파일 구현은 임시 폴더로 setting 경로를 바꿔서 실행한 뒤 원래대로 되돌림
+# ------------------------------------------------------------------------------------------------
+
+FILE_SETTING_NAMES = ['XML_KR_READPATH', 'RANK_JOURNAL_KR_PATH', 'JSON_ANALYZE_FOLDER_PATH', 'JSON_ANALYZE_HISTORY_PATH',
+                      'JSON_HISTORY_PATH', 'JSON_GAME_SCORE_PATH', 'WRITE_LOCK_DIR']
+
+def _reset_file_state():
+  import XmlDataBase
+  GameLeaderboard.FlushGameScores()
+  GameLeaderboard._boards = None
+  GameLeaderboard._pending_entries = []
+  BuyHistoryStore._document = None
+  RankJournal._known_names.clear()
+  RankJournal._journal_states.clear()
+  XmlDataBase._folded_journal_sizes.clear()
+  XmlDataBase._rank_prefix_cache.clear()
+  XmlDataBase._monthly_aggregate_cache.clear()
+
+def _open_test_backend(name, work_dir):
+  if name == 'file':
+    saved = {key: getattr(setting, key) for key in FILE_SETTING_NAMES}
+    setting.XML_KR_READPATH = work_dir + '/Xml'
+    setting.RANK_JOURNAL_KR_PATH = work_dir + '/Rank_Journal'
+    setting.JSON_ANALYZE_FOLDER_PATH = work_dir + '/Today_Analyze'
+    setting.JSON_ANALYZE_HISTORY_PATH = work_dir + '/Analyze_History'
+    setting.JSON_HISTORY_PATH = work_dir + '/history.txt'
+    setting.JSON_GAME_SCORE_PATH = work_dir + '/Game_Score/game-store-db.txt'
+    setting.WRITE_LOCK_DIR = work_dir + '/locks'
+    _reset_file_state()
+
+    def restore():
+      _reset_file_state()
+      for key, value in saved.items():
+        setattr(setting, key, value)
+
+    backend = create_backend('file')
+    backend._close = restore
+    return backend
+
+  return create_backend(name, sqlite_path=work_dir + '/storage.db')
+
+def _run_workload(backend, days=20, codes=300, scores=2000, patches=200):
+  """구간별 (결과, 걸린 시간) - 결과는 구현끼리 비교 가능한 값만"""
+  results = {}
+  timings = {}
+
+  def measure(section, work):
+    start = time.perf_counter()
+    results[section] = work()
+    timings[section] = time.perf_counter() - start
+
+  def rank_list(day):
+    return [{'code': f"{i:06d}", 'name': f"종목{i}", 'rank': (i * 7 + day) % codes + 1} for i in range(codes)]
+
+  rank_dates = [datetime(2025, 11 + day // 10, day % 10 + 1) for day in range(days)]
+
+  measure('ranks.append', lambda: [backend.ranks.append_daily_ranks('KRX', rank_list(day), date) for day, date in enumerate(rank_dates)])
+  measure('ranks.monthly', lambda: backend.ranks.monthly_aggregates('KRX'))
+  measure('ranks.daily', lambda: backend.ranks.read_daily_ranks('000007', '2025-11-01', '2025-12-31'))
+  measure('ranks.exists', lambda: [backend.ranks.has_daily_ranks(rank_dates[0]), backend.ranks.has_daily_ranks(datetime(2020, 1, 1))])
+
+  analyze_rows = [{'code': f"{i:06d}", 'rank': i + 1, 'totalScore': i % 100} for i in range(codes)]
+  measure('analysis.save', lambda: [backend.analysis.save(analyze_rows[:codes - day], f"2025-12-{day + 1}") for day in range(3)])
+  measure('analysis.latest', lambda: backend.analysis.latest())
+  measure('analysis.load', lambda: len(backend.analysis.load('2025-12-1') or []))
+
+  def history_work():
+    version = backend.history.replace({'virtualInvestItemObject': {}}, None)
+    for i in range(patches):
+      version = backend.history.patch([{'op': 'upsert', 'section': 'virtualInvestItemObject', 'code': f"{i % 50:06d}", 'value': {'i': i}}], version)
+    try:
+      backend.history.patch([{'op': 'delete', 'section': 'virtualInvestItemObject', 'code': '000001'}], version - 1)
+      conflict = False
+    except BuyHistoryStore.HistoryVersionConflict:
+      conflict = True
+    document, read_version = backend.history.read()
+    return read_version - version, conflict, document
+
+  measure('history.patch', history_work)
+
+  def score_work():
+    for i in range(scores):
+      backend.scores.add('SnakeGame', f"user{i % 40}", str(i % 3 + 1), (i * 37) % 1000)
+    return True
+
+  measure('scores.add', score_work)
+  measure('scores.top', lambda: [(entry['id'], entry['score']) for entry in backend.scores.top('SnakeGame', '2', 20)])
+  measure('scores.rank', lambda: [backend.scores.rank('SnakeGame', mode, value) for mode in ('', '1') for value in (0, 500, 999)])
+  measure('scores.all', lambda: [(entry['id'], entry['score']) for entry in backend.scores.all('SnakeGame')['SnakeGame']])
+
+  return results, timings
+
+def test_storage_conformance(names=STORAGE_BACKENDS, **workload):
+  """각 구현에 같은 작업을 실행하고 메모리 구현 결과와 다르면 구간 이름을 출력, 모두 같으면 True"""
+  outputs = {}
+  for name in dict.fromkeys(['memory'] + list(names)):
+    work_dir = tempfile.mkdtemp(prefix=f"storage-{name}-")
+    backend = _open_test_backend(name, work_dir)
+    try:
+      outputs[name] = _run_workload(backend, **workload)
+    finally:
+      backend.close()
+      shutil.rmtree(work_dir, ignore_errors=True)
+
+  reference = outputs['memory'][0]
+  isSuccess = True
+  for name in names:
+    mismatched = [section for section, value in outputs[name][0].items() if value != reference[section]]
+    if mismatched:
+      isSuccess = False
+      print(f"❌ {name}: 결과 불일치 {mismatched}")
+    else:
+      print(f"✅ {name}: 모든 구간 결과 일치")
+  return isSuccess, {name: output[1] for name, output in outputs.items()}
+
+def benchmark_storage(names=STORAGE_BACKENDS, **workload):
+  """구현별 구간 시간을 표로 출력"""
+  _, timings = test_storage_conformance(names, **workload)
+  sections = list(next(iter(timings.values())).keys())
+
+  print(f"\n{'구간':<18}" + ''.join(f"{name:>12}" for name in names))
+  for section in sections + ['합계']:
+    values = [sum(timings[name].values()) if section == '합계' else timings[name][section] for name in names]
+    print(f"{section:<18}" + ''.join(f"{value * 1000:>10.1f}ms" for value in values))
+  return timings
+
+if __name__ == "__main__":
+  print("=== Storage 모듈 테스트 메뉴 ===")
+  print("1. 저장소 적합성 테스트")
+  print("2. 저장소 성능 비교")
+  print("3. 종료")
+
+  choice = input("\n선택하세요 (1-3): ").strip()
+
+  if choice == "1":
+    test_storage_conformance()
+  elif choice == "2":
+    benchmark_storage()
+  elif choice == "3":
+    print("테스트를 종료합니다.")
+  else:
+    print("잘못된 선택입니다. 기본으로 저장소 성능 비교를 실행합니다.")
+    benchmark_storage()
@@ -1,10 +1,11 @@
 import time
 import requests
-from selenium import webdriver
+import HttpClient, BrowserPool, HtmlBackend, setting
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import json
@@ -18,37 +19,27 @@ from key import KOREA_DATA_PORTAL_API_KEY, KOREA_DATA_PORTAL_HOLIDAY_URL
 
 def setup_driver():
     """
-    Chrome 웹드라이버 설정 및 초기화
+    Chrome 웹드라이버 설정 및 초기화 (풀을 거치지 않는 단독 브라우저 - 사용 후 quit 필요)
     """
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')  # 브라우저 창을 띄우지 않음
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-    
-    try:
-        driver = webdriver.Chrome(options=chrome_options)
-        return driver
-    except Exception as e:
-        print(f"웹드라이버 설정 중 오류 발생: {e}")
-        return None
+    return BrowserPool.create_driver()
 
-def extract_individual_search_terms(rank_elements):
+def extract_individual_search_terms(rank_elements, document=None):
     """
     rank-column 요소들에서 개별 검색어들을 추출하는 함수
+    document 는 요소를 만든 HtmlBackend 문서 (없으면 BeautifulSoup 요소로 처리)
     """
+    if document is None:
+        document = HtmlBackend.SoupDocument('')
     search_terms = []
     
     for rank_element in rank_elements:
         # rank-column 내의 모든 하위 요소들을 찾기
-        child_elements = rank_element.find_all(['div', 'span', 'p', 'a', 'li'])
+        child_elements = document.descendants(rank_element, ['div', 'span', 'p', 'a', 'li'])
         
         if child_elements:
             # 하위 요소가 있는 경우, 각각의 텍스트를 개별적으로 추출
             for child in child_elements:
-                text_content = child.get_text(strip=True)
+                text_content = document.text(child)
                 if text_content and len(text_content) > 1:
                     # 정규식을 사용하여 순위 번호 제거
                     cleaned_text = re.sub(r'^\d+', '', text_content).strip()
@@ -57,7 +48,7 @@ def extract_individual_search_terms(rank_elements):
                         search_terms.append(cleaned_text)
         else:
             # 하위 요소가 없는 경우, 직접 텍스트 추출
-            text_content = rank_element.get_text(strip=True)
+            text_content = document.text(rank_element)
             if text_content:
                 # 여러 검색어가 붙어있는 경우를 정규식으로 분리
                 # 예: "1이스라엘 이란 공습2은마아파트 작업자 매몰" -> ["이스라엘 이란 공습", "은마아파트 작업자 매몰"]
@@ -79,6 +70,12 @@ def extract_individual_search_terms(rank_elements):
     
     return filtered_terms
 
+def signal_ranks_ready(driver):
+    """
+    Signal.bz 순위 목록(rank-column)에 검색어가 채워졌는지 (WebDriverWait 조건)
+    """
+    return any(element.text.strip() for element in driver.find_elements(By.CLASS_NAME, 'rank-column'))
+
 def crawl_signal_realtime_search():
     """
     Signal.bz 사이트에서 실시간 검색어 데이터를 크롤링하는 함수
@@ -86,27 +83,21 @@ def crawl_signal_realtime_search():
     Returns:
         dict: 검색어 데이터와 날짜 정보를 포함한 딕셔너리
     """
-    driver = None
     try:
-        # 웹드라이버 설정
-        driver = setup_driver()
-        if driver is None:
-            return {"error": "웹드라이버 초기화 실패"}
-        
-        # Signal.bz 사이트 접속
         url = "https://signal.bz/"
-        driver.get(url)
         
-        # 페이지 로딩 대기
-        time.sleep(3)
-        
-        # 페이지가 완전히 로드될 때까지 대기
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # 현재 페이지 소스 가져오기
-        page_source = driver.page_source
+        # 브라우저 풀에서 띄워둔 브라우저를 빌려 Signal.bz 접속
+        with BrowserPool.browser() as driver:
+            driver.get(url)
+            
+            # 순위 목록이 렌더링될 때까지 대기 (시간이 지나면 현재 페이지로 진행)
+            try:
+                WebDriverWait(driver, setting.BROWSER_PAGE_TIMEOUT_SECONDS).until(signal_ranks_ready)
+            except TimeoutException:
+                print("실시간 검색어 순위 렌더링 대기 시간 초과 - 현재 페이지로 진행")
+            
+            # 현재 페이지 소스 가져오기
+            page_source = driver.page_source
         
         # BeautifulSoup으로 HTML 파싱
         soup = BeautifulSoup(page_source, 'html.parser')
@@ -173,11 +164,128 @@ def crawl_signal_realtime_search():
             "error": error_msg,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
+
+def parse_signal_page(content, backend=None):
+    """
+    Signal.bz 페이지(HTML)에서 검색어/날짜 정보 추출 (정적 크롤링, 저장된 페이지 벤치마크 공용)
+    backend 는 HTML 파서 (기본값 setting.SIGNAL_HTML_PARSER, HtmlBackend 참고)
+    선택자를 우선순위대로 조회하다가 검색어가 SIGNAL_ENOUGH_TERMS 개 이상 모이면 나머지 선택자는 조회하지 않음
+    """
+    document = HtmlBackend.parse(content, backend or setting.SIGNAL_HTML_PARSER)
+    search_terms = []
+    
+    # 다양한 선택자들을 순차적으로 시도
+    selectors_to_try = [
+        # 기본 선택자들
+        '.rank-column',
+        '.ranking-item',
+        '.search-term',
+        '.keyword',
+        '.rank-item',
+        '.trend-item',
+        '.realtime-keyword',
+        '.hot-keyword',
+        
+        # 클래스 속성이 포함된 요소들
+        '[class*="rank"]',
+        '[class*="search"]',
+        '[class*="keyword"]',
+        '[class*="trend"]',
+        '[class*="hot"]',
+        '[class*="realtime"]',
+        
+        # 리스트 형태의 요소들
+        'li[class*="rank"]',
+        'li[class*="keyword"]',
+        'div[class*="rank"]',
+        'span[class*="rank"]',
+        
+        # 일반적인 순위 관련 선택자들
+        '.ranking',
+        '.top-keywords',
+        '.popular-keywords',
+        '.trending-keywords'
+    ]
+    
+    for selector in selectors_to_try:
+        try:
+            elements = document.select(selector)
+            if elements:
+                print(f"선택자 '{selector}'로 {len(elements)}개 요소 발견")
+                
+                # rank-column 클래스의 경우 특별 처리
+                if 'rank-column' in selector:
+                    temp_terms = extract_individual_search_terms(elements, document)
+                else:
+                    temp_terms = []
+                    for element in elements:
+                        text = document.text(element)
+                        if text and len(text) > 2 and not text.isdigit():
+                            # 순위 번호 제거
+                            cleaned_text = re.sub(r'^\d+\.?\s*', '', text).strip()
+                            if cleaned_text and len(cleaned_text) > 2:
+                                temp_terms.append(cleaned_text)
+                
+                if temp_terms:
+                    search_terms.extend(temp_terms)
+                    print(f"선택자 '{selector}'에서 {len(temp_terms)}개 검색어 추출")
+                    
+                    # 충분한 검색어를 찾았으면 중단
+                    if len(search_terms) >= setting.SIGNAL_ENOUGH_TERMS:
+                        break
+                        
+        except Exception as e:
+            print(f"선택자 '{selector}' 처리 중 오류: {e}")
+            continue
+    
+    # 중복 제거 및 정리
+    if search_terms:
+        # 중복 제거하되 순서는 유지
+        unique_terms = list(dict.fromkeys(search_terms))
+        
+        # 추가 필터링
+        filtered_terms = []
+        for term in unique_terms:
+            # 길이 체크, 특수문자만으로 이루어진 텍스트 제외
+            if len(term) >= 2 and not re.match(r'^[^\w\s가-힣]+$', term):
+                # 너무 긴 텍스트 제외 (일반적으로 검색어는 50자 이내)
+                if len(term) <= 50:
+                    filtered_terms.append(term)
+        
+        search_terms = filtered_terms[:20]  # 최대 20개까지만
+    
+    # 날짜 정보 찾기
+    date_info = None
+    date_selectors = [
+        '.date', '.time', '.datetime', '.timestamp', 
+        '.update-time', '.last-update', '.current-time',
+        '[class*="date"]', '[class*="time"]'
+    ]
+    
+    for selector in date_selectors:
+        try:
+            date_element = document.select_one(selector)
+            if date_element is not None:
+                date_info = document.text(date_element)
+                break
+        except:
+            continue
+    
+    if not date_info:
+        date_info = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    result = {
+        "success": True,
+        "method": f"requests + {document.label} (개선됨)",
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "site_url": "https://signal.bz/",
+        "date_info": date_info,
+        "search_terms": search_terms,
+        "total_count": len(search_terms)
+    }
     
-    finally:
-        # 웹드라이버 종료
-        if driver:
-            driver.quit()
+    print(f"정적 크롤링 완료: {len(search_terms)}개 검색어 수집")
+    return result
 
 def crawl_with_beautifulsoup_only():
     """
@@ -196,124 +304,10 @@ def crawl_with_beautifulsoup_only():
         }
         
         print("정적 크롤링 시작: Signal.bz 접속 중...")
-        response = requests.get("https://signal.bz/", headers=headers, timeout=15)
+        response = HttpClient.get("https://signal.bz/", headers=headers)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        search_terms = []
-        
-        # 다양한 선택자들을 순차적으로 시도
-        selectors_to_try = [
-            # 기본 선택자들
-            '.rank-column',
-            '.ranking-item',
-            '.search-term',
-            '.keyword',
-            '.rank-item',
-            '.trend-item',
-            '.realtime-keyword',
-            '.hot-keyword',
-            
-            # 클래스 속성이 포함된 요소들
-            '[class*="rank"]',
-            '[class*="search"]',
-            '[class*="keyword"]',
-            '[class*="trend"]',
-            '[class*="hot"]',
-            '[class*="realtime"]',
-            
-            # 리스트 형태의 요소들
-            'li[class*="rank"]',
-            'li[class*="keyword"]',
-            'div[class*="rank"]',
-            'span[class*="rank"]',
-            
-            # 일반적인 순위 관련 선택자들
-            '.ranking',
-            '.top-keywords',
-            '.popular-keywords',
-            '.trending-keywords'
-        ]
-        
-        for selector in selectors_to_try:
-            try:
-                elements = soup.select(selector)
-                if elements:
-                    print(f"선택자 '{selector}'로 {len(elements)}개 요소 발견")
-                    
-                    # rank-column 클래스의 경우 특별 처리
-                    if 'rank-column' in selector:
-                        temp_terms = extract_individual_search_terms(elements)
-                    else:
-                        temp_terms = []
-                        for element in elements:
-                            text = element.get_text(strip=True)
-                            if text and len(text) > 2 and not text.isdigit():
-                                # 순위 번호 제거
-                                cleaned_text = re.sub(r'^\d+\.?\s*', '', text).strip()
-                                if cleaned_text and len(cleaned_text) > 2:
-                                    temp_terms.append(cleaned_text)
-                    
-                    if temp_terms:
-                        search_terms.extend(temp_terms)
-                        print(f"선택자 '{selector}'에서 {len(temp_terms)}개 검색어 추출")
-                        
-                        # 충분한 검색어를 찾았으면 중단
-                        if len(search_terms) >= 10:
-                            break
-                            
-            except Exception as e:
-                print(f"선택자 '{selector}' 처리 중 오류: {e}")
-                continue
-        
-        # 중복 제거 및 정리
-        if search_terms:
-            # 중복 제거하되 순서는 유지
-            unique_terms = list(dict.fromkeys(search_terms))
-            
-            # 추가 필터링
-            filtered_terms = []
-            for term in unique_terms:
-                # 길이 체크, 특수문자만으로 이루어진 텍스트 제외
-                if len(term) >= 2 and not re.match(r'^[^\w\s가-힣]+$', term):
-                    # 너무 긴 텍스트 제외 (일반적으로 검색어는 50자 이내)
-                    if len(term) <= 50:
-                        filtered_terms.append(term)
-            
-            search_terms = filtered_terms[:20]  # 최대 20개까지만
-        
-        # 날짜 정보 찾기
-        date_info = None
-        date_selectors = [
-            '.date', '.time', '.datetime', '.timestamp', 
-            '.update-time', '.last-update', '.current-time',
-            '[class*="date"]', '[class*="time"]'
-        ]
-        
-        for selector in date_selectors:
-            try:
-                date_element = soup.select_one(selector)
-                if date_element:
-                    date_info = date_element.get_text(strip=True)
-                    break
-            except:
-                continue
-        
-        if not date_info:
-            date_info = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        result = {
-            "success": True,
-            "method": "requests + BeautifulSoup (개선됨)",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "site_url": "https://signal.bz/",
-            "date_info": date_info,
-            "search_terms": search_terms,
-            "total_count": len(search_terms)
-        }
-        
-        print(f"정적 크롤링 완료: {len(search_terms)}개 검색어 수집")
-        return result
+        return parse_signal_page(response.content)
         
     except requests.RequestException as e:
         error_msg = f"네트워크 요청 오류: {str(e)}"
@@ -390,7 +384,229 @@ def test_crawling_performance():
     
     return static_result
 
-def crawl_zeroin_economic_calendar(start_date, end_date, countries=None, importance_levels=None):
+# 제로인 응답 배열 키 -> 이벤트 필드 이름 (importance_level 은 importance 열에서 계산)
+ZEROIN_COLUMN_KEYS = (
+    ('date', 'date'),
+    ('date_full', 'date_temp'),
+    ('day', 'day'),
+    ('time', 'time'),
+    ('event_name', 'kevent'),
+    ('importance', 'importance'),
+    ('importance_class', 'importance_class'),
+    ('actual', 'actual'),
+    ('forecast', 'forecast'),
+    ('previous', 'previous'),
+    ('country_name', 'nat_hname'),
+    ('country_code', 'natcd'),
+    ('index', 'index')
+)
+ZEROIN_EVENT_FIELDS = ('date', 'date_full', 'day', 'time', 'event_name', 'importance', 'importance_level', 'importance_class', 'actual', 'forecast', 'previous', 'country_name', 'country_code', 'index')
+
+def build_zeroin_columns(data):
+    """
+    제로인 응답(열 배열 구조)을 그대로 열 단위로 정리 (행 dict 로 풀지 않음)
+    - 짧은 열은 '' 로 채우고, 이벤트명이 빈 행은 제외
+    - importance_level 은 열 단위로 한 번에 계산
+    """
+    if not all(key in data for key in ['date', 'time', 'kevent', 'importance']):
+        return {field: [] for field in ZEROIN_EVENT_FIELDS}
+    
+    event_count = len(data['date'])
+    columns = {}
+    for field, source_key in ZEROIN_COLUMN_KEYS:
+        column = data.get(source_key) or []
+        if len(column) != event_count:
+            column = list(column[:event_count]) + [''] * (event_count - len(column))
+        columns[field] = column
+    
+    # 빈 이벤트는 제외
+    keep = [i for i, name in enumerate(columns['event_name']) if str(name).strip()]
+    if len(keep) != event_count:
+        columns = {field: [column[i] for i in keep] for field, column in columns.items()}
+    
+    # 중요도 값 종류(상/중/하)마다 한 번만 변환
+    levels = {text: get_importance_level(text) for text in set(columns['importance'])}
+    columns['importance_level'] = [levels[text] for text in columns['importance']]
+    return {field: columns[field] for field in ZEROIN_EVENT_FIELDS}
+
+def zeroin_columns_to_rows(columns, indices=None):
+    """열 구조를 기존 이벤트 dict 목록으로 변환 (indices 를 주면 해당 행만)"""
+    if indices is None:
+        indices = range(len(columns['event_name']))
+    field_columns = [(field, columns[field]) for field in ZEROIN_EVENT_FIELDS]
+    return [{field: column[i] for field, column in field_columns} for i in indices]
+
+def validate_zeroin_dates(start_date, end_date):
+    """
+    제로인 조회 날짜 형식 검증 (올바르면 None, 아니면 실패 결과)
+    """
+    try:
+        datetime.strptime(start_date, '%Y-%m-%d')
+        datetime.strptime(end_date, '%Y-%m-%d')
+    except ValueError:
+        return {
+            "success": False,
+            "error": "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용해주세요.",
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    return None
+
+def zeroin_request(start_date, end_date, countries=None, importance_levels=None):
+    """
+    제로인 경제캘린더 요청 정보 (동기/비동기 크롤러 공용)
+    
+    Returns:
+        dict: url, params, headers, countries, importance_levels (기본값 적용 후)
+    """
+    # 기본 국가 설정 (전체)
+    if countries is None:
+        countries = ["cn", "kr", "gb", "us", "eu"]
+    
+    # 기본 중요도 설정 (전체)
+    if importance_levels is None:
+        importance_levels = [1, 2, 3]
+    
+    # 국가 코드와 이름 매핑
+    country_mapping = {
+        "cn": "China|중국",
+        "kr": "South Korea|대한민국", 
+        "gb": "United Kingdom|영국",
+        "us": "United States|미국",
+        "eu": "European Union|유럽연합"
+    }
+    
+    # 국가 파라미터 구성
+    str_nation_parts = []
+    str_natcd_parts = []
+    
+    for country_code in countries:
+        if country_code.lower() in country_mapping:
+            str_nation_parts.append(country_mapping[country_code.lower()])
+            str_natcd_parts.append(country_code.lower())
+    
+    str_nation = "|".join(str_nation_parts) + "|"
+    str_natcd = "|".join(str_natcd_parts) + "|"
+    str_importance = "|".join(map(str, importance_levels)) + "|"
+    
+    # API URL 구성
+    base_url = "https://asp.zeroin.co.kr/eco/includes/wei/module/json_getData.php"
+    params = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "sort_code": "0",
+        "str_nation": str_nation,
+        "str_natcd": str_natcd,
+        "str_importance": str_importance
+    }
+    
+    # 헤더 설정
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'application/json, text/javascript, */*; q=0.01',
+        'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Referer': 'https://asp.zeroin.co.kr/',
+        'X-Requested-With': 'XMLHttpRequest'
+    }
+    
+    return {"url": base_url, "params": params, "headers": headers, "countries": countries, "importance_levels": importance_levels}
+
+def parse_zeroin_response(start_date, end_date, countries, importance_levels, api_url, data, columnar=False):
+    """
+    제로인 응답(JSON, 열 배열 구조)을 경제지표 결과로 변환
+    """
+    if columnar:
+        economic_columns = build_zeroin_columns(data if isinstance(data, dict) else {})
+        event_count = len(economic_columns['event_name'])
+        print(f"제로인 API 크롤링 완료: {event_count}개 이벤트 수집 (열 구조)")
+        return {
+            "success": True,
+            "method": "ZeroIn API",
+            "format": "columnar",
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "api_url": api_url,
+            "parameters": {
+                "start_date": start_date,
+                "end_date": end_date,
+                "countries": countries,
+                "importance_levels": importance_levels
+            },
+            "economic_columns": economic_columns,
+            "total_count": event_count
+        }
+    
+    # 데이터 처리 및 구조화
+    economic_events = []
+    
+    if all(key in data for key in ['date', 'time', 'kevent', 'importance']):
+        event_count = len(data['date'])
+        
+        for i in range(event_count):
+            try:
+                event = {
+                    'date': data['date'][i] if i < len(data['date']) else '',
+                    'date_full': data['date_temp'][i] if i < len(data.get('date_temp', [])) else '',
+                    'day': data['day'][i] if i < len(data.get('day', [])) else '',
+                    'time': data['time'][i] if i < len(data['time']) else '',
+                    'event_name': data['kevent'][i] if i < len(data['kevent']) else '',
+                    'importance': data['importance'][i] if i < len(data['importance']) else '',
+                    'importance_level': get_importance_level(data['importance'][i] if i < len(data['importance']) else ''),
+                    'importance_class': data['importance_class'][i] if i < len(data.get('importance_class', [])) else '',
+                    'actual': data['actual'][i] if i < len(data.get('actual', [])) else '',
+                    'forecast': data['forecast'][i] if i < len(data.get('forecast', [])) else '',
+                    'previous': data['previous'][i] if i < len(data.get('previous', [])) else '',
+                    'country_name': data['nat_hname'][i] if i < len(data.get('nat_hname', [])) else '',
+                    'country_code': data['natcd'][i] if i < len(data.get('natcd', [])) else '',
+                    'index': data['index'][i] if i < len(data.get('index', [])) else ''
+                }
+                
+                # 빈 이벤트는 제외
+                if event['event_name'].strip():
+                    economic_events.append(event)
+                    
+            except Exception as e:
+                print(f"이벤트 {i} 처리 중 오류: {e}")
+                continue
+    
+    result = {
+        "success": True,
+        "method": "ZeroIn API",
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "api_url": api_url,
+        "parameters": {
+            "start_date": start_date,
+            "end_date": end_date,
+            "countries": countries,
+            "importance_levels": importance_levels
+        },
+        "economic_data": economic_events,
+        "total_count": len(economic_events),
+        "raw_data_keys": list(data.keys()) if isinstance(data, dict) else []
+    }
+    
+    print(f"제로인 API 크롤링 완료: {len(economic_events)}개 이벤트 수집")
+    return result
+
+def zeroin_error(e):
+    """
+    제로인 수집 중 발생한 예외를 실패 결과로 변환
+    """
+    if isinstance(e, requests.RequestException):
+        error_msg = f"API 요청 오류: {str(e)}"
+    elif isinstance(e, json.JSONDecodeError):
+        error_msg = f"JSON 파싱 오류: {str(e)}"
+    else:
+        error_msg = f"제로인 API 크롤링 중 오류: {str(e)}"
+    print(error_msg)
+    return {
+        "success": False,
+        "error": error_msg,
+        "method": "ZeroIn API",
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+def crawl_zeroin_economic_calendar(start_date, end_date, countries=None, importance_levels=None, columnar=False):
     """
     제로인 API를 사용하여 경제캘린더 데이터를 가져오는 함수
     
@@ -399,163 +615,33 @@ def crawl_zeroin_economic_calendar(start_date, end_date, countries=None, importa
         end_date (str): 종료일 (YYYY-MM-DD 형식)
         countries (list): 국가 목록 ["KR", "US", "CN", "GB", "EU"] 등
         importance_levels (list): 중요도 목록 [1, 2, 3] (1:하, 2:중, 3:상)
+        columnar (bool): True 이면 economic_data(행 목록) 대신 economic_columns(필드별 배열) 반환
     
     Returns:
         dict: 경제지표 데이터와 메타 정보를 포함한 딕셔너리
     """
+    # 날짜 형식 검증
+    invalid = validate_zeroin_dates(start_date, end_date)
+    if invalid is not None:
+        return invalid
+    
     try:
-        # 날짜 형식 검증
-        try:
-            datetime.strptime(start_date, '%Y-%m-%d')
-            datetime.strptime(end_date, '%Y-%m-%d')
-        except ValueError:
-            return {
-                "success": False,
-                "error": "날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용해주세요.",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-        
-        # 기본 국가 설정 (전체)
-        if countries is None:
-            countries = ["cn", "kr", "gb", "us", "eu"]
-        
-        # 기본 중요도 설정 (전체)
-        if importance_levels is None:
-            importance_levels = [1, 2, 3]
-        
-        # 국가 코드와 이름 매핑
-        country_mapping = {
-            "cn": "China|중국",
-            "kr": "South Korea|대한민국", 
-            "gb": "United Kingdom|영국",
-            "us": "United States|미국",
-            "eu": "European Union|유럽연합"
-        }
-        
-        # 국가 파라미터 구성
-        str_nation_parts = []
-        str_natcd_parts = []
-        
-        for country_code in countries:
-            if country_code.lower() in country_mapping:
-                str_nation_parts.append(country_mapping[country_code.lower()])
-                str_natcd_parts.append(country_code.lower())
-        
-        str_nation = "|".join(str_nation_parts) + "|"
-        str_natcd = "|".join(str_natcd_parts) + "|"
-        str_importance = "|".join(map(str, importance_levels)) + "|"
-        
-        # API URL 구성
-        base_url = "https://asp.zeroin.co.kr/eco/includes/wei/module/json_getData.php"
-        params = {
-            "start_date": start_date,
-            "end_date": end_date,
-            "sort_code": "0",
-            "str_nation": str_nation,
-            "str_natcd": str_natcd,
-            "str_importance": str_importance
-        }
-        
-        # 헤더 설정
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/javascript, */*; q=0.01',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Referer': 'https://asp.zeroin.co.kr/',
-            'X-Requested-With': 'XMLHttpRequest'
-        }
+        request_info = zeroin_request(start_date, end_date, countries, importance_levels)
         
         print(f"제로인 API 요청: {start_date} ~ {end_date}")
-        print(f"국가: {countries}, 중요도: {importance_levels}")
+        print(f"국가: {request_info['countries']}, 중요도: {request_info['importance_levels']}")
         
         # API 요청
-        response = requests.get(base_url, params=params, headers=headers, timeout=15)
+        response = HttpClient.get(request_info["url"], params=request_info["params"], headers=request_info["headers"])
         response.raise_for_status()
         
         # JSON 응답 파싱
         data = response.json()
         
-        # 데이터 처리 및 구조화
-        economic_events = []
+        return parse_zeroin_response(start_date, end_date, request_info["countries"], request_info["importance_levels"], request_info["url"], data, columnar)
         
-        if all(key in data for key in ['date', 'time', 'kevent', 'importance']):
-            event_count = len(data['date'])
-            
-            for i in range(event_count):
-                try:
-                    event = {
-                        'date': data['date'][i] if i < len(data['date']) else '',
-                        'date_full': data['date_temp'][i] if i < len(data.get('date_temp', [])) else '',
-                        'day': data['day'][i] if i < len(data.get('day', [])) else '',
-                        'time': data['time'][i] if i < len(data['time']) else '',
-                        'event_name': data['kevent'][i] if i < len(data['kevent']) else '',
-                        'importance': data['importance'][i] if i < len(data['importance']) else '',
-                        'importance_level': get_importance_level(data['importance'][i] if i < len(data['importance']) else ''),
-                        'importance_class': data['importance_class'][i] if i < len(data.get('importance_class', [])) else '',
-                        'actual': data['actual'][i] if i < len(data.get('actual', [])) else '',
-                        'forecast': data['forecast'][i] if i < len(data.get('forecast', [])) else '',
-                        'previous': data['previous'][i] if i < len(data.get('previous', [])) else '',
-                        'country_name': data['nat_hname'][i] if i < len(data.get('nat_hname', [])) else '',
-                        'country_code': data['natcd'][i] if i < len(data.get('natcd', [])) else '',
-                        'index': data['index'][i] if i < len(data.get('index', [])) else ''
-                    }
-                    
-                    # 빈 이벤트는 제외
-                    if event['event_name'].strip():
-                        economic_events.append(event)
-                        
-                except Exception as e:
-                    print(f"이벤트 {i} 처리 중 오류: {e}")
-                    continue
-        
-        result = {
-            "success": True,
-            "method": "ZeroIn API",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "api_url": base_url,
-            "parameters": {
-                "start_date": start_date,
-                "end_date": end_date,
-                "countries": countries,
-                "importance_levels": importance_levels
-            },
-            "economic_data": economic_events,
-            "total_count": len(economic_events),
-            "raw_data_keys": list(data.keys()) if isinstance(data, dict) else []
-        }
-        
-        print(f"제로인 API 크롤링 완료: {len(economic_events)}개 이벤트 수집")
-        return result
-        
-    except requests.RequestException as e:
-        error_msg = f"API 요청 오류: {str(e)}"
-        print(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "method": "ZeroIn API",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-    except json.JSONDecodeError as e:
-        error_msg = f"JSON 파싱 오류: {str(e)}"
-        print(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "method": "ZeroIn API",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
     except Exception as e:
-        error_msg = f"제로인 API 크롤링 중 오류: {str(e)}"
-        print(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "method": "ZeroIn API",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
+        return zeroin_error(e)
 
 def get_importance_level(importance_text):
     """
@@ -604,7 +690,7 @@ def extract_country_from_event(event_name):
     
     return ""
 
-def getEconomicCalendarData(start_date, end_date, countries=None, importance_levels=None):
+def getEconomicCalendarData(start_date, end_date, countries=None, importance_levels=None, columnar=False):
     """
     경제캘린더 데이터 크롤링 메인 함수 (제로인 API 사용)
     
@@ -613,6 +699,7 @@ def getEconomicCalendarData(start_date, end_date, countries=None, importance_lev
         end_date (str): 종료일 (YYYY-MM-DD 형식)  
         countries (list): 국가 코드 목록 ["KR", "US", "CN", "GB", "EU"]
         importance_levels (list): 중요도 목록 [1, 2, 3] (1:하, 2:중, 3:상)
+        columnar (bool): True 이면 필드별 배열(economic_columns)로 반환
     
     Returns:
         dict: 경제지표 데이터와 메타 정보
@@ -630,7 +717,7 @@ def getEconomicCalendarData(start_date, end_date, countries=None, importance_lev
     if countries:
         countries = [country.lower() for country in countries]
     
-    return crawl_zeroin_economic_calendar(start_date, end_date, countries, importance_levels)
+    return crawl_zeroin_economic_calendar(start_date, end_date, countries, importance_levels, columnar)
 
 def test_zeroin_api():
     """
@@ -719,6 +806,130 @@ def test_zeroin_api():
     
     return result
 
+def fnguide_month_request(year, month):
+    """
+    FnGuide 월별 주식 일정 요청 정보 (동기/비동기 크롤러 공용)
+    
+    Returns:
+        dict: url, params, headers
+    """
+    # 월을 2자리로 맞춤 (01, 02, ..., 12)
+    month_str = f"{month:02d}"
+    
+    # API URL 구성
+    base_url = "https://comp.fnguide.com/SVO2/json/data/05_01"
+    filename = f"{year}{month_str}.json"
+    api_url = f"{base_url}/{filename}"
+    
+    # 현재 타임스탬프를 파라미터로 추가 (캐시 방지)
+    timestamp = int(time.time() * 1000)
+    
+    # 헤더 설정 (FnGuide 사이트에서 요구하는 형태)
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'application/json, text/javascript, */*; q=0.01',
+        'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Referer': 'https://comp.fnguide.com/SVO2/ASP/SVD_comp_calendar.asp',
+        'X-Requested-With': 'XMLHttpRequest'
+    }
+    
+    return {"url": api_url, "params": {'_': timestamp}, "headers": headers}
+
+def parse_fnguide_month(year, month, api_url, response):
+    """
+    FnGuide 월별 응답을 주식 일정 결과로 변환 (파싱 실패 시 예외)
+    """
+    month_str = f"{month:02d}"
+    
+    # JSON 응답 파싱 (BOM 문제 해결)
+    try:
+        # UTF-8 BOM 제거하여 파싱
+        content_text = response.content.decode('utf-8-sig')
+        data = json.loads(content_text)
+    except UnicodeDecodeError:
+        # 일반 UTF-8로 시도
+        data = response.json()
+    except json.JSONDecodeError:
+        # 응답 내용 확인을 위해 일부 출력
+        print(f"JSON 파싱 실패. 응답 내용 (처음 200자): {response.text[:200]}")
+        raise
+    
+    # 데이터 구조 확인 및 처리
+    stock_events = []
+    
+    if 'comp' in data and isinstance(data['comp'], list):
+        for event_data in data['comp']:
+            try:
+                # 이벤트 데이터 구조화
+                event = {
+                    'key': event_data.get('KEY', ''),
+                    'serial_number': event_data.get('일련번호', ''),
+                    'base_date': event_data.get('기준일자', ''),
+                    'company_name': event_data.get('기업명', ''),
+                    'activity_code': event_data.get('활동코드', ''),
+                    'event_name': event_data.get('이벤트명', ''),
+                    'event_code': event_data.get('이벤트코드', ''),
+                    'date_time': event_data.get('일자', ''),
+                    'stock_code': event_data.get('종목명', ''),
+                    'stock_type': event_data.get('주식구분', ''),
+                    'event_type': event_data.get('종류', ''),
+                    'change_stocks': event_data.get('변동주식수', ''),
+                    'issue_price': event_data.get('발행가', ''),
+                    'capital_after_change': event_data.get('변동후자본금', ''),
+                    'total_issued_stocks': event_data.get('총발행주식수', ''),
+                    'new_stock_listing_date': event_data.get('신주상장일', ''),
+                    'ex_rights_date': event_data.get('권리락일', ''),
+                    'payment_date': event_data.get('납입일', ''),
+                    'allocation_base_date': event_data.get('배정기준일', ''),
+                    'allocation_ratio': event_data.get('배정비율', ''),
+                    'discount_ratio': event_data.get('할인비율', ''),
+                    'note': event_data.get('비고', ''),
+                    'year_month': f"{year}-{month_str}"
+                }
+                
+                # 빈 이벤트가 아닌 경우만 추가
+                if event['company_name'] or event['event_name'] or event['event_type']:
+                    stock_events.append(event)
+                    
+            except Exception as e:
+                print(f"이벤트 데이터 처리 중 오류: {e}")
+                continue
+    
+    result = {
+        "success": True,
+        "method": "FnGuide API",
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "api_url": api_url,
+        "year_month": f"{year}-{month_str}",
+        "stock_events": stock_events,
+        "total_count": len(stock_events),
+        "raw_data_structure": list(data.keys()) if isinstance(data, dict) else []
+    }
+    
+    print(f"FnGuide {year}년 {month}월 크롤링 완료: {len(stock_events)}개 이벤트 수집")
+    return result
+
+def fnguide_month_error(year, month, e):
+    """
+    FnGuide 월별 수집 중 발생한 예외를 실패 결과로 변환
+    """
+    if isinstance(e, requests.RequestException):
+        error_msg = f"API 요청 오류: {str(e)}"
+    elif isinstance(e, json.JSONDecodeError):
+        error_msg = f"JSON 파싱 오류: {str(e)}"
+    else:
+        error_msg = f"FnGuide API 크롤링 중 오류: {str(e)}"
+    print(error_msg)
+    return {
+        "success": False,
+        "error": error_msg,
+        "method": "FnGuide API",
+        "year_month": f"{year}-{month:02d}",
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
 def crawl_fnguide_calendar_month(year, month):
     """
     FnGuide에서 특정 연월의 주식 일정 데이터를 가져오는 함수
@@ -731,133 +942,78 @@ def crawl_fnguide_calendar_month(year, month):
         dict: 주식 일정 데이터와 메타 정보를 포함한 딕셔너리
     """
     try:
-        # 월을 2자리로 맞춤 (01, 02, ..., 12)
-        month_str = f"{month:02d}"
-        
-        # API URL 구성
-        base_url = "https://comp.fnguide.com/SVO2/json/data/05_01"
-        filename = f"{year}{month_str}.json"
-        api_url = f"{base_url}/{filename}"
-        
-        # 현재 타임스탬프를 파라미터로 추가 (캐시 방지)
-        timestamp = int(time.time() * 1000)
-        
-        # 헤더 설정 (FnGuide 사이트에서 요구하는 형태)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/javascript, */*; q=0.01',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Referer': 'https://comp.fnguide.com/SVO2/ASP/SVD_comp_calendar.asp',
-            'X-Requested-With': 'XMLHttpRequest'
-        }
+        request_info = fnguide_month_request(year, month)
         
         # API 요청
-        params = {'_': timestamp}
-        print(f"FnGuide API 요청: {year}년 {month}월 ({api_url})")
-        
-        response = requests.get(api_url, params=params, headers=headers, timeout=15)
+        print(f"FnGuide API 요청: {year}년 {month}월 ({request_info['url']})")
+        response = HttpClient.get(request_info["url"], params=request_info["params"], headers=request_info["headers"])
         response.raise_for_status()
         
-        # JSON 응답 파싱 (BOM 문제 해결)
-        try:
-            # UTF-8 BOM 제거하여 파싱
-            content_text = response.content.decode('utf-8-sig')
-            data = json.loads(content_text)
-        except UnicodeDecodeError:
-            # 일반 UTF-8로 시도
-            data = response.json()
-        except json.JSONDecodeError:
-            # 응답 내용 확인을 위해 일부 출력
-            print(f"JSON 파싱 실패. 응답 내용 (처음 200자): {response.text[:200]}")
-            raise
-        
-        # 데이터 구조 확인 및 처리
-        stock_events = []
-        
-        if 'comp' in data and isinstance(data['comp'], list):
-            for event_data in data['comp']:
-                try:
-                    # 이벤트 데이터 구조화
-                    event = {
-                        'key': event_data.get('KEY', ''),
-                        'serial_number': event_data.get('일련번호', ''),
-                        'base_date': event_data.get('기준일자', ''),
-                        'company_name': event_data.get('기업명', ''),
-                        'activity_code': event_data.get('활동코드', ''),
-                        'event_name': event_data.get('이벤트명', ''),
-                        'event_code': event_data.get('이벤트코드', ''),
-                        'date_time': event_data.get('일자', ''),
-                        'stock_code': event_data.get('종목명', ''),
-                        'stock_type': event_data.get('주식구분', ''),
-                        'event_type': event_data.get('종류', ''),
-                        'change_stocks': event_data.get('변동주식수', ''),
-                        'issue_price': event_data.get('발행가', ''),
-                        'capital_after_change': event_data.get('변동후자본금', ''),
-                        'total_issued_stocks': event_data.get('총발행주식수', ''),
-                        'new_stock_listing_date': event_data.get('신주상장일', ''),
-                        'ex_rights_date': event_data.get('권리락일', ''),
-                        'payment_date': event_data.get('납입일', ''),
-                        'allocation_base_date': event_data.get('배정기준일', ''),
-                        'allocation_ratio': event_data.get('배정비율', ''),
-                        'discount_ratio': event_data.get('할인비율', ''),
-                        'note': event_data.get('비고', ''),
-                        'year_month': f"{year}-{month_str}"
-                    }
-                    
-                    # 빈 이벤트가 아닌 경우만 추가
-                    if event['company_name'] or event['event_name'] or event['event_type']:
-                        stock_events.append(event)
-                        
-                except Exception as e:
-                    print(f"이벤트 데이터 처리 중 오류: {e}")
-                    continue
-        
-        result = {
-            "success": True,
-            "method": "FnGuide API",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "api_url": api_url,
-            "year_month": f"{year}-{month_str}",
-            "stock_events": stock_events,
-            "total_count": len(stock_events),
-            "raw_data_structure": list(data.keys()) if isinstance(data, dict) else []
-        }
-        
-        print(f"FnGuide {year}년 {month}월 크롤링 완료: {len(stock_events)}개 이벤트 수집")
-        return result
+        return parse_fnguide_month(year, month, request_info["url"], response)
         
-    except requests.RequestException as e:
-        error_msg = f"API 요청 오류: {str(e)}"
-        print(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "method": "FnGuide API",
-            "year_month": f"{year}-{month:02d}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-    except json.JSONDecodeError as e:
-        error_msg = f"JSON 파싱 오류: {str(e)}"
-        print(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "method": "FnGuide API",
-            "year_month": f"{year}-{month:02d}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
     except Exception as e:
-        error_msg = f"FnGuide API 크롤링 중 오류: {str(e)}"
-        print(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "method": "FnGuide API",
-            "year_month": f"{year}-{month:02d}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return fnguide_month_error(year, month, e)
+
+def summarizeFnGuideCalendar(year, months, month_results):
+    """
+    월별 수집 결과(결과 dict 또는 예외)를 요청한 월 순서대로 합쳐 연간 결과로 정리
+    (동기 크롤러와 AsyncCrawler 가 같은 형식을 쓰도록 분리)
+    """
+    all_events = []
+    successful_months = []
+    failed_months = []
+    
+    for month, month_result in zip(months, month_results):
+        if isinstance(month_result, Exception):
+            failed_months.append(month)
+            print(f"{month}월 처리 중 오류: {month_result}")
+        elif month_result.get('success', False):
+            events = month_result.get('stock_events', [])
+            all_events.extend(events)
+            successful_months.append(month)
+            print(f"{month}월: {len(events)}개 이벤트 수집 성공")
+        else:
+            failed_months.append(month)
+            print(f"{month}월: 수집 실패 - {month_result.get('error', '알 수 없는 오류')}")
+    
+    # 이벤트 타입별 통계
+    event_type_stats = {}
+    company_stats = {}
+    
+    for event in all_events:
+        # 이벤트 타입별 카운트
+        event_type = event.get('event_type', '기타')
+        event_type_stats[event_type] = event_type_stats.get(event_type, 0) + 1
+        
+        # 회사별 카운트
+        company_name = event.get('company_name', '기타')
+        company_stats[company_name] = company_stats.get(company_name, 0) + 1
+    
+    # 날짜별로 정렬
+    all_events.sort(key=lambda x: x.get('date_time', ''))
+    
+    # 결과 구성
+    result = {
+        "success": len(successful_months) > 0,
+        "method": "FnGuide API (연간 데이터)",
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "target_year": year,
+        "requested_months": months,
+        "successful_months": successful_months,
+        "failed_months": failed_months,
+        "stock_events": all_events,
+        "total_count": len(all_events),
+        "statistics": {
+            "event_types": dict(sorted(event_type_stats.items(), key=lambda x: x[1], reverse=True)),
+            "top_companies": dict(sorted(company_stats.items(), key=lambda x: x[1], reverse=True)[:10]),
+            "events_per_month": {month: len([e for e in all_events if e.get('year_month', '').endswith(f"{month:02d}")]) for month in successful_months}
         }
+    }
+    
+    if failed_months:
+        result["warnings"] = f"{len(failed_months)}개월 데이터 수집 실패: {failed_months}"
+    
+    return result
 
 def getFnGuideStockCalendar(year=None, months=None):
     """
@@ -881,74 +1037,25 @@ def getFnGuideStockCalendar(year=None, months=None):
         print(f"=== FnGuide 주식 일정 크롤링 시작: {year}년 ===")
         print(f"대상 월: {months}")
         
-        all_events = []
-        successful_months = []
-        failed_months = []
-        
-        # 각 월별로 데이터 수집
-        for month in months:
+        def fetch_month(month):
             try:
                 print(f"\n{month}월 데이터 수집 중...")
-                month_result = crawl_fnguide_calendar_month(year, month)
-                
-                if month_result.get('success', False):
-                    events = month_result.get('stock_events', [])
-                    all_events.extend(events)
-                    successful_months.append(month)
-                    print(f"{month}월: {len(events)}개 이벤트 수집 성공")
-                else:
-                    failed_months.append(month)
-                    print(f"{month}월: 수집 실패 - {month_result.get('error', '알 수 없는 오류')}")
-                
-                # API 호출 간격 조절 (서버 부하 방지)
-                time.sleep(0.5)
-                
+                return crawl_fnguide_calendar_month(year, month)
             except Exception as e:
-                failed_months.append(month)
-                print(f"{month}월 처리 중 오류: {e}")
-                continue
-        
-        # 이벤트 타입별 통계
-        event_type_stats = {}
-        company_stats = {}
-        
-        for event in all_events:
-            # 이벤트 타입별 카운트
-            event_type = event.get('event_type', '기타')
-            event_type_stats[event_type] = event_type_stats.get(event_type, 0) + 1
-            
-            # 회사별 카운트
-            company_name = event.get('company_name', '기타')
-            company_stats[company_name] = company_stats.get(company_name, 0) + 1
+                return e
         
-        # 날짜별로 정렬
-        all_events.sort(key=lambda x: x.get('date_time', ''))
+        # 월별 데이터를 동시에 수집 (FnGuide 호출 간격은 HttpClient 의 호스트별 토큰 버킷이 조절)
+        # 결과는 요청한 월 순서대로 합침
+        workers = max(1, min(setting.FNGUIDE_MAX_WORKERS, len(months)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            month_results = list(executor.map(fetch_month, months))
         
-        # 결과 구성
-        result = {
-            "success": len(successful_months) > 0,
-            "method": "FnGuide API (연간 데이터)",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "target_year": year,
-            "requested_months": months,
-            "successful_months": successful_months,
-            "failed_months": failed_months,
-            "stock_events": all_events,
-            "total_count": len(all_events),
-            "statistics": {
-                "event_types": dict(sorted(event_type_stats.items(), key=lambda x: x[1], reverse=True)),
-                "top_companies": dict(sorted(company_stats.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "events_per_month": {month: len([e for e in all_events if e.get('year_month', '').endswith(f"{month:02d}")]) for month in successful_months}
-            }
-        }
-        
-        if failed_months:
-            result["warnings"] = f"{len(failed_months)}개월 데이터 수집 실패: {failed_months}"
+        result = summarizeFnGuideCalendar(year, months, month_results)
         
         print(f"\n=== FnGuide 크롤링 완료 ===")
-        print(f"성공: {len(successful_months)}개월 / 실패: {len(failed_months)}개월")
-        print(f"총 수집 이벤트: {len(all_events)}개")
-        print(f"주요 이벤트 타입: {list(event_type_stats.keys())[:5]}")
+        print(f"성공: {len(result['successful_months'])}개월 / 실패: {len(result['failed_months'])}개월")
+        print(f"총 수집 이벤트: {result['total_count']}개")
+        print(f"주요 이벤트 타입: {list(result['statistics']['event_types'].keys())[:5]}")
         
         return result
         
@@ -1063,158 +1170,233 @@ def test_fnguide_api():
     
     return multi_result if 'multi_result' in locals() else single_result
 
-def crawl_monthly_holidays(year, month):
+def holiday_month_request(year, month):
     """
-    공공데이터포털 한국천문연구원 API에서 특정 연월의 공휴일 정보를 가져오는 함수
-    
-    Args:
-        year (int): 연도 (예: 2024)
-        month (int): 월 (1-12)
+    한국천문연구원 월별 공휴일 요청 정보 (동기/비동기 크롤러 공용)
     
     Returns:
-        dict: 공휴일 정보와 메타 정보를 포함한 딕셔너리
+        dict: url, params, headers
     """
+    # 월을 2자리로 맞춤 (01, 02, ..., 12)
+    month_str = f"{month:02d}"
+    
+    # API URL 및 파라미터 설정
+    base_url = KOREA_DATA_PORTAL_HOLIDAY_URL
+    service_key = KOREA_DATA_PORTAL_API_KEY
+    
+    params = {
+        'serviceKey': service_key,
+        'solYear': str(year),
+        'solMonth': month_str,
+        'numOfRows': '100'  # 한 달에 100개면 충분
+    }
+    
+    # 헤더 설정
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'application/xml, text/xml, */*',
+        'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+        'Connection': 'keep-alive'
+    }
+    
+    return {"url": base_url, "params": params, "headers": headers}
+
+def parse_holiday_month(year, month, api_url, response):
+    """
+    한국천문연구원 월별 응답(XML)을 공휴일 결과로 변환 (API 오류 코드, XML 오류는 실패 결과)
+    """
+    month_str = f"{month:02d}"
+    
+    # XML 응답 파싱
     try:
-        # 월을 2자리로 맞춤 (01, 02, ..., 12)
-        month_str = f"{month:02d}"
-        
-        # API URL 및 파라미터 설정
-        base_url = KOREA_DATA_PORTAL_HOLIDAY_URL
-        service_key = KOREA_DATA_PORTAL_API_KEY
-        
-        params = {
-            'serviceKey': service_key,
-            'solYear': str(year),
-            'solMonth': month_str,
-            'numOfRows': '100'  # 한 달에 100개면 충분
-        }
+        # UTF-8로 응답 처리
+        response.encoding = 'utf-8'
+        xml_content = response.text
         
-        # 헤더 설정
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/xml, text/xml, */*',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Connection': 'keep-alive'
-        }
+        # XML 파싱
+        root = ET.fromstring(xml_content)
         
-        print(f"한국천문연구원 API 요청: {year}년 {month}월")
+        holidays = []
         
-        # API 요청
-        response = requests.get(base_url, params=params, headers=headers, timeout=15)
-        response.raise_for_status()
+        # XML 구조에 따라 파싱 (공공데이터포털 표준 구조)
+        # header 정보 확인
+        header = root.find('.//header')
+        result_code = header.find('resultCode').text if header is not None and header.find('resultCode') is not None else 'unknown'
+        result_msg = header.find('resultMsg').text if header is not None and header.find('resultMsg') is not None else 'unknown'
         
-        # XML 응답 파싱
-        try:
-            # UTF-8로 응답 처리
-            response.encoding = 'utf-8'
-            xml_content = response.text
-            
-            # XML 파싱
-            root = ET.fromstring(xml_content)
-            
-            holidays = []
-            
-            # XML 구조에 따라 파싱 (공공데이터포털 표준 구조)
-            # header 정보 확인
-            header = root.find('.//header')
-            result_code = header.find('resultCode').text if header is not None and header.find('resultCode') is not None else 'unknown'
-            result_msg = header.find('resultMsg').text if header is not None and header.find('resultMsg') is not None else 'unknown'
-            
-            if result_code != '00':
-                return {
-                    "success": False,
-                    "error": f"API 오류 (코드: {result_code}): {result_msg}",
-                    "year_month": f"{year}-{month_str}",
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-            
-            # body 에서 items 찾기
-            items = root.findall('.//item')
-            
-            for item in items:
-                try:
-                    holiday = {
-                        'date_code': item.find('locdate').text if item.find('locdate') is not None else '',
-                        'date_name': item.find('dateName').text if item.find('dateName') is not None else '',
-                        'is_holiday': item.find('isHoliday').text if item.find('isHoliday') is not None else 'Y',
-                        'year': year,
-                        'month': month,
-                        'year_month': f"{year}-{month_str}"
-                    }
-                    
-                    # 날짜 코드를 실제 날짜로 변환 (YYYYMMDD -> YYYY-MM-DD)
-                    if holiday['date_code'] and len(holiday['date_code']) == 8:
-                        date_str = holiday['date_code']
-                        formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                        holiday['formatted_date'] = formatted_date
-                        
-                        # 요일 계산
-                        try:
-                            date_obj = datetime.strptime(formatted_date, '%Y-%m-%d')
-                            holiday['weekday'] = date_obj.strftime('%A')
-                            holiday['weekday_kr'] = ['월', '화', '수', '목', '금', '토', '일'][date_obj.weekday()]
-                        except:
-                            holiday['weekday'] = ''
-                            holiday['weekday_kr'] = ''
-                    else:
-                        holiday['formatted_date'] = ''
-                        holiday['weekday'] = ''
-                        holiday['weekday_kr'] = ''
-                    
-                    if holiday['date_name']:  # 빈 공휴일명은 제외
-                        holidays.append(holiday)
-                        
-                except Exception as e:
-                    print(f"공휴일 항목 처리 중 오류: {e}")
-                    continue
-            
-            result = {
-                "success": True,
-                "method": "Korean Astronomy API",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "api_url": base_url,
-                "year_month": f"{year}-{month_str}",
-                "holidays": holidays,
-                "total_count": len(holidays),
-                "api_result_code": result_code,
-                "api_result_msg": result_msg
-            }
-            
-            print(f"한국천문연구원 {year}년 {month}월 크롤링 완료: {len(holidays)}개 공휴일 수집")
-            return result
-            
-        except ET.ParseError as e:
-            error_msg = f"XML 파싱 오류: {str(e)}"
-            print(error_msg)
-            print(f"응답 내용 (처음 500자): {response.text[:500]}")
+        if result_code != '00':
             return {
                 "success": False,
-                "error": error_msg,
+                "error": f"API 오류 (코드: {result_code}): {result_msg}",
                 "year_month": f"{year}-{month_str}",
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
-            
-    except requests.RequestException as e:
-        error_msg = f"API 요청 오류: {str(e)}"
-        print(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
+        
+        # body 에서 items 찾기
+        items = root.findall('.//item')
+        
+        for item in items:
+            try:
+                holiday = {
+                    'date_code': item.find('locdate').text if item.find('locdate') is not None else '',
+                    'date_name': item.find('dateName').text if item.find('dateName') is not None else '',
+                    'is_holiday': item.find('isHoliday').text if item.find('isHoliday') is not None else 'Y',
+                    'year': year,
+                    'month': month,
+                    'year_month': f"{year}-{month_str}"
+                }
+                
+                # 날짜 코드를 실제 날짜로 변환 (YYYYMMDD -> YYYY-MM-DD)
+                if holiday['date_code'] and len(holiday['date_code']) == 8:
+                    date_str = holiday['date_code']
+                    formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+                    holiday['formatted_date'] = formatted_date
+                    
+                    # 요일 계산
+                    try:
+                        date_obj = datetime.strptime(formatted_date, '%Y-%m-%d')
+                        holiday['weekday'] = date_obj.strftime('%A')
+                        holiday['weekday_kr'] = ['월', '화', '수', '목', '금', '토', '일'][date_obj.weekday()]
+                    except:
+                        holiday['weekday'] = ''
+                        holiday['weekday_kr'] = ''
+                else:
+                    holiday['formatted_date'] = ''
+                    holiday['weekday'] = ''
+                    holiday['weekday_kr'] = ''
+                
+                if holiday['date_name']:  # 빈 공휴일명은 제외
+                    holidays.append(holiday)
+                    
+            except Exception as e:
+                print(f"공휴일 항목 처리 중 오류: {e}")
+                continue
+        
+        result = {
+            "success": True,
             "method": "Korean Astronomy API",
-            "year_month": f"{year}-{month:02d}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "api_url": api_url,
+            "year_month": f"{year}-{month_str}",
+            "holidays": holidays,
+            "total_count": len(holidays),
+            "api_result_code": result_code,
+            "api_result_msg": result_msg
         }
-    except Exception as e:
-        error_msg = f"한국천문연구원 API 크롤링 중 오류: {str(e)}"
+        
+        print(f"한국천문연구원 {year}년 {month}월 크롤링 완료: {len(holidays)}개 공휴일 수집")
+        return result
+        
+    except ET.ParseError as e:
+        error_msg = f"XML 파싱 오류: {str(e)}"
         print(error_msg)
+        print(f"응답 내용 (처음 500자): {response.text[:500]}")
         return {
             "success": False,
             "error": error_msg,
-            "method": "Korean Astronomy API",
-            "year_month": f"{year}-{month:02d}",
+            "year_month": f"{year}-{month_str}",
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
 
+def holiday_month_error(year, month, e):
+    """
+    공휴일 월별 수집 중 발생한 예외를 실패 결과로 변환
+    """
+    if isinstance(e, requests.RequestException):
+        error_msg = f"API 요청 오류: {str(e)}"
+    else:
+        error_msg = f"한국천문연구원 API 크롤링 중 오류: {str(e)}"
+    print(error_msg)
+    return {
+        "success": False,
+        "error": error_msg,
+        "method": "Korean Astronomy API",
+        "year_month": f"{year}-{month:02d}",
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+def crawl_monthly_holidays(year, month):
+    """
+    공공데이터포털 한국천문연구원 API에서 특정 연월의 공휴일 정보를 가져오는 함수
+    
+    Args:
+        year (int): 연도 (예: 2024)
+        month (int): 월 (1-12)
+    
+    Returns:
+        dict: 공휴일 정보와 메타 정보를 포함한 딕셔너리
+    """
+    try:
+        request_info = holiday_month_request(year, month)
+        
+        print(f"한국천문연구원 API 요청: {year}년 {month}월")
+        
+        # API 요청
+        response = HttpClient.get(request_info["url"], params=request_info["params"], headers=request_info["headers"])
+        response.raise_for_status()
+        
+        return parse_holiday_month(year, month, request_info["url"], response)
+        
+    except Exception as e:
+        return holiday_month_error(year, month, e)
+
+def summarizeKoreanHolidays(year, all_holidays, successful_months, failed_months, method="Korean Astronomy API (연간 데이터)"):
+    """
+    월별로 모은 공휴일 목록을 연간 결과(통계, 분류 포함)로 정리
+    (API 수집 결과와 HolidayCalendar 의 로컬 계산 결과가 같은 형식을 쓰도록 분리)
+    """
+    # 공휴일 통계 및 분석
+    holiday_type_stats = {}
+    monthly_stats = {}
+    
+    for holiday in all_holidays:
+        # 공휴일 이름별 카운트
+        holiday_name = holiday.get('date_name', '기타')
+        holiday_type_stats[holiday_name] = holiday_type_stats.get(holiday_name, 0) + 1
+        
+        # 월별 카운트
+        month = holiday.get('month', 0)
+        monthly_stats[month] = monthly_stats.get(month, 0) + 1
+    
+    # 날짜별로 정렬
+    all_holidays.sort(key=lambda x: x.get('date_code', ''))
+    
+    # 특별한 공휴일 분류
+    national_holidays = [h for h in all_holidays if any(keyword in h.get('date_name', '') for keyword in ['절', '기념일', '광복', '개천', '한글'])]
+    traditional_holidays = [h for h in all_holidays if any(keyword in h.get('date_name', '') for keyword in ['설날', '추석', '부처님', '어린이날'])]
+    substitute_holidays = [h for h in all_holidays if '대체공휴일' in h.get('date_name', '')]
+    
+    # 결과 구성
+    result = {
+        "success": len(successful_months) > 0,
+        "method": method,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "target_year": year,
+        "successful_months": successful_months,
+        "failed_months": failed_months,
+        "holidays": all_holidays,
+        "total_count": len(all_holidays),
+        "statistics": {
+            "holiday_types": dict(sorted(holiday_type_stats.items(), key=lambda x: x[1], reverse=True)),
+            "monthly_distribution": {f"{month}월": count for month, count in sorted(monthly_stats.items())},
+            "categories": {
+                "national_holidays": len(national_holidays),
+                "traditional_holidays": len(traditional_holidays), 
+                "substitute_holidays": len(substitute_holidays)
+            }
+        },
+        "holiday_details": {
+            "national_holidays": national_holidays,
+            "traditional_holidays": traditional_holidays,
+            "substitute_holidays": substitute_holidays
+        }
+    }
+    
+    if failed_months:
+        result["warnings"] = f"{len(failed_months)}개월 데이터 수집 실패: {failed_months}"
+    
+    return result
+
 def getKoreanHolidays(year=None):
     """
     한국천문연구원 API에서 1년치 공휴일 정보를 가져오는 메인 함수
@@ -1262,60 +1444,12 @@ def getKoreanHolidays(year=None):
                 print(f"{month}월 처리 중 오류: {e}")
                 continue
         
-        # 공휴일 통계 및 분석
-        holiday_type_stats = {}
-        monthly_stats = {}
-        
-        for holiday in all_holidays:
-            # 공휴일 이름별 카운트
-            holiday_name = holiday.get('date_name', '기타')
-            holiday_type_stats[holiday_name] = holiday_type_stats.get(holiday_name, 0) + 1
-            
-            # 월별 카운트
-            month = holiday.get('month', 0)
-            monthly_stats[month] = monthly_stats.get(month, 0) + 1
-        
-        # 날짜별로 정렬
-        all_holidays.sort(key=lambda x: x.get('date_code', ''))
-        
-        # 특별한 공휴일 분류
-        national_holidays = [h for h in all_holidays if any(keyword in h.get('date_name', '') for keyword in ['절', '기념일', '광복', '개천', '한글'])]
-        traditional_holidays = [h for h in all_holidays if any(keyword in h.get('date_name', '') for keyword in ['설날', '추석', '부처님', '어린이날'])]
-        substitute_holidays = [h for h in all_holidays if '대체공휴일' in h.get('date_name', '')]
-        
-        # 결과 구성
-        result = {
-            "success": len(successful_months) > 0,
-            "method": "Korean Astronomy API (연간 데이터)",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "target_year": year,
-            "successful_months": successful_months,
-            "failed_months": failed_months,
-            "holidays": all_holidays,
-            "total_count": len(all_holidays),
-            "statistics": {
-                "holiday_types": dict(sorted(holiday_type_stats.items(), key=lambda x: x[1], reverse=True)),
-                "monthly_distribution": {f"{month}월": count for month, count in sorted(monthly_stats.items())},
-                "categories": {
-                    "national_holidays": len(national_holidays),
-                    "traditional_holidays": len(traditional_holidays), 
-                    "substitute_holidays": len(substitute_holidays)
-                }
-            },
-            "holiday_details": {
-                "national_holidays": national_holidays,
-                "traditional_holidays": traditional_holidays,
-                "substitute_holidays": substitute_holidays
-            }
-        }
-        
-        if failed_months:
-            result["warnings"] = f"{len(failed_months)}개월 데이터 수집 실패: {failed_months}"
+        result = summarizeKoreanHolidays(year, all_holidays, successful_months, failed_months)
         
         print(f"\n=== 한국 공휴일 정보 수집 완료 ===")
         print(f"성공: {len(successful_months)}개월 / 실패: {len(failed_months)}개월")
         print(f"총 공휴일 수: {len(all_holidays)}일")
-        print(f"주요 공휴일: {list(holiday_type_stats.keys())[:5]}")
+        print(f"주요 공휴일: {list(result['statistics']['holiday_types'].keys())[:5]}")
         
         return result
         
@@ -1,9 +1,12 @@
 from xml.etree.ElementTree import Element, SubElement, ElementTree
 import xml.etree.ElementTree as ET
-import sys, os
+import sys, os, threading, atexit
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 import setting
 from datetime import datetime
-import JsonDataBase
+import numpy as np
+import JsonDataBase, RankJournal, FileWriter, Storage
 
 # [PyInstaller에 의해 임시폴더에서 실행될 경우 임시폴더로 접근하는 함수]
 def resource_path(relative_path):
@@ -13,121 +16,250 @@ def resource_path(relative_path):
       base_path = os.path.abspath(".")
   return os.path.join(base_path, relative_path)
 
-def MakeXmlFile(xml_path, Good_Invest_Real_list, stock):
-    isSuccess = True
-
-    try:
-      root = Element("UESRDATA")
-
-      #해당 월 몇번 업데이트 되었는지 카운트하는 항목 1개 생성
+# [스트리밍 XML 리더]
+# 월별 XML 은 <UESRDATA><KRX><CODE/><RANKSUM/><NAME/><COUNT/><FULLCOUNT/></KRX>...</UESRDATA> 형태의 평평한 레코드 목록이므로
+# 전체 트리를 만들지 않고 iterparse 로 레코드 하나씩 읽은 뒤 바로 비워서 파일 크기와 무관하게 일정한 메모리로 읽음
+RankRecord = namedtuple('RankRecord', ['code', 'name', 'rankSum', 'count', 'fullCount'])
+
+def IterRankRecords(xml_path, stock=None, root_attrib=None):
+    """월별 XML 의 종목 레코드를 RankRecord 로 하나씩 반환
+    stock 을 지정하면 해당 태그만, root_attrib(dict) 를 넘기면 루트 속성을 채워줌"""
+    with open(xml_path, 'rb') as f:
+      depth = 0
+      root = None
+      for event, elem in ET.iterparse(f, events=('start', 'end')):
+        if event == 'start':
+          depth += 1
+          if root is None:
+            root = elem
+            if root_attrib is not None:
+              root_attrib.update(root.attrib)
+          continue
+
+        depth -= 1
+        if depth != 1:
+          continue
+
+        if stock is None or elem.tag == stock:
+          fields = {child.tag: child.text for child in elem}
+          yield RankRecord(
+            fields['CODE'],
+            fields['NAME'],
+            int(fields['RANKSUM']),
+            int(fields['COUNT']),
+            int(fields['FULLCOUNT'])
+          )
+
+        # 읽은 레코드는 루트에서 제거하여 메모리에 쌓이지 않도록 함
+        root.clear()
+
+def ReadXmlAggregate(xml_path):
+    """월별 XML 을 {코드: [이름, RANKSUM, COUNT, FULLCOUNT]} 와 저널 반영 오프셋으로 읽음"""
+    rows = {}
+    root_attrib = {}
+
+    for record in IterRankRecords(xml_path, root_attrib=root_attrib):
+      rows[record.code] = [record.name, record.rankSum, record.count, record.fullCount]
+
+    return rows, int(root_attrib.get('journalOffset', '0'))
+
+def WriteXmlFile(xml_path, stock, rows, journal_offset=0):
+    """집계 행을 임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 기존 월 파일은 손상되지 않음)"""
+    root = Element("UESRDATA")
+    root.set('journalOffset', str(journal_offset))
+
+    for code, (name, rank_sum, count, full_count) in rows.items():
       element = Element(stock)
       root.append(element)
       sub_element1 = SubElement(element, "CODE")
-      sub_element1.text = 'ALL'
+      sub_element1.text = code
       sub_element2 = SubElement(element, "RANKSUM")
-      sub_element2.text = '0'
+      sub_element2.text = str(rank_sum)
       sub_element3 = SubElement(element, "NAME")
-      sub_element3.text = '횟수'
+      sub_element3.text = name
       sub_element4 = SubElement(element, "COUNT")
-      sub_element4.text = '1'
+      sub_element4.text = str(count)
       sub_element5 = SubElement(element, "FULLCOUNT")
-      sub_element5.text = '1'
-
-      for Tag_Name in Good_Invest_Real_list:
-        element = Element(stock)
-        root.append(element)
-        sub_element1 = SubElement(element, "CODE")
-        sub_element1.text = Tag_Name['code']
-        sub_element2 = SubElement(element, "RANKSUM")
-        sub_element2.text = str(Tag_Name['rank'])
-        sub_element3 = SubElement(element, "NAME")
-        sub_element3.text = Tag_Name['name']
-        sub_element4 = SubElement(element, "COUNT")
-        sub_element4.text = '1' if int(Tag_Name['rank']) <= 30 else '0'
-        sub_element5 = SubElement(element, "FULLCOUNT")
-        sub_element5.text = '1'
-
-      tree = ElementTree(root)
-      tree.write(
-        xml_path,
-        encoding="utf-8",       # UTF-8 인코딩 지정
-        xml_declaration=True,   # XML 선언 자동 추가
-        short_empty_elements=False  # 빈 요소 자동 닫힘 방지)
-      )
-    except Exception as e:
-      isSuccess = False
-    return isSuccess
-
-def UpdateXmlFile(xml_path, new_list, stock):
-    isSuccess = True
-
+      sub_element5.text = str(full_count)
+
+    FileWriter.atomic_write(xml_path, lambda f: ElementTree(root).write(
+      f,
+      encoding="utf-8",       # UTF-8 인코딩 지정
+      xml_declaration=True,   # XML 선언 자동 추가
+      short_empty_elements=False  # 빈 요소 자동 닫힘 방지
+    ), binary=True)
+
+def FoldJournalBatches(rows, batches, names):
+    """저널 배치(= 하루치 순위 목록)를 월별 집계 행에 누적"""
+    for _, _, _, records in batches:
+      # 해당 월 몇번 업데이트 되었는지 카운트하는 항목
+      count_row = rows.setdefault('ALL', ['횟수', 0, 0, 0])
+      count_row[2] += 1
+      count_row[3] += 1
+
+      for code, rank in records:
+        row = rows.get(code)
+        if row is None:
+          rows[code] = [names.get(code, code), rank, 1 if rank <= 30 else 0, 1]
+        else:
+          row[1] += rank
+          row[2] += 1 if rank <= 30 else 0
+          row[3] += 1
+
+    return rows
+
+# [저널 -> 월별 XML 압축]
+_compaction_lock = threading.Lock()
+_compaction_event = threading.Event()
+_compaction_thread = None
+_folded_journal_sizes = {}
+
+def _compact_rank_journal(xml_dir, journal_dir):
+    """저널 배치를 접어서 월별 XML 갱신 (write_coalesced 로 실행 - XML 폴더 잠금 안), 실패한 파일이 있으면 예외"""
+    failed = []
+    with _compaction_lock:
+      names = None
+      for journal_file in os.listdir(journal_dir):
+        if not journal_file.endswith('.bin'):
+          continue
+
+        journal_path = journal_dir + '/' + journal_file
+        journal_size = os.path.getsize(journal_path)
+        if _folded_journal_sizes.get(journal_path) == journal_size:
+          continue
+
+        try:
+          xml_path = xml_dir + '/' + journal_file[:-4] + '.xml'
+          rows, journal_offset = ReadXmlAggregate(xml_path) if os.path.isfile(xml_path) else ({}, 0)
+
+          batches = RankJournal.ReadJournal(journal_path, journal_offset)
+          if batches:
+            if names is None:
+              names = RankJournal.ReadJournalNames(journal_dir)
+            FoldJournalBatches(rows, batches, names)
+            WriteXmlFile(xml_path, batches[-1][2], rows, batches[-1][0])
+
+          _folded_journal_sizes[journal_path] = journal_size
+        except Exception as e:
+          print(f"CompactRankJournal 오류 ({journal_file}): {e}")
+          failed.append(journal_file)
+
+    if failed:
+      raise RuntimeError(f"저널 압축 실패: {', '.join(failed)}")
+
+def CompactRankJournal(xml_dir=setting.XML_KR_READPATH, journal_dir=setting.RANK_JOURNAL_KR_PATH):
+    """아직 월별 XML 에 반영되지 않은 저널 배치를 접어서 XML 을 갱신"""
+    if not os.path.exists(journal_dir):
+      return True
+
+    # 여러 워커 프로세스가 같은 월 XML 을 동시에 갱신하지 않도록 XML 폴더 단위로 잠그고,
+    # 압축 요청이 몰리면 진행 중인 압축이 끝난 뒤 한 번만 다시 접음 (그 사이 쌓인 배치는 모두 그 한 번에 반영)
     try:
-      with open(xml_path, 'r', encoding='utf-8') as f :
-        print('success0')
-        tree = ET.parse(f)
-        root = tree.getroot()
-
-      test = []
-
-      print('success1')
-
-      IsUpdateCount = False
-
-      for codeInfo in new_list:
-        IsInEqual = False
-        for child in root.iter(stock):
-          if child.find('NAME').text == '횟수' and IsUpdateCount == False:
-            child.find('COUNT').text = str(1 + int(child.find('COUNT').text))
-            child.find('FULLCOUNT').text = str(1 + int(child.find('FULLCOUNT').text))
-            IsUpdateCount = True
-            IsInEqual = True
-            break
-          if child.find('CODE').text == codeInfo['code']:
-            child.find('RANKSUM').text = str(int(codeInfo['rank']) + int(child.find('RANKSUM').text))
-            child.find('COUNT').text = str(1 + int(child.find('COUNT').text)) if int(codeInfo['rank']) <= 30 else child.find('COUNT').text
-            child.find('FULLCOUNT').text = str(1 + int(child.find('FULLCOUNT').text))
-            IsInEqual = True
-            break
-        if False == IsInEqual:
-          test.append(codeInfo)
-      
-      print('success2')
-
-      if len(test) > 0:
-        for Tag_Name in test:
-          element = Element(stock)
-          root.append(element)
-          sub_element1 = SubElement(element, "CODE")
-          sub_element1.text = Tag_Name['code']
-          sub_element2 = SubElement(element, "RANKSUM")
-          sub_element2.text = str(Tag_Name['rank'])
-          sub_element3 = SubElement(element, "NAME")
-          sub_element3.text = Tag_Name['name']
-          sub_element4 = SubElement(element, "COUNT")
-          sub_element4.text = '1' if int(Tag_Name['rank']) <= 30 else '0'
-          sub_element5 = SubElement(element, "FULLCOUNT")
-          sub_element5.text = '1'
-
-      print('success4')
-
-      tree.write(
-        xml_path,
-        encoding="utf-8",       # UTF-8 인코딩 지정
-        xml_declaration=True,   # XML 선언 자동 추가
-        short_empty_elements=False  # 빈 요소 자동 닫힘 방지))
-      )
-
-      print('success5')
+      FileWriter.write_coalesced(xml_dir, lambda: _compact_rank_journal(xml_dir, journal_dir))
+      return True
     except Exception as e:
-      print(e)
-      isSuccess = False
-    return isSuccess
+      print(f"CompactRankJournal 오류: {e}")
+      return False
+
+def _compaction_worker():
+    while True:
+      # 저장 요청이 오면 바로, 아니면 주기적으로 압축
+      _compaction_event.wait(setting.RANK_COMPACTION_INTERVAL_SECONDS)
+      _compaction_event.clear()
+      CompactRankJournal()
+
+def ScheduleRankCompaction():
+    """백그라운드 압축 스레드를 깨움 (없으면 생성)"""
+    global _compaction_thread
+    _compaction_event.set()
+    if _compaction_thread is None or not _compaction_thread.is_alive():
+      _compaction_thread = threading.Thread(target=_compaction_worker, name='rank-journal-compaction', daemon=True)
+      _compaction_thread.start()
+
+# [월별 파일 병렬 집계]
+# 파일 하나를 {코드: [이름, RANKSUM, COUNT, FULLCOUNT]} 로 미리 집계하는 작업을 프로세스 풀에 나눠 맡기고 결과를 월 순서대로 반환
+# 파일 수가 적거나 프로세스 풀을 쓸 수 없는 환경(예: 임시폴더 실행)에서는 순차 처리
+# 프로세스 풀은 처음 필요할 때 한 번 만들어 계속 사용 (요청마다 만들고 닫지 않음)
+# 집계 결과는 (폴더, 종목)별로 캐시하고 파일별 (수정시각, 크기)가 바뀐 파일만 다시 집계 (GetMonthlyAggregates)
+_ingest_pool = None
+_ingest_pool_lock = threading.Lock()
+_monthly_aggregate_cache = {}   # (폴더 절대경로, 종목) -> {파일명: ((수정시각, 크기), 집계)}
+_monthly_aggregate_lock = threading.Lock()
+
+def _get_ingest_pool(workers):
+    global _ingest_pool
+    with _ingest_pool_lock:
+      if _ingest_pool is None:
+        _ingest_pool = ProcessPoolExecutor(max_workers=workers)
+      return _ingest_pool
+
+def _shutdown_ingest_pool():
+    global _ingest_pool
+    with _ingest_pool_lock:
+      if _ingest_pool is not None:
+        _ingest_pool.shutdown(wait=False, cancel_futures=True)
+        _ingest_pool = None
+
+atexit.register(_shutdown_ingest_pool)
+
+def AggregateRankFile(xml_file_path, stock):
+    month_rows = {}
+    for record in IterRankRecords(xml_file_path, stock):
+      row = month_rows.get(record.code)
+      if row is None:
+        month_rows[record.code] = [record.name, record.rankSum, record.count, record.fullCount]
+      else:
+        row[0] = record.name
+        row[1] += record.rankSum
+        row[2] += record.count
+        row[3] += record.fullCount
+    return month_rows
+
+def LoadMonthlyAggregates(path_dir, stock, folder_list):
+    file_paths = [path_dir + '/' + folder for folder in folder_list]
+    workers = min(len(file_paths), setting.RANK_INGEST_MAX_WORKERS or os.cpu_count() or 1)
+
+    if len(file_paths) >= setting.RANK_INGEST_PARALLEL_MIN_FILES and workers > 1:
+      try:
+        return list(_get_ingest_pool(workers).map(AggregateRankFile, file_paths, [stock] * len(file_paths)))
+      except Exception as e:
+        print(f"병렬 집계 실패, 순차 처리로 전환: {e}")
+        _shutdown_ingest_pool()
+
+    return [AggregateRankFile(file_path, stock) for file_path in file_paths]
+
+def GetMonthlyAggregates(path_dir, stock):
+    """(월 목록, 월별 집계 목록) - 캐시를 쓰고 바뀐 파일만 다시 집계 (반환한 집계는 공유되므로 수정하지 말 것)"""
+    folder_list, signature = _rank_folder_signature(path_dir)
+    cache_key = (os.path.abspath(path_dir), stock)
+
+    with _monthly_aggregate_lock:
+      cached = _monthly_aggregate_cache.get(cache_key, {})
+      file_stats = {folder: (mtime, size) for folder, mtime, size in signature}
+      stale = [folder for folder in folder_list if folder not in cached or cached[folder][0] != file_stats[folder]]
+      if stale:
+        rows = LoadMonthlyAggregates(path_dir, stock, stale)
+        cached = {folder: cached[folder] for folder in folder_list if folder in cached}
+        cached.update({folder: (file_stats[folder], month_rows) for folder, month_rows in zip(stale, rows)})
+      elif len(cached) != len(folder_list):
+        cached = {folder: cached[folder] for folder in folder_list}
+      _monthly_aggregate_cache[cache_key] = cached
+
+    return [folder[:-4] for folder in folder_list], [cached[folder][1] for folder in folder_list]
 
 def ReadXmlFile(xml_path, stock):
     path_dir = xml_path
     
-    # YYYY.MM 기준으로 오래된 날짜부터 최신 날짜 순으로 정렬
-    folder_list = sorted(os.listdir(path_dir), key=lambda x: tuple(map(int, x[:-4].split('.'))))
+    # 월별 파일은 서로 독립적이므로 파일별 집계는 (바뀐 파일만) 병렬로 수행하고 여기서는 순서대로 합치기만 함
+    return MergeMonthlyAggregates(*GetMonthlyAggregates(path_dir, stock))
+
+def MergeMonthlyAggregates(months, monthly_rows):
+    """월별 집계({코드: [이름, RANKSUM, COUNT, FULLCOUNT]}, 월 순서) 를 월별/전체 누적 목록으로 합침
+    저장소 종류(파일/메모리/SQLite)와 무관하게 같은 결과 형식"""
+    if not months:
+      return {}, {}
+
+    folder_list = [month + '.xml' for month in months]
 
     # 매달누적종목리스트 Format = {'2023.03.xlsx' : {'RANKSUM' : [], 'CODE' : [], 'NAME': [], 'COUNT' : []}}
     매달누적종목리스트 = {}
@@ -153,34 +285,25 @@ def ReadXmlFile(xml_path, stock):
     xml_stock_count = {}
     xml_stock_fullCount = {}
 
-    for folder in folder_list:
-      xml_file_path = path_dir + '/' + folder
+    for folder, month_rows in zip(folder_list, monthly_rows):
       xml_new_data_list = {}
       xml_new_count = {}
       xml_new_fullCount = {}
-      tree = ET.parse(xml_file_path)
-      root = tree.getroot()
+      for code, (name, rank_sum, count, full_count) in month_rows.items():
+        xml_stock_name[code] = name
 
-      for xml_data in root.iter(stock):
-        xml_stock_name[xml_data.find('CODE').text] = xml_data.find('NAME').text
-
-        if xml_data.find('CODE').text not in xml_stack_data_list:
-          xml_stack_data_list[xml_data.find('CODE').text] = int(xml_data.find('RANKSUM').text)
-          xml_stock_count[xml_data.find('CODE').text] = int(xml_data.find('COUNT').text)
-          xml_stock_fullCount[xml_data.find('CODE').text] = int(xml_data.find('FULLCOUNT').text)
-        else:
-          xml_stack_data_list[xml_data.find('CODE').text] += int(xml_data.find('RANKSUM').text)
-          xml_stock_count[xml_data.find('CODE').text] += int(xml_data.find('COUNT').text)
-          xml_stock_fullCount[xml_data.find('CODE').text] += int(xml_data.find('FULLCOUNT').text)
-        
-        if xml_data.find('CODE').text not in xml_new_data_list:
-          xml_new_data_list[xml_data.find('CODE').text] = int(xml_data.find('RANKSUM').text)
-          xml_new_count[xml_data.find('CODE').text] = int(xml_data.find('COUNT').text)
-          xml_new_fullCount[xml_data.find('CODE').text] = int(xml_data.find('FULLCOUNT').text)
+        if code not in xml_stack_data_list:
+          xml_stack_data_list[code] = rank_sum
+          xml_stock_count[code] = count
+          xml_stock_fullCount[code] = full_count
         else:
-          xml_new_data_list[xml_data.find('CODE').text] += int(xml_data.find('RANKSUM').text)
-          xml_new_count[xml_data.find('CODE').text] += int(xml_data.find('COUNT').text)
-          xml_new_fullCount[xml_data.find('CODE').text] += int(xml_data.find('FULLCOUNT').text)
+          xml_stack_data_list[code] += rank_sum
+          xml_stock_count[code] += count
+          xml_stock_fullCount[code] += full_count
+
+        xml_new_data_list[code] = rank_sum
+        xml_new_count[code] = count
+        xml_new_fullCount[code] = full_count
 
       sorted_stack_xml_data = sorted(xml_stack_data_list.items(), key=lambda item:item[1])
       sorted_new_xml_data = sorted(xml_new_data_list.items(), key=lambda item:item[1])
@@ -217,24 +340,219 @@ def transform_data(input_data):
 
   return result
 
+# [월별 누적합(prefix sum) 저장소]
+# 종목별 RANKSUM / COUNT / FULLCOUNT 를 월 순서대로 누적한 2차원 배열 (월 수 + 1) x (종목 수) 로 보관
+# 임의의 기간 [i, j] 합계 = 누적[j + 1] - 누적[i] 이므로 기간 조회는 뺄셈 한 번 + 정렬 한 번으로 끝남
+# 파일 목록/수정시각이 바뀌면 다시 생성
+# 조회는 API 스레드 여러 개에서 동시에 들어오므로 캐시 확인과 생성은 잠금 안에서 (같은 저장소를 두 번 만들지 않음)
+_rank_prefix_cache = {}
+_rank_prefix_lock = threading.Lock()
+
+def parse_month_key(month):
+  """'2025.6', '2025.06', '2025-6', '2025.6.xml' 형태의 월 문자열을 (연, 월) 튜플로 변환"""
+  text = str(month).strip()
+  if text.endswith('.xml'):
+    text = text[:-4]
+  parts = text.replace('-', '.').split('.')
+  if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
+    raise ValueError(f"월 형식이 올바르지 않습니다: {month} (예: 2025.6)")
+  return (int(parts[0]), int(parts[1]))
+
+def _rank_folder_signature(path_dir):
+  folder_list = sorted(
+    [f for f in os.listdir(path_dir) if f.endswith('.xml')],
+    key=lambda x: parse_month_key(x)
+  )
+  signature = []
+  for folder in folder_list:
+    stat = os.stat(path_dir + '/' + folder)
+    signature.append((folder, stat.st_mtime_ns, stat.st_size))
+  return folder_list, tuple(signature)
+
+def BuildRankPrefixStore(xml_path, stock, folder_list=None):
+  """월별 XML 을 읽어 종목별 누적합 배열을 생성"""
+  if folder_list is None:
+    return BuildRankPrefixStoreFromAggregates(*GetMonthlyAggregates(xml_path, stock))
+
+  return BuildRankPrefixStoreFromAggregates([folder[:-4] for folder in folder_list], LoadMonthlyAggregates(xml_path, stock, folder_list))
+
+def BuildRankPrefixStoreFromAggregates(months, aggregates):
+  """월별 집계 목록으로 종목별 누적합 배열을 생성"""
+  code_index = {}
+  codes = []
+  names = []
+  monthly_rows = []
+
+  for month_rows in aggregates:
+    month_row = {}
+
+    for code, (name, rank_sum, count, full_count) in month_rows.items():
+      if code not in code_index:
+        code_index[code] = len(codes)
+        codes.append(code)
+        names.append(name)
+      else:
+        names[code_index[code]] = name
+
+      month_row[code_index[code]] = [rank_sum, count, full_count]
+
+    monthly_rows.append(month_row)
+
+  # 0 번째 행은 0 으로 두고 i + 1 번째 행에 i 번째 달 값을 채운 뒤 월 방향으로 누적
+  prefix = np.zeros((3, len(months) + 1, len(codes)), dtype=np.int64)
+  for month_idx, month_row in enumerate(monthly_rows):
+    if not month_row:
+      continue
+    columns = np.fromiter(month_row.keys(), dtype=np.int64, count=len(month_row))
+    values = np.array(list(month_row.values()), dtype=np.int64)
+    prefix[:, month_idx + 1, columns] = values.T
+  np.cumsum(prefix, axis=1, out=prefix)
+
+  store = {
+    'months': months,
+    'monthKeys': [parse_month_key(month) for month in months],
+    'codes': np.array(codes, dtype=object),
+    'names': np.array(names, dtype=object),
+    'RANKSUM': prefix[0],
+    'COUNT': prefix[1],
+    'FULLCOUNT': prefix[2]
+  }
+  # 비트셋 인덱스도 여기서 함께 만들어 둠 - 캐시에 올라간 저장소는 여러 스레드가 공유하므로 이후에는 수정하지 않음
+  store['bitset'] = BuildRankBitsetIndex(store)
+  return store
+
+def GetRankPrefixStore(xml_path, stock):
+  """누적합 저장소를 캐시에서 가져오고, 월별 파일이 바뀌었으면 다시 생성"""
+  _, signature = _rank_folder_signature(xml_path)
+  cache_key = (os.path.abspath(xml_path), stock)
+
+  with _rank_prefix_lock:
+    cached = _rank_prefix_cache.get(cache_key)
+    if cached is not None and cached['signature'] == signature:
+      return cached['store']
+
+    store = BuildRankPrefixStore(xml_path, stock)
+    _rank_prefix_cache[cache_key] = {'signature': signature, 'store': store}
+    return store
+
+def resolve_month_range(months, start_month=None, end_month=None, recent_months=0):
+  """요청한 기간을 저장소의 월 인덱스 [start_idx, end_idx] 로 변환"""
+  if not months:
+    raise ValueError("저장된 월별 데이터가 없습니다.")
+
+  month_keys = [parse_month_key(month) for month in months]
+
+  end_idx = len(months) - 1
+  if end_month:
+    end_key = parse_month_key(end_month)
+    candidates = [i for i, key in enumerate(month_keys) if key <= end_key]
+    if not candidates:
+      raise ValueError(f"{end_month} 이전의 데이터가 없습니다.")
+    end_idx = candidates[-1]
+
+  start_idx = 0
+  if recent_months and recent_months > 0:
+    start_idx = max(0, end_idx - recent_months + 1)
+  elif start_month:
+    start_key = parse_month_key(start_month)
+    candidates = [i for i, key in enumerate(month_keys) if key >= start_key]
+    if not candidates:
+      raise ValueError(f"{start_month} 이후의 데이터가 없습니다.")
+    start_idx = candidates[0]
+
+  if start_idx > end_idx:
+    raise ValueError(f"시작월이 종료월보다 늦습니다: {start_month} ~ {end_month}")
+
+  return start_idx, end_idx
+
+def QueryRankRange(store, start_idx, end_idx):
+  """누적합 뺄셈으로 기간 합계를 구하고 RANKSUM 오름차순으로 정렬 (ReadXmlFile 의 총누적종목리스트와 같은 형식)"""
+  rank_sum = store['RANKSUM'][end_idx + 1] - store['RANKSUM'][start_idx]
+  count = store['COUNT'][end_idx + 1] - store['COUNT'][start_idx]
+  full_count = store['FULLCOUNT'][end_idx + 1] - store['FULLCOUNT'][start_idx]
+
+  # 해당 기간에 한 번도 등장하지 않은 종목 제외
+  present = np.flatnonzero(full_count > 0)
+  order = present[np.argsort(rank_sum[present], kind='stable')]
+
+  label = store['months'][start_idx] + ' ~ ' + store['months'][end_idx]
+  return {
+    label: {
+      'RANKSUM': rank_sum[order].tolist(),
+      'CODE': store['codes'][order].tolist(),
+      'NAME': store['names'][order].tolist(),
+      'COUNT': count[order].tolist(),
+      'FULLCOUNT': full_count[order].tolist()
+    }
+  }
+
+# [상위 30위 진입 비트셋 인덱스]
+# 월별 COUNT(상위 30위 진입 횟수) > 0 여부를 비트 하나로 보고 두 가지 배치로 압축 보관
+#   monthBits : (월 수) x (종목 수 / 8) - 월마다 전체 종목의 비트셋, 연속 진입은 AND 로 계산
+#   codeBits  : (종목 수) x (월 수 / 8) - 종목마다 월 비트셋, 기간 내 진입 횟수는 마스크 AND 후 popcount
+# 누적합 저장소를 만들 때 함께 생성해 store['bitset'] 에 넣어 둠 (캐시에 공유된 저장소를 조회 중에 고치지 않도록)
+_POPCOUNT_TABLE = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+def BuildRankBitsetIndex(store):
+  monthly_count = np.diff(store['COUNT'], axis=0)
+  membership = monthly_count > 0
+
+  # '횟수' 집계 행(ALL)은 종목이 아니므로 제외
+  membership[:, store['codes'] == 'ALL'] = False
+
+  return {
+    'monthBits': np.packbits(membership, axis=1),
+    'codeBits': np.packbits(membership.T, axis=1),
+    'codeCount': membership.shape[1]
+  }
+
+def GetRankBitsetIndex(store):
+  """저장소를 만들 때 함께 만든 비트셋 인덱스 (BuildRankPrefixStoreFromAggregates)"""
+  return store['bitset']
+
+def QueryRankStreak(store, min_months, end_idx):
+  """end_idx 월까지 min_months 개월 이상 연속으로 상위 30위에 든 종목과 연속 개월 수"""
+  index = GetRankBitsetIndex(store)
+  month_bits = index['monthBits']
+  code_count = index['codeCount']
+
+  streak = np.zeros(code_count, dtype=np.int64)
+  alive = month_bits[end_idx].copy()
+  for month_idx in range(end_idx, -1, -1):
+    if month_idx != end_idx:
+      np.bitwise_and(alive, month_bits[month_idx], out=alive)
+    if not alive.any():
+      break
+    streak += np.unpackbits(alive, count=code_count).astype(np.int64)
+
+  matched = np.flatnonzero(streak >= max(min_months, 1))
+  return matched, streak[matched]
+
+def QueryRankConsistency(store, min_count, start_idx, end_idx):
+  """[start_idx, end_idx] 기간 중 min_count 개월 이상 상위 30위에 든 종목과 진입 개월 수"""
+  index = GetRankBitsetIndex(store)
+  code_bits = index['codeBits']
+
+  window = np.zeros(len(store['months']), dtype=bool)
+  window[start_idx:end_idx + 1] = True
+  window_mask = np.packbits(window)
+
+  hit_count = _POPCOUNT_TABLE[code_bits & window_mask].sum(axis=1, dtype=np.int64)
+
+  matched = np.flatnonzero(hit_count >= max(min_count, 1))
+  return matched, hit_count[matched]
+
+# 순위 저장/조회는 Storage 에서 선택된 저장소(setting.STORAGE_BACKEND)를 사용
+# 파일 저장소는 일별 저널에 추가하고 월별 XML 은 백그라운드 압축에서 갱신
 def saveXmlDataList(stock, financeDataList):
   isSuccess = True
 
-  nowDate = str(datetime.today().year) + '-' + str(datetime.today().month) + '-' + str(datetime.today().day) + '.txt'
-  today_analyze_file_path = setting.JSON_ANALYZE_FOLDER_PATH + '/' + nowDate
-
-  if os.path.exists(today_analyze_file_path) == True:
+  if Storage.analysis().has() == True:
     isSuccess = JsonDataBase.SaveAnalyzeJsonFile(financeDataList);
     return isSuccess
 
-  # 현재 날짜 기준으로 XML 파일 경로 동적 생성
-  current_xml_path = setting.get_kr_xml_savepath()
-  
-  # xml파일에 선별한 종목 카운트 추가하여 저장
-  if os.path.isfile(current_xml_path) == False:
-    isSuccess = MakeXmlFile(current_xml_path, financeDataList, stock)
-  else:
-    isSuccess = UpdateXmlFile(current_xml_path, financeDataList, stock)
+  # 오늘 순위 목록을 일별 순위 저장소에 추가 (오늘 배치가 이미 있으면 추가하지 않음 - 확인과 추가는 저장소 잠금 안에서)
+  isSuccess = Storage.ranks().append_daily_ranks(stock, financeDataList, only_if_absent=True)
 
   if (isSuccess == True):
     isSuccess = JsonDataBase.SaveAnalyzeJsonFile(financeDataList)
@@ -242,9 +560,60 @@ def saveXmlDataList(stock, financeDataList):
   return isSuccess
 
 def getXmlDataList(stock):
-  매달누적종목리스트, 총누적종목리스트 = ReadXmlFile(setting.XML_KR_READPATH, stock)
+  매달누적종목리스트, 총누적종목리스트 = MergeMonthlyAggregates(*Storage.ranks().monthly_aggregates(stock))
 
   return {
     'perMonthDataList': transform_data(매달누적종목리스트),
     'allPeriodDataList': transform_data(총누적종목리스트)
+  }
+
+def getXmlRangeDataList(stock, start_month=None, end_month=None, recent_months=0):
+  store = Storage.ranks().prefix_store(stock)
+  start_idx, end_idx = resolve_month_range(store['months'], start_month, end_month, recent_months)
+
+  return {
+    'rangeDataList': transform_data(QueryRankRange(store, start_idx, end_idx)),
+    'availableMonths': store['months']
+  }
+
+def getDailyRankList(code=None, start_date=None, end_date=None):
+  return Storage.ranks().read_daily_ranks(code, start_date, end_date)
+
+def getRankAnalytics(stock, query, months=3, min_count=0, end_month=None):
+  store = Storage.ranks().prefix_store(stock)
+
+  if months is None or months < 1:
+    raise ValueError("months 는 1 이상이어야 합니다.")
+
+  start_idx, end_idx = resolve_month_range(store['months'], end_month=end_month, recent_months=months)
+
+  if query == 'streak':
+    matched, values = QueryRankStreak(store, months, end_idx)
+  elif query == 'consistency':
+    matched, values = QueryRankConsistency(store, min_count or months, start_idx, end_idx)
+  else:
+    raise ValueError(f"지원하지 않는 query 입니다: {query} (streak, consistency)")
+
+  rank_sum = store['RANKSUM'][end_idx + 1] - store['RANKSUM'][start_idx]
+  full_count = store['FULLCOUNT'][end_idx + 1] - store['FULLCOUNT'][start_idx]
+
+  # 진입 개월 수 내림차순, 같으면 기간 RANKSUM 오름차순
+  order = np.lexsort((rank_sum[matched], -values))
+
+  items = []
+  for i in order:
+    code_idx = matched[i]
+    items.append({
+      'code': store['codes'][code_idx],
+      'name': store['names'][code_idx],
+      'months': int(values[i]),
+      'rankSum': str(rank_sum[code_idx]),
+      'fullCount': str(full_count[code_idx])
+    })
+
+  return {
+    'query': query,
+    'period': store['months'][start_idx] + ' ~ ' + store['months'][end_idx],
+    'items': items,
+    'totalCount': len(items)
   }
\ No newline at end of file
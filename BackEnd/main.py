@@ -1,14 +1,19 @@
 from typing import List
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from datetime import datetime, timedelta
 import FinanceDataReader as fdr
 import pandas as pd
-import CalculateLogic, XmlDataBase, JsonDataBase, WebCrawling
+import CalculateLogic, XmlDataBase, JsonDataBase, WebCrawling, AnalyzeArchive, BuyHistoryStore, HttpClient, HolidayCalendar, EconomicCalendarCache, BrowserPool, RealtimeSearchPoller, AsyncCrawler, setting
 import requests
 import os
 import json
+import asyncio
+import time
 
 # 설정값 및 API 키 import
 from key import (
@@ -29,6 +34,10 @@ class GameScoreRequest(BaseModel):
 class GameScoreResponse(BaseModel):
     success: bool
     message: str = ""
+    rank: int = None          # 저장한 점수의 모드 내 순위
+    totalCount: int = None
+    topPercent: float = None
+    approximate: bool = None  # 순위가 근사값인지 (GameScoreRankResponse.approximate 와 같음)
 
 # 게임 스코어 조회 요청/응답 모델
 class GameScoresRequest(BaseModel):
@@ -50,7 +59,34 @@ class GameRankingResponse(BaseModel):
     data: list
     totalCount: int = 0
 
-app = FastAPI()
+# 게임 점수 순위/백분위 조회 요청/응답 모델
+class GameScoreRankRequest(BaseModel):
+    gameType: str
+    mode: str = ""
+    score: int
+
+class GameScoreRankResponse(BaseModel):
+    success: bool
+    rank: int = 0
+    totalCount: int = 0
+    topPercent: float = 0
+    percentile: float = 0
+    approximate: bool = False   # 보관 정책으로 합쳐진 점수가 같은 구간에 있어 순위가 근사값이면 True
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 실시간 검색어 동적 크롤링용 브라우저를 백그라운드에서 미리 띄워둠
+    if setting.BROWSER_POOL_WARM_ON_START:
+        BrowserPool.start_warm_up()
+    # 실시간 검색어 백그라운드 수집 시작 (첫 요청이 수집을 기다리지 않도록)
+    RealtimeSearchPoller.Start()
+    try:
+        yield
+    finally:
+        # 비동기 크롤러의 HTTP 연결 정리
+        await AsyncCrawler.close_all()
+
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # 실제 운영 환경에서는 구체적인 origin을 지정하세요
@@ -121,24 +157,93 @@ class GetXmlListRequest(BaseModel):
 class GetXmlListResponse(BaseModel):
     data: dict
 
+# 요청 / 응답 (기간 지정 순위 집계)
+class GetXmlRangeListRequest(BaseModel):
+    stock: str = ''
+    startMonth: str = None   # 예: '2025.6'
+    endMonth: str = None     # 예: '2025.12' (없으면 가장 최근 월)
+    recentMonths: int = 0    # 0 보다 크면 endMonth 기준 최근 N개월 (startMonth 무시)
+
+# 요청 / 응답 (상위 30위 연속/반복 진입 분석)
+class GetRankAnalyticsRequest(BaseModel):
+    stock: str = ''
+    query: str = 'streak'    # streak: 최근 months 개월 연속 진입 / consistency: 최근 months 개월 중 minCount 개월 이상 진입
+    months: int = 3
+    minCount: int = 0
+    endMonth: str = None     # 기준 월 (없으면 가장 최근 월)
+
+# 요청 / 응답 (일별 순위 저널 조회)
+class GetDailyRankRequest(BaseModel):
+    code: str = None        # 없으면 전체 종목
+    startDate: str = None   # YYYY-MM-DD
+    endDate: str = None     # YYYY-MM-DD
+
 # 요청 / 응답
 class SaveJsonHistoryRequest(BaseModel):
     data: dict = {}
+    baseVersion: int = None     # 지정하면 현재 버전과 같을 때만 저장 (다르면 409)
 class SaveJsonHistoryResponse(BaseModel):
     isSuccess: bool
+    version: int = None
+
+# 매수 이력 부분 저장 요청 (종목 단위 작업)
+# ops 예: [{"op": "upsert", "section": "virtualInvestItemObject", "code": "240810", "value": {...}},
+#          {"op": "delete", "section": "virtualInvestItemObject", "code": "240810"}]
+class PatchJsonHistoryRequest(BaseModel):
+    baseVersion: int
+    ops: List[dict]
+
+# 포트폴리오 평가 요청 / 응답
+class PortfolioValuationRequest(BaseModel):
+    section: str = 'virtualInvestItemObject'   # 또는 'realInvestItemObject'
+class PortfolioValuationResponse(BaseModel):
+    success: bool
+    data: dict
 
 # 요청 / 응답
 class GetJsonHistoryRequest(BaseModel):
     stock: str = ''
 class GetJsonHistoryResponse(BaseModel):
     data: dict
+    version: int = None
 
 # 요청 / 응답
 class GetJsonAnalyzeRequest(BaseModel):
     stock: str = ''
+    # 조건 조회 (하나라도 지정하면 전체 목록 대신 걸러진 결과만 반환)
+    rankFrom: int = None
+    rankTo: int = None
+    buyLevels: List[str] = None          # stockBuyLevel (예: ['S', 'A+'])
+    isOverGoldenCross: bool = None
+    isNearGoldenCross: bool = None
+    isNearLowerBand: bool = None
+    isGoodTotalScore: bool = None
+    minTotalScore: float = None
+    fields: List[str] = None             # 반환할 필드만 지정 (예: ['code', 'name', 'rank'])
+    offset: int = 0
+    limit: int = None
 class GetJsonAnalyzeResponse(BaseModel):
     data: list
     date: str = None
+    totalCount: int = None
+
+# 날짜별 분석 결과 조회 요청 / 응답
+class AnalyzeHistoryRequest(BaseModel):
+    date: str = None        # 없으면 보관된 날짜 목록만 반환
+
+class AnalyzeDiffRequest(BaseModel):
+    dateFrom: str
+    dateTo: str
+    topN: int = 0           # 0 이면 전체 종목 비교
+
+class AnalyzeTrajectoryRequest(BaseModel):
+    code: str
+    startDate: str = None
+    endDate: str = None
+
+class AnalyzeHistoryResponse(BaseModel):
+    success: bool
+    data: dict
 
 # 실시간 검색어 요청 / 응답
 class RealtimeSearchRequest(BaseModel):
@@ -148,12 +253,16 @@ class RealtimeSearchResponse(BaseModel):
     search_terms: List[str]
     date_info: str
     total_count: int
+    fetched_at: str = None      # 백그라운드 수집 시각
+    age_seconds: float = None   # 수집 후 경과 초
+    version: int = 0            # 검색어 목록이 바뀔 때마다 증가
 
 # 경제 캘린더 요청 / 응답
 class EconomicCalendarRequest(BaseModel):
     year: int
     countries: List[str] = None
     importance_levels: List[int] = None
+    columnar: bool = False  # True 이면 data.economic_columns 에 필드별 배열로 응답 (행 목록보다 작음)
 
 class EconomicCalendarResponse(BaseModel):
     success: bool
@@ -175,6 +284,7 @@ class StockCalendarResponse(BaseModel):
 # 한국 공휴일 요청 / 응답
 class KoreanHolidaysRequest(BaseModel):
     year: int
+    refresh: bool = False  # True 이면 캐시 유지 기간과 상관없이 API 에서 다시 받음
 
 class KoreanHolidaysResponse(BaseModel):
     success: bool
@@ -238,8 +348,6 @@ def get_stock_suggestions_from_xml():
     KR 폴더에서 가장 최근 XML 파일을 분석하여
     code가 'ALL'이 아니고 name이 '횟수'가 아닌 종목들의 code와 name 목록을 반환
     """
-    import xml.etree.ElementTree as ET
-    
     # 현재 파일의 디렉토리를 기준으로 절대 경로 생성
     current_dir = os.path.dirname(os.path.abspath(__file__))
     kr_xml_path = os.path.join(current_dir, 'Data', 'Xml_Files', 'KR')
@@ -256,46 +364,16 @@ def get_stock_suggestions_from_xml():
         latest_file = sorted_files[0]
         latest_file_path = os.path.join(kr_xml_path, latest_file)
         
-        # XML 파싱
-        tree = ET.parse(latest_file_path)
-        root = tree.getroot()
-        
         suggestions = []
         
-        df = pd.DataFrame()
-        current_date = datetime.now().strftime('%Y%m%d')
-        
-        # df가 비어있지 않은 경우 컬럼명 확인
-        marcap_col = None
-        amount_col = None
-        
-        # 모든 종목 정보 추출 (KRX 태그 기준)
-        for stock_elem in root.iter('KRX'):
-            code = stock_elem.find('CODE')
-            name = stock_elem.find('NAME')
-            
-            if code is not None and name is not None:
-                code_text = code.text
-                name_text = name.text
-
-                # code_text로 df에서 조회하여 시가 총액 추출하여 'Marcap'에 삽입
-                marcap_value = None
-                amount_value = None
-                
-                # code가 'ALL'이 아니고 name이 '횟수'가 아닌 항목만 추가
-                if code_text != 'ALL' and name_text != '횟수':
-                    stock_info = {
-                        'Code': code_text,
-                        'Name': name_text
-                    }
-                    
-                    # 시가총액과 거래대금이 있으면 추가
-                    if marcap_value is not None:
-                        stock_info['Marcap'] = marcap_value
-                    if amount_value is not None:
-                        stock_info['Amount'] = amount_value
-                    
-                    suggestions.append(stock_info)
+        # 모든 종목 정보 추출 (KRX 태그 기준, 스트리밍으로 읽음)
+        for record in XmlDataBase.IterRankRecords(latest_file_path, 'KRX'):
+            # code가 'ALL'이 아니고 name이 '횟수'가 아닌 항목만 추가
+            if record.code != 'ALL' and record.name != '횟수':
+                suggestions.append({
+                    'Code': record.code,
+                    'Name': record.name
+                })
         
         return suggestions
     except Exception as e:
@@ -420,55 +498,222 @@ async def saveFinanceRank(request: SaveListRequest):
 @app.post("/get_finance_rank/", response_model=GetXmlListResponse)
 async def getFinanceRank(request: GetXmlListRequest):
     try:
-        financeRankList = XmlDataBase.getXmlDataList(request.stock)
+        financeRankList = await run_in_threadpool(XmlDataBase.getXmlDataList, request.stock)
 
         return GetXmlListResponse(data=financeRankList)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/get_finance_rank_range/", response_model=GetXmlListResponse)
+async def getFinanceRankRange(request: GetXmlRangeListRequest):
+    try:
+        # 캐시가 없으면 저널 압축 + 월별 XML 집계가 돌기 때문에 이벤트 루프를 막지 않도록 스레드에서 실행
+        financeRankList = await run_in_threadpool(
+            XmlDataBase.getXmlRangeDataList,
+            request.stock,
+            start_month=request.startMonth,
+            end_month=request.endMonth,
+            recent_months=request.recentMonths
+        )
+
+        return GetXmlListResponse(data=financeRankList)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/get_finance_rank_analytics/", response_model=GetXmlListResponse)
+async def getFinanceRankAnalytics(request: GetRankAnalyticsRequest):
+    try:
+        rankAnalytics = await run_in_threadpool(
+            XmlDataBase.getRankAnalytics,
+            request.stock,
+            request.query,
+            months=request.months,
+            min_count=request.minCount,
+            end_month=request.endMonth
+        )
+
+        return GetXmlListResponse(data=rankAnalytics)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/get_finance_rank_daily/", response_model=GetXmlListResponse)
+async def getFinanceRankDaily(request: GetDailyRankRequest):
+    try:
+        dailyRankList = await run_in_threadpool(XmlDataBase.getDailyRankList, request.code, request.startDate, request.endDate)
+
+        return GetXmlListResponse(data=dailyRankList)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/save_buy_history/", response_model=SaveJsonHistoryResponse)
 async def saveFinanceRank(request: SaveJsonHistoryRequest):
     try:
-        isSuccess = JsonDataBase.SaveHistoryJsonFile(request.data)
+        version = JsonDataBase.SaveHistoryJsonFile(request.data, request.baseVersion)
 
-        return SaveJsonHistoryResponse(isSuccess=isSuccess)
+        return SaveJsonHistoryResponse(isSuccess=True, version=version)
 
+    except BuyHistoryStore.HistoryVersionConflict as e:
+        raise HTTPException(status_code=409, detail={"message": str(e), "version": e.current_version})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/patch_buy_history/", response_model=SaveJsonHistoryResponse)
+async def patchBuyHistory(request: PatchJsonHistoryRequest):
+    try:
+        version = JsonDataBase.PatchHistoryJsonFile(request.ops, request.baseVersion)
+
+        return SaveJsonHistoryResponse(isSuccess=True, version=version)
+
+    except BuyHistoryStore.HistoryVersionConflict as e:
+        raise HTTPException(status_code=409, detail={"message": str(e), "version": e.current_version})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
 @app.post("/get_buy_history/", response_model=GetJsonHistoryResponse)
 async def getFinanceRank(request: GetJsonHistoryRequest):
     try:
-        buyHistory = JsonDataBase.ReadHistoryJsonFile()
+        buyHistory, version = JsonDataBase.ReadHistoryWithVersion()
 
-        return GetJsonHistoryResponse(data=buyHistory)
+        return GetJsonHistoryResponse(data=buyHistory, version=version)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
+@app.post("/get_portfolio_valuation/", response_model=PortfolioValuationResponse)
+async def getPortfolioValuation(request: PortfolioValuationRequest):
+    try:
+        # 종가 조회가 블로킹 I/O 이므로 스레드 풀에서 실행
+        valuation = await run_in_threadpool(JsonDataBase.GetPortfolioValuation, request.section)
+
+        return PortfolioValuationResponse(success=True, data=valuation)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/get_today_analyze/", response_model=GetJsonAnalyzeResponse)
-async def getTodayAnalyze(request: GetJsonAnalyzeRequest):
+async def getTodayAnalyze(request: GetJsonAnalyzeRequest, http_request: Request):
     try:
-        analyze_result = JsonDataBase.ReadLatestAnalyzeJsonFile()
+        bool_filters = {
+            'isOverGoldenCross': request.isOverGoldenCross,
+            'isNearGoldenCross': request.isNearGoldenCross,
+            'isNearLowerBand': request.isNearLowerBand,
+            'isGoodTotalScore': request.isGoodTotalScore
+        }
 
-        return GetJsonAnalyzeResponse(
-            data=analyze_result["data"], 
-            date=analyze_result["date"]
-        )
+        # 조건이 있으면 컬럼 인덱스로 걸러서 필요한 부분만 반환
+        if (request.rankFrom is not None or request.rankTo is not None or request.buyLevels
+                or request.minTotalScore is not None or request.fields or request.offset or request.limit is not None
+                or any(value is not None for value in bool_filters.values())):
+            query_result = JsonDataBase.QueryLatestAnalyze(
+                rank_from=request.rankFrom,
+                rank_to=request.rankTo,
+                buy_levels=request.buyLevels,
+                bool_filters=bool_filters,
+                min_total_score=request.minTotalScore,
+                fields=request.fields,
+                offset=request.offset,
+                limit=request.limit
+            )
 
+            return Response(
+                content=json.dumps(query_result, ensure_ascii=False, separators=(',', ':')),
+                media_type="application/json"
+            )
+
+        # 미리 인코딩된 응답 바이트를 그대로 전송 (파일이 바뀌었을 때만 다시 읽음)
+        analyze_response = JsonDataBase.GetLatestAnalyzeResponse()
+
+        if analyze_response["gzip"] is not None and 'gzip' in http_request.headers.get('accept-encoding', ''):
+            return Response(
+                content=analyze_response["gzip"],
+                media_type="application/json",
+                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+            )
+
+        return Response(content=analyze_response["body"], media_type="application/json")
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/get_analyze_history/", response_model=AnalyzeHistoryResponse)
+async def getAnalyzeHistory(request: AnalyzeHistoryRequest):
+    try:
+        dates = AnalyzeArchive.ListArchivedDates()
+
+        if not request.date:
+            return AnalyzeHistoryResponse(success=True, data={"dates": dates})
+
+        analyze_data = AnalyzeArchive.ReadArchivedAnalyze(request.date)
+        if analyze_data is None:
+            raise HTTPException(status_code=404, detail=f"보관된 분석 결과가 없습니다: {request.date}")
+
+        return AnalyzeHistoryResponse(
+            success=True,
+            data={"date": AnalyzeArchive.normalize_date(request.date), "data": analyze_data, "totalCount": len(analyze_data)}
+        )
+
+    except HTTPException:
+        raise  # HTTPException은 그대로 다시 발생
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+@app.post("/get_analyze_diff/", response_model=AnalyzeHistoryResponse)
+async def getAnalyzeDiff(request: AnalyzeDiffRequest):
+    try:
+        diff_result = AnalyzeArchive.DiffArchivedAnalyze(request.dateFrom, request.dateTo, request.topN)
+
+        return AnalyzeHistoryResponse(success=True, data=diff_result)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+@app.post("/get_analyze_trajectory/", response_model=AnalyzeHistoryResponse)
+async def getAnalyzeTrajectory(request: AnalyzeTrajectoryRequest):
+    try:
+        trajectory = AnalyzeArchive.GetScoreTrajectory(request.code, request.startDate, request.endDate)
+
+        return AnalyzeHistoryResponse(
+            success=True,
+            data={"code": request.code, "trajectory": trajectory, "totalCount": len(trajectory)}
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
 @app.post("/get_realtime_search/", response_model=RealtimeSearchResponse)
-async def getRealtimeSearch(request: RealtimeSearchRequest):
+async def getRealtimeSearch(request: RealtimeSearchRequest, http_request: Request):
     try:
-        # WebCrawling 모듈의 getRealtimeSearchTerms 함수 호출
-        crawl_result = WebCrawling.getRealtimeSearchTerms()
+        # 백그라운드에서 수집한 최신 스냅샷 사용 (서버 시작 직후 첫 수집 전이면 비동기로 잠시 대기, 연결이 끊기면 중단)
+        snapshot = RealtimeSearchPoller.GetSnapshot(wait=False) or await AsyncCrawler.run_for_request(
+            http_request,
+            RealtimeSearchPoller.GetSnapshotAsync(),
+            setting.ASYNC_CRAWL_DEADLINE_SECONDS['realtime_search']
+        )
         
-        # 크롤링 실패 시 에러 처리
-        if not crawl_result.get("success", False):
-            raise HTTPException(status_code=500, detail=f"크롤링 실패: {crawl_result.get('error', '알 수 없는 오류')}")
+        # 수집된 적이 없으면 에러 처리
+        if snapshot is None:
+            raise HTTPException(status_code=500, detail=f"크롤링 실패: {RealtimeSearchPoller.GetLastError() or '수집 대기 시간 초과'}")
+        crawl_result = snapshot["result"]
         
         # 결과 데이터 추출
         search_terms = crawl_result.get("search_terms", [])
@@ -478,27 +723,66 @@ async def getRealtimeSearch(request: RealtimeSearchRequest):
         return RealtimeSearchResponse(
             search_terms=search_terms,
             date_info=date_info,
-            total_count=total_count
+            total_count=total_count,
+            fetched_at=snapshot["fetchedAt"],
+            age_seconds=snapshot["ageSeconds"],
+            version=snapshot["version"]
         )
 
     except HTTPException:
         raise  # HTTPException은 그대로 다시 발생
+    except AsyncCrawler.ClientDisconnected:
+        return Response(status_code=499)  # 클라이언트가 연결을 끊어 수집 취소
+    except asyncio.TimeoutError as e:
+        raise HTTPException(status_code=504, detail=f"수집 시간 초과: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
+
+@app.get("/stream_realtime_search/")
+async def streamRealtimeSearch(request: Request):
+    """
+    실시간 검색어 Server-Sent Events 스트림
+    연결 직후 현재 스냅샷을 보내고, 이후 검색어 목록이 바뀔 때마다 realtime_search 이벤트 전송
+    (변경이 없는 동안에는 REALTIME_SEARCH_SSE_KEEPALIVE_SECONDS 마다 주석 줄로 연결 유지)
+    """
+    async def eventStream():
+        last_version = None
+        last_sent = time.monotonic()
+        while not await request.is_disconnected():
+            snapshot = RealtimeSearchPoller.GetSnapshot(wait=False)
+            if snapshot is not None and snapshot["version"] != last_version:
+                last_version = snapshot["version"]
+                payload = {
+                    "search_terms": snapshot["result"].get("search_terms", []),
+                    "date_info": snapshot["result"].get("date_info", ""),
+                    "total_count": snapshot["result"].get("total_count", 0),
+                    "fetched_at": snapshot["fetchedAt"],
+                    "version": snapshot["version"]
+                }
+                yield f"event: realtime_search\nid: {last_version}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= setting.REALTIME_SEARCH_SSE_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+            await asyncio.sleep(setting.REALTIME_SEARCH_SSE_CHECK_SECONDS)
+
+    return StreamingResponse(eventStream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @app.post("/get_economic_calendar/", response_model=EconomicCalendarResponse)
-async def getEconomicCalendar(request: EconomicCalendarRequest):
+async def getEconomicCalendar(request: EconomicCalendarRequest, http_request: Request):
     try:
-        # 해당 연도의 1월 1일부터 12월 31일까지 설정
-        start_date = f"{request.year}-01-01"
-        end_date = f"{request.year}-12-31"
-        
-        # WebCrawling 모듈의 getEconomicCalendarData 함수 호출
-        crawl_result = WebCrawling.getEconomicCalendarData(
-            start_date, 
-            end_date, 
-            request.countries, 
-            request.importance_levels
+        # 해당 연도 전체(전체 국가/중요도)를 캐시에서 가져와 국가/중요도 필터는 로컬에서 적용
+        # (캐시가 없거나 갱신할 때만 제로인 API 를 비동기로 호출, 마감 시간이 지나거나 연결이 끊기면 취소)
+        crawl_result = await AsyncCrawler.run_for_request(
+            http_request,
+            EconomicCalendarCache.GetEconomicCalendarAsync(
+                request.year,
+                request.countries,
+                request.importance_levels,
+                request.columnar
+            ),
+            setting.ASYNC_CRAWL_DEADLINE_SECONDS['economic_calendar']
         )
         
         # 크롤링 실패 시 에러 처리
@@ -506,7 +790,6 @@ async def getEconomicCalendar(request: EconomicCalendarRequest):
             raise HTTPException(status_code=500, detail=f"경제 캘린더 데이터 수집 실패: {crawl_result.get('error', '알 수 없는 오류')}")
         
         # 결과 데이터 추출
-        economic_data = crawl_result.get("economic_data", [])
         total_count = crawl_result.get("total_count", 0)
         
         return EconomicCalendarResponse(
@@ -518,16 +801,21 @@ async def getEconomicCalendar(request: EconomicCalendarRequest):
 
     except HTTPException:
         raise  # HTTPException은 그대로 다시 발생
+    except AsyncCrawler.ClientDisconnected:
+        return Response(status_code=499)  # 클라이언트가 연결을 끊어 수집 취소
+    except asyncio.TimeoutError as e:
+        raise HTTPException(status_code=504, detail=f"수집 시간 초과: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 @app.post("/get_stock_calendar/", response_model=StockCalendarResponse)
-async def getStockCalendar(request: StockCalendarRequest):
+async def getStockCalendar(request: StockCalendarRequest, http_request: Request):
     try:
-        # WebCrawling 모듈의 getFnGuideStockCalendar 함수 호출
-        crawl_result = WebCrawling.getFnGuideStockCalendar(
-            year=request.year,
-            months=request.months
+        # 월별 FnGuide 요청을 비동기로 동시에 수집 (마감 시간이 지나거나 연결이 끊기면 취소)
+        crawl_result = await AsyncCrawler.run_for_request(
+            http_request,
+            AsyncCrawler.get_fnguide_stock_calendar(request.year, request.months),
+            setting.ASYNC_CRAWL_DEADLINE_SECONDS['stock_calendar']
         )
         
         # 크롤링 실패 시 에러 처리
@@ -547,15 +835,23 @@ async def getStockCalendar(request: StockCalendarRequest):
 
     except HTTPException:
         raise  # HTTPException은 그대로 다시 발생
+    except AsyncCrawler.ClientDisconnected:
+        return Response(status_code=499)  # 클라이언트가 연결을 끊어 수집 취소
+    except asyncio.TimeoutError as e:
+        raise HTTPException(status_code=504, detail=f"수집 시간 초과: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 # 한국 공휴일 요청 / 응답
 @app.post("/get_korean_holidays/", response_model=KoreanHolidaysResponse)
-async def getKoreanHolidays(request: KoreanHolidaysRequest):
+async def getKoreanHolidays(request: KoreanHolidaysRequest, http_request: Request):
     try:
-        # WebCrawling 모듈의 getKoreanHolidays 함수 호출
-        crawl_result = WebCrawling.getKoreanHolidays(request.year)
+        # 연도별 캐시 -> API(12개월 동시 수집) -> 로컬 계산 순으로 조회
+        crawl_result = await AsyncCrawler.run_for_request(
+            http_request,
+            HolidayCalendar.GetKoreanHolidaysAsync(request.year, request.refresh),
+            setting.ASYNC_CRAWL_DEADLINE_SECONDS['korean_holidays']
+        )
         
         # 크롤링 실패 시 에러 처리
         if not crawl_result.get("success", False):
@@ -574,6 +870,10 @@ async def getKoreanHolidays(request: KoreanHolidaysRequest):
 
     except HTTPException:
         raise  # HTTPException은 그대로 다시 발생
+    except AsyncCrawler.ClientDisconnected:
+        return Response(status_code=499)  # 클라이언트가 연결을 끊어 수집 취소
+    except asyncio.TimeoutError as e:
+        raise HTTPException(status_code=504, detail=f"수집 시간 초과: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
@@ -612,7 +912,7 @@ async def naver_search_proxy(service_id: str, request: NaverSearchRequest):
         
         # 네이버 API 호출
         naver_url = f"{NAVER_API_BASE_URL}/{service_id}"
-        response = requests.get(naver_url, headers=headers, params=params, timeout=10)
+        response = HttpClient.get(naver_url, headers=headers, params=params)
         
         # 응답 처리
         if response.status_code == 200:
@@ -671,7 +971,7 @@ async def get_kakao_access_token(request: KakaoTokenRequest):
         print(f"   - redirect_uri: {data['redirect_uri']}")
         print(f"   - code: {data['code'][:10]}..." if data['code'] else "   - code: None")
         
-        response = requests.post(KAKAO_AUTH_URL, headers=headers, data=data, timeout=10)
+        response = HttpClient.post(KAKAO_AUTH_URL, headers=headers, data=data)
         
         print(f"📥 카카오 응답 수신:")
         print(f"   - status_code: {response.status_code}")
@@ -772,7 +1072,7 @@ async def send_kakao_message(request: KakaoMessageRequest):
             'template_object': json.dumps(template_object, ensure_ascii=False)
         }
         
-        response = requests.post(KAKAO_API_URL, headers=headers, data=data, timeout=10)
+        response = HttpClient.post(KAKAO_API_URL, headers=headers, data=data)
         
         if response.status_code == 200:
             return KakaoResponse(
@@ -812,9 +1112,14 @@ async def saveGameScore(request: GameScoreRequest):
         )
 
         if isSuccess:
+            score_rank = JsonDataBase.GetGameScoreRank(request.gameType, request.mode, request.score) or {}
             return GameScoreResponse(
                 success=True,
-                message="게임 스코어가 성공적으로 저장되었습니다."
+                message="게임 스코어가 성공적으로 저장되었습니다.",
+                rank=score_rank.get("rank"),
+                totalCount=score_rank.get("totalCount"),
+                topPercent=score_rank.get("topPercent"),
+                approximate=score_rank.get("approximate")
             )
         else:
             return GameScoreResponse(
@@ -870,6 +1175,20 @@ async def getGameRanking(request: GameRankingRequest):
             totalCount=0
         )
 
+# 게임 점수 순위/백분위 조회 엔드포인트
+@app.post("/get_game_score_rank/", response_model=GameScoreRankResponse)
+async def getGameScoreRank(request: GameScoreRankRequest):
+    try:
+        score_rank = JsonDataBase.GetGameScoreRank(request.gameType, request.mode, request.score)
+
+        if score_rank is None:
+            return GameScoreRankResponse(success=False)
+
+        return GameScoreRankResponse(success=True, **score_rank)
+
+    except Exception as e:
+        return GameScoreRankResponse(success=False)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT)
\ No newline at end of file
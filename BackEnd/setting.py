@@ -19,8 +19,115 @@ def get_us_xml_savepath():
 XML_KR_SAVEPATH = get_kr_xml_savepath()
 XML_US_SAVEPATH = get_us_xml_savepath()
 
+# 일별 순위 저널 (월별 XML 은 저널을 주기적으로 압축하여 갱신)
+RANK_JOURNAL_KR_PATH = './Data/Rank_Journal/KR'
+RANK_COMPACTION_INTERVAL_SECONDS = 60
+
+# 월별 XML 병렬 집계 (파일 수가 기준 이상일 때만 프로세스 풀 사용, 워커 수 0 이면 CPU 코어 수)
+RANK_INGEST_PARALLEL_MIN_FILES = 6
+RANK_INGEST_MAX_WORKERS = 0
+
 JSON_HISTORY_PATH = './Data/Json_Files/history.txt'
+# 매수 이력 저널이 이 줄 수 이상 쌓이면 history.txt 를 다시 쓰고 저널을 비움
+BUY_HISTORY_COMPACT_OPS = 50
 
 JSON_ANALYZE_FOLDER_PATH = './Data/Json_Files/Today_Analyze'
 
-JSON_GAME_SCORE_PATH = './Data/Json_Files/Game_Score/game-store-db.txt'
\ No newline at end of file
+# 날짜별 분석 결과 보관소 (보관 기간 일수, 0 이면 무기한)
+JSON_ANALYZE_HISTORY_PATH = './Data/Json_Files/Analyze_History'
+ANALYZE_HISTORY_RETENTION_DAYS = 365
+
+# /get_today_analyze/ 응답을 gzip 으로 미리 압축해 둘지 여부
+ANALYZE_RESPONSE_GZIP = True
+
+JSON_GAME_SCORE_PATH = './Data/Json_Files/Game_Score/game-store-db.txt'
+
+# 게임 스코어 로그 기록 주기(초)와 스냅샷 재작성 기준(로그 줄 수)
+GAME_SCORE_FLUSH_INTERVAL_SECONDS = 1
+GAME_SCORE_COMPACT_LOG_LINES = 500
+
+# 게임 스코어 보관 정책 (모드별 사용자당 상위 K 개 + 전체 상위 M 개만 유지, 나머지는 점수 구간별 개수로 합침)
+GAME_SCORE_KEEP_PER_USER = 5
+GAME_SCORE_KEEP_GLOBAL = 100
+GAME_SCORE_BUCKET_SIZE = 100
+GAME_SCORE_RETENTION_INTERVAL_SECONDS = 600
+
+# 종가 캐시 (포트폴리오 평가용) - 유지 시간, 동시 조회 수, 같은 종목 조회 대기 시간
+PRICE_CACHE_TTL_SECONDS = 300
+PRICE_FETCH_MAX_WORKERS = 8
+PRICE_FETCH_TIMEOUT_SECONDS = 20
+
+# 한국 공휴일 연도별 캐시 폴더와 유지 기간(일) - 지난 연도는 기간 없이 사용
+JSON_HOLIDAY_CACHE_FOLDER_PATH = './Data/Json_Files/Holiday_Cache'
+HOLIDAY_CACHE_TTL_DAYS = 30
+
+# 경제 캘린더(제로인) 연도별 캐시 - 이번 달 이후 구간을 다시 받는 주기(초)
+ECONOMIC_CALENDAR_REFRESH_SECONDS = 1800
+
+# 파일 쓰기 잠금 파일 폴더 (여러 워커 프로세스가 같은 파일을 동시에 쓰지 않도록)
+WRITE_LOCK_DIR = './Data/.locks'
+
+# 저장소 선택 ('file': 기존 파일 형식, 'memory': 프로세스 메모리, 'sqlite': STORAGE_SQLITE_PATH 의 SQLite 파일)
+STORAGE_BACKEND = 'file'
+STORAGE_SQLITE_PATH = './Data/finance.db'
+
+# 외부 HTTP 요청 (호스트별 세션 재사용) - 연결 풀 크기, GET 재시도 횟수/백오프, (연결, 읽기) 타임아웃 초
+HTTP_POOL_MAXSIZE = 10
+HTTP_RETRY_TOTAL = 3
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_DEFAULT_TIMEOUT = (5, 15)
+HTTP_HOST_TIMEOUTS = {
+  'openapi.naver.com': (3, 10),
+  'kauth.kakao.com': (3, 10),
+  'kapi.kakao.com': (3, 10),
+}
+# 호스트별 요청 속도 제한 (초당 요청 수, 최대 연속 요청 수) - FnGuide 는 기존 0.5초 간격과 같은 초당 2회
+HTTP_HOST_RATE_LIMITS = {
+  'comp.fnguide.com': (2.0, 4),
+  'apis.data.go.kr': (3.0, 3),  # 공휴일 API - 기존 0.3초 간격과 비슷한 초당 3회
+}
+# Signal.bz 정적 크롤링 HTML 파서 ('auto': selectolax -> lxml -> html.parser 중 설치된 것, HtmlBackend 참고)
+SIGNAL_HTML_PARSER = 'auto'
+# 검색어가 이 수 이상 모이면 남은 선택자는 조회하지 않음
+SIGNAL_ENOUGH_TERMS = 10
+
+# HTTP 녹화/재생 (외부 응답을 파일로 저장해 두고 오프라인에서 다시 사용 - HttpFixture 참고)
+#   None : 사용 안 함, 'record' : 실제로 요청하고 응답을 저장, 'replay' : 저장된 응답만 사용 (없으면 연결 오류)
+HTTP_FIXTURE_MODE = None
+HTTP_FIXTURE_FOLDER_PATH = './Data/Http_Fixtures'
+# 요청을 구분할 때 빼는 쿼리 파라미터 (캐시 방지 타임스탬프, API 키 - 저장 파일에도 남기지 않음)
+HTTP_FIXTURE_IGNORED_PARAMS = ('_', 'serviceKey')
+# 파싱 벤치마크(CrawlBenchmark)가 기본으로 녹화/재생하는 연도 (저장소에 포함된 응답이 이 연도)
+# 지난 연도여야 경제 캘린더 캐시가 오늘 날짜와 무관하게 1년 전체 한 구간으로 요청하므로 재생 모드에서 항상 같은 fixture 를 찾음
+HTTP_FIXTURE_BENCHMARK_YEAR = 2025
+# FnGuide 월별 동시 수집 수
+FNGUIDE_MAX_WORKERS = 4
+
+# 헤드리스 브라우저 풀 (실시간 검색어 동적 크롤링) - 최대 브라우저 수, 교체 기준(사용 횟수/초), 대기 시간(초)
+BROWSER_POOL_SIZE = 2
+BROWSER_MAX_USES = 50
+BROWSER_MAX_AGE_SECONDS = 1800
+BROWSER_ACQUIRE_TIMEOUT_SECONDS = 30
+BROWSER_PAGE_TIMEOUT_SECONDS = 10
+# 서버 시작 시 브라우저를 미리 띄워둘지 여부 (Chrome 이 없는 환경이면 False)
+BROWSER_POOL_WARM_ON_START = False
+
+# 실시간 검색어 백그라운드 수집 주기(초), 서버 시작 직후 첫 수집 대기(초), SSE 변경 확인 주기/연결 유지 주석 주기(초)
+REALTIME_SEARCH_POLL_SECONDS = 60
+REALTIME_SEARCH_FIRST_WAIT_SECONDS = 30
+REALTIME_SEARCH_SSE_CHECK_SECONDS = 1
+REALTIME_SEARCH_SSE_KEEPALIVE_SECONDS = 15
+
+# 비동기 크롤러 - 출처별 동시 요청 수, 엔드포인트별 전체 마감 시간(초), 클라이언트 연결 종료 확인 주기(초)
+ASYNC_CRAWL_CONCURRENCY = {
+  'fnguide': 4,
+  'zeroin': 2,
+  'holiday': 4,
+}
+ASYNC_CRAWL_DEADLINE_SECONDS = {
+  'stock_calendar': 60,
+  'economic_calendar': 40,
+  'korean_holidays': 40,
+  'realtime_search': 30,
+}
+ASYNC_CRAWL_DISCONNECT_CHECK_SECONDS = 0.5